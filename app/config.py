@@ -1,4 +1,44 @@
-import os
-
-USER_DATA = os.path.join(os.path.dirname(__file__), ".." ,"database", "users.json")
-PORT = 8000
\ No newline at end of file
+import os
+
+USER_DATA = os.path.join(os.path.dirname(__file__), ".." ,"database", "users.json")
+PORT = 8000
+
+# 사용자 일괄 등록/내보내기에서 한 번에 저장하거나 읽는 사용자 수, 한 요청의 최대 행 수
+USER_BULK_CHUNK_SIZE = int(os.getenv("USER_BULK_CHUNK_SIZE", "1000"))
+USER_BULK_MAX_ROWS = int(os.getenv("USER_BULK_MAX_ROWS", "50000"))
+
+# 사용자 API에서 비동기 SQLAlchemy 엔진/세션(AsyncUserService)을 사용할지 여부
+USER_ASYNC_DB = os.getenv("USER_ASYNC_DB", "0") == "1"
+
+# 비밀번호 해시: 알고리즘(scrypt 또는 pbkdf2_sha256)과 비용, 해시 전용 스레드 수
+PASSWORD_HASH_ALGORITHM = os.getenv("PASSWORD_HASH_ALGORITHM", "scrypt")
+PASSWORD_SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2 ** 14)))
+PASSWORD_SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+PASSWORD_SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "600000"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 일괄 등록 전용 해시 스레드 수. 로그인용 스레드와 따로 두어 대량 등록 중에도 로그인이 밀리지 않게 합니다.
+PASSWORD_BULK_HASH_WORKERS = int(os.getenv("PASSWORD_BULK_HASH_WORKERS", str(max(1, PASSWORD_HASH_WORKERS // 2))))
+
+# 사이트별 주관성 점수 IDF 모델 저장 위치
+MODEL_DIR = os.getenv("REVIEW_MODEL_DIR", os.path.join(os.path.dirname(__file__), "..", "database", "models"))
+
+# 리뷰 전처리 API가 한 번에 조회/저장하는 원본 문서 수
+PREPROCESS_BATCH_SIZE = int(os.getenv("PREPROCESS_BATCH_SIZE", "1000"))
+
+# 전체 사이트 전처리(POST /review/preprocess)에서 동시에 처리할 사이트 수
+PREPROCESS_SITE_PARALLELISM = int(os.getenv("PREPROCESS_SITE_PARALLELISM", "3"))
+
+# 백그라운드 전처리 작업: 동시에 실행할 작업 수와 대기열 크기 (초과 시 429)
+PREPROCESS_JOB_WORKERS = int(os.getenv("PREPROCESS_JOB_WORKERS", "2"))
+PREPROCESS_JOB_MAX_QUEUED = int(os.getenv("PREPROCESS_JOB_MAX_QUEUED", "8"))
+
+# 앱 시작 시 사이트별 전처리기를 미리 준비할지 여부
+PREWARM_PROCESSORS = os.getenv("PREWARM_PROCESSORS", "1") == "1"
+
+# 리뷰 API에서 비동기 MongoDB 드라이버(AsyncMongoClient)를 사용할지 여부
+REVIEW_ASYNC_MONGO = os.getenv("REVIEW_ASYNC_MONGO", "0") == "1"
+
+# 리뷰 조회 응답 캐시: 최대 항목 수와 유효 시간(초)
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
\ No newline at end of file
@@ -1,9 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import Depends
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database.mysql_connection import SessionLocal
+from typing import AsyncIterator
+from database.mysql_connection import SessionLocal, engine, get_async_engine, get_async_session_local
 from app.user.user_repository import UserRepository
+from app.user.async_user_repository import AsyncUserRepository
+from app.user.password_hasher import PasswordHasher
 from app.user.user_service import UserService
-from database.mongodb_connection import mongo_db
+from app.user.async_user_service import AsyncUserService
+from app.review.review_service import ReviewService
+from app.review.async_review_service import AsyncReviewService
+from app.review.review_jobs import JobManager
+from app.review.processor_pool import ProcessorPool
+from app.review.response_cache import ResponseCache
+from app.review.single_flight import SingleFlight
+from app.review.review_service import PROCESSOR_MAP
+from app.config import (
+    MODEL_DIR,
+    PASSWORD_BULK_HASH_WORKERS,
+    PASSWORD_HASH_ALGORITHM,
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_PBKDF2_ITERATIONS,
+    PASSWORD_SCRYPT_N,
+    PASSWORD_SCRYPT_P,
+    PASSWORD_SCRYPT_R,
+    PREPROCESS_JOB_MAX_QUEUED,
+    PREPROCESS_JOB_WORKERS,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL,
+    REVIEW_ASYNC_MONGO,
+    USER_ASYNC_DB,
+)
+from database.mongodb_connection import async_mongo_db, mongo_db
 
 def get_db() -> Session:
     db = SessionLocal()
@@ -12,12 +42,85 @@ def get_db() -> Session:
     finally:
         db.close()
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    db = get_async_session_local()()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+def get_db_engine() -> Engine:
+    # 비동기 모드에서는 비동기 엔진의 풀을 보여줍니다.
+    if USER_ASYNC_DB:
+        return get_async_engine().sync_engine
+    return engine
+
 def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
     return UserRepository(db)
 
+password_hasher = PasswordHasher(
+    algorithm=PASSWORD_HASH_ALGORITHM,
+    scrypt_n=PASSWORD_SCRYPT_N,
+    scrypt_r=PASSWORD_SCRYPT_R,
+    scrypt_p=PASSWORD_SCRYPT_P,
+    pbkdf2_iterations=PASSWORD_PBKDF2_ITERATIONS,
+)
+
+# 비밀번호 해시(로그인, 가입, 비밀번호 변경) 전용 스레드 풀. 몰려드는 로그인이 다른 API의 스레드 풀을 차지하지 않게 합니다.
+password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+# 일괄 등록의 비밀번호 해시는 별도의 작은 풀에서 실행해 로그인용 풀을 차지하지 않게 합니다.
+bulk_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_BULK_HASH_WORKERS, thread_name_prefix="password-bulk-hash")
+
+def get_password_executor() -> ThreadPoolExecutor:
+    return password_executor
+
 def get_user_service(repo: UserRepository = Depends(get_user_repository)) -> UserService:
-    return UserService(repo)
+    return UserService(repo, password_hasher, bulk_password_executor)
+
+def get_async_user_service(db: AsyncSession = Depends(get_async_db)) -> AsyncUserService:
+    return AsyncUserService(AsyncUserRepository(db), password_hasher, password_executor, bulk_password_executor)
+
+# USER_ASYNC_DB=1이면 사용자 API가 비동기 세션을 쓰는 AsyncUserService를 주입받습니다.
+user_service_dependency = get_async_user_service if USER_ASYNC_DB else get_user_service
 
 
 def get_mongo_db():
-    return mongo_db
\ No newline at end of file
+    return mongo_db
+
+
+def get_async_mongo_db():
+    return async_mongo_db
+
+
+processor_pool = ProcessorPool(PROCESSOR_MAP, MODEL_DIR)
+
+def get_processor_pool() -> ProcessorPool:
+    return processor_pool
+
+
+def get_review_service(
+    db=Depends(get_mongo_db),
+    async_db=Depends(get_async_mongo_db),
+    processors: ProcessorPool = Depends(get_processor_pool),
+) -> ReviewService | AsyncReviewService:
+    if REVIEW_ASYNC_MONGO:
+        return AsyncReviewService(async_db, processors)
+    return ReviewService(db, processors)
+
+
+job_manager = JobManager(max_workers=PREPROCESS_JOB_WORKERS, max_queued=PREPROCESS_JOB_MAX_QUEUED)
+
+def get_job_manager() -> JobManager:
+    return job_manager
+
+
+response_cache = ResponseCache(max_entries=RESPONSE_CACHE_SIZE, ttl_seconds=RESPONSE_CACHE_TTL)
+
+def get_response_cache() -> ResponseCache:
+    return response_cache
+
+
+preprocess_flights = SingleFlight()
+
+def get_preprocess_flights() -> SingleFlight:
+    return preprocess_flights
\ No newline at end of file
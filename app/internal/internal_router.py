@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.engine import Engine
+
+from app.dependencies import get_db_engine
+from database.pool_metrics import pool_stats
+
+# 운영 확인용 API입니다. 외부에 노출하지 않도록 OpenAPI 문서에서 제외합니다.
+router = APIRouter(prefix="/internal", tags=["internal"], include_in_schema=False)
+
+
+@router.get("/db-pool")
+def get_db_pool_stats(engine: Engine = Depends(get_db_engine)) -> Dict[str, Any]:
+    """
+    MySQL 커넥션 풀 상태를 반환합니다.
+
+    checked_out이 size + max_overflow에 가까워지거나 wait_p95_ms, timeouts가 늘면 풀이 부족한 것입니다.
+    """
+    return pool_stats(engine)
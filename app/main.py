@@ -1,15 +1,33 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 import os
 
 from app.user.user_router import user
-from app.config import PORT
+from app.config import PORT, PREWARM_PROCESSORS
+from app.dependencies import bulk_password_executor, job_manager, password_executor, processor_pool
+from database.mysql_connection import dispose_async_engine
 from app.review.review_router import router as review_router
+from app.internal.internal_router import router as internal_router
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 전처리기(NLTK, 어휘 사전, IDF 모델)를 시작 시 한 번 준비해 첫 요청이 느려지지 않게 합니다.
+    if PREWARM_PROCESSORS:
+        await run_in_threadpool(processor_pool.warm_up)
+    yield
+    job_manager.shutdown()
+    password_executor.shutdown(wait=False, cancel_futures=True)
+    bulk_password_executor.shutdown(wait=False, cancel_futures=True)
+    await dispose_async_engine()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(user)
 app.include_router(review_router)
+app.include_router(internal_router)
 static_path = os.path.join(os.path.dirname(__file__), "static")
 app.mount("/static", StaticFiles(directory=static_path), name="static")
 
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+import asyncio
+
+from app.review.processor_pool import ProcessorPool
+from app.review.review_query import (
+    EXPORT_BATCH_SIZE,
+    READ_INDEXES,
+    SORT_KEYS,
+    ReviewFilters,
+    page_query,
+    page_response,
+    projection_for,
+)
+from app.review.review_service import (
+    COLLECTION_MAP,
+    RAW_PROJECTION,
+    mark_preprocessed,
+    monthly_operations,
+    monthly_pipeline,
+    monthly_recompute_operations,
+    monthly_query,
+    monthly_row,
+    pending_query,
+    preprocess_result,
+    split_monthly_rollup,
+    transform_batch,
+    upsert_operations,
+)
+
+
+class AsyncReviewService:
+    """
+    ReviewService의 비동기 버전입니다. 비동기 MongoDB 드라이버(AsyncMongoClient)로 DB를 기다리는 동안
+    이벤트 루프를 양보하고, CPU를 쓰는 전처리(transform_batch)만 executor에서 실행합니다.
+    전처리 중에도 같은 이벤트 루프에서 조회 요청을 계속 처리할 수 있습니다.
+    """
+
+    def __init__(self, db, processors: ProcessorPool, executor: Optional[Executor] = None) -> None:
+        self.db = db
+        self.processors = processors
+        self.executor = executor
+
+    async def ensure_indexes(self, site_name: str) -> None:
+        """ReviewService.ensure_indexes와 같은 인덱스를 만듭니다."""
+        pre_col = self.db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
+        await pre_col.create_index("source_id", unique=True)
+        for keys in READ_INDEXES:
+            await pre_col.create_index(keys)
+
+    async def list_reviews(
+        self,
+        site_name: str,
+        filters: ReviewFilters,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """ReviewService.list_reviews와 같은 keyset 페이지 조회입니다."""
+        pre_col = self.db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
+        query = page_query(filters, cursor)
+        docs = await pre_col.find(query, projection=projection_for(fields)).sort(SORT_KEYS).limit(limit + 1).to_list(None)
+        return page_response(site_name, docs, limit)
+
+    async def monthly_summary(
+        self, site_name: str, month_from: Optional[str] = None, month_to: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """ReviewService.monthly_summary와 같은 월별 집계 조회입니다."""
+        monthly_col = self.db[f"MONTHLY_{COLLECTION_MAP[site_name]}"]
+        docs = await monthly_col.find(monthly_query(month_from, month_to)).sort("_id", 1).to_list(None)
+        return {"site": site_name, "months": [monthly_row(doc) for doc in docs]}
+
+    def export_batches(
+        self,
+        site_name: str,
+        filters: ReviewFilters,
+        fields: Optional[List[str]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """ReviewService.export_batches의 비동기 버전입니다. 배치를 async for로 읽습니다."""
+        projection = projection_for(fields)
+        pre_col = self.db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
+
+        async def batches() -> AsyncIterator[List[Dict[str, Any]]]:
+            cursor = pre_col.find(filters.to_query(), projection=projection).sort(SORT_KEYS).batch_size(batch_size)
+            batch: List[Dict[str, Any]] = []
+            async for doc in cursor:
+                batch.append(doc)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        return batches()
+
+    async def preprocess_site(
+        self,
+        site_name: str,
+        batch_size: int,
+        on_batch: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        ReviewService.preprocess_site와 같은 keyset 배치 전처리입니다.
+
+        조회와 저장은 이벤트 루프에서 기다리고, 배치 전처리는 executor에서 실행합니다.
+        """
+        raw_col = self.db[COLLECTION_MAP[site_name]]
+        pre_col = self.db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
+        monthly_col = self.db[f"MONTHLY_{COLLECTION_MAP[site_name]}"]
+        await self.ensure_indexes(site_name)
+
+        loop = asyncio.get_running_loop()
+        batches: List[Dict[str, int]] = []
+        last_id = None
+
+        async with self.processors.acquire_async(site_name) as processor:
+            while True:
+                cursor = raw_col.find(pending_query(last_id), projection=RAW_PROJECTION).sort("_id", 1).limit(batch_size)
+                docs = await cursor.to_list(None)
+                if not docs:
+                    break
+                last_id = docs[-1]["_id"]
+
+                df_out = await loop.run_in_executor(self.executor, partial(transform_batch, site_name, processor, docs))
+
+                inserted = updated = 0
+                if df_out is not None:
+                    now = datetime.now(timezone.utc)
+                    result = await pre_col.bulk_write(upsert_operations(df_out, now), ordered=False)
+                    inserted = result.upserted_count
+                    updated = result.matched_count
+                    # ReviewService와 같이 새 문서는 $inc로 더하고, 갱신된 문서가 있는 달만 다시 계산합니다.
+                    df_new, months = split_monthly_rollup(df_out, result.upserted_ids)
+                    operations = monthly_operations(df_new, now)
+                    if months:
+                        totals = await (await pre_col.aggregate(monthly_pipeline(months))).to_list(None)
+                        operations += monthly_recompute_operations(totals, now)
+                    if operations:
+                        await monthly_col.bulk_write(operations, ordered=False)
+                await raw_col.update_many(*mark_preprocessed([doc["_id"] for doc in docs]))
+
+                batch = {
+                    "batch": len(batches) + 1,
+                    "raw_fetched": len(docs),
+                    "processed_inserted": inserted,
+                    "processed_updated": updated,
+                }
+                batches.append(batch)
+                if on_batch is not None:
+                    on_batch(batch)
+
+        return preprocess_result(site_name, batches)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, Type
+import asyncio
+import os
+import threading
+
+from review_analysis.preprocessing.base_processor import BaseDataProcessor
+
+
+class ProcessorPool:
+    """
+    사이트별 전처리기 인스턴스를 한 번만 만들어 재사용하는 풀입니다.
+
+    전처리기는 요청마다 바뀌는 상태(df)와 누적 갱신되는 IDF 모델을 가지므로,
+    사이트마다 잠금을 두어 같은 사이트는 한 번에 한 요청만 사용하고 다른 사이트는 동시에 처리합니다.
+    """
+
+    def __init__(self, processor_map: Dict[str, Type[BaseDataProcessor]], model_dir: str) -> None:
+        self.model_dir = model_dir
+        self._processors: Dict[str, BaseDataProcessor] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        for site_name, processor_cls in processor_map.items():
+            processor = processor_cls("", "")
+            # 새로 들어온 문서만 처리하므로 사이트별 코퍼스 IDF 모델에 누적 갱신합니다.
+            processor.tfidf_model_path = os.path.join(model_dir, f"tfidf_{site_name}.json")
+            processor.tfidf_mode = "partial"
+            # API 배치는 작고 서버는 여러 스레드로 동작하므로, 배치마다 프로세스 풀을 띄우지(fork) 않고
+            # 현재 스레드에서 언어를 판별합니다. 병렬 판별은 CLI(review_analysis/preprocessing/main.py)에서만 사용합니다.
+            processor.lang_workers = 1
+            self._processors[site_name] = processor
+            self._locks[site_name] = threading.Lock()
+
+    def warm_up(self) -> None:
+        """
+        모든 사이트의 전처리기를 미리 준비합니다. 실패한 사이트는 첫 요청 때 다시 준비됩니다.
+        """
+        for site_name in self._processors:
+            with self.acquire(site_name) as processor:
+                try:
+                    processor.warm_up()
+                except Exception as e:
+                    print(f"[경고] {site_name} 전처리기 준비 실패: {type(e).__name__}: {e}")
+
+    @contextmanager
+    def acquire(self, site_name: str) -> Iterator[BaseDataProcessor]:
+        """사이트 전처리기를 독점적으로 빌려 씁니다."""
+        with self._locks[site_name]:
+            yield self._processors[site_name]
+
+    @asynccontextmanager
+    async def acquire_async(self, site_name: str) -> AsyncIterator[BaseDataProcessor]:
+        """
+        acquire의 비동기 버전입니다. 잠금 대기를 스레드에서 하므로 기다리는 동안 이벤트 루프를 막지 않습니다.
+        동기 acquire와 같은 잠금을 쓰므로 두 경로가 섞여도 사이트당 한 요청만 전처리기를 사용합니다.
+        """
+        lock = self._locks[site_name]
+        acquired = asyncio.get_running_loop().run_in_executor(None, lock.acquire)
+        try:
+            await asyncio.shield(acquired)
+        except asyncio.CancelledError:
+            # 기다리던 요청이 취소되어도 잠금은 결국 잡히므로, 잡히는 즉시 풀어 줍니다.
+            acquired.add_done_callback(lambda _: lock.release())
+            raise
+        try:
+            yield self._processors[site_name]
+        finally:
+            lock.release()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+import hashlib
+import threading
+import time
+import uuid
+
+
+class ResponseCache:
+    """
+    리뷰 조회 응답을 메모리에 보관하는 LRU + TTL 캐시입니다.
+
+    리뷰 데이터는 전처리가 저장할 때만 바뀌므로 사이트마다 버전 번호를 두고 저장 때마다 올립니다(bump).
+    캐시 키(ETag)에 버전이 들어가므로 버전이 오르면 이전 응답은 더 이상 조회되지 않고 LRU/TTL로 밀려납니다.
+    ETag에는 프로세스마다 다른 값이 섞여 있어 재시작 후 버전이 0부터 다시 시작해도 이전 ETag와 겹치지 않습니다.
+
+    버전은 프로세스 안에서만 관리되므로, 다른 프로세스가 쓴 변경은 ttl_seconds 안에 반영됩니다.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._instance = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, site: str) -> int:
+        with self._lock:
+            return self._versions.get(site, 0)
+
+    def bump(self, site: str) -> int:
+        """사이트 데이터가 바뀌었음을 기록하고 새 버전을 반환합니다."""
+        with self._lock:
+            self._versions[site] = self._versions.get(site, 0) + 1
+            return self._versions[site]
+
+    def etag(self, site: str, path: str, params: Iterable[Tuple[str, str]]) -> str:
+        """사이트 버전, 경로, (정렬한) 쿼리 파라미터로 강한 ETag를 만듭니다."""
+        request_key = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(params))
+        digest = hashlib.blake2b(request_key.encode("utf-8"), digest_size=8).hexdigest()
+        return f'"{self._instance}-{site}-{self.version(site)}-{digest}"'
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표로 구분된 목록 또는 *)에 etag가 포함되는지 확인합니다."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+import csv
+import io
+import json
+import zlib
+
+from app.review.review_query import READABLE_FIELDS, to_response
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Accept-Encoding에 gzip이 있고 q=0으로 거절되지 않았는지 확인합니다."""
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class ExportEncoder:
+    """
+    문서 배치를 NDJSON 또는 CSV 바이트로 바꾸고, 필요하면 gzip 스트림으로 압축합니다.
+    배치 단위로만 상태를 가지므로 전체 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+
+    def __init__(self, export_format: str, fields: Optional[List[str]] = None, compress: bool = False) -> None:
+        self.export_format = export_format
+        self.columns = ["_id"] + list(fields or READABLE_FIELDS)
+        # wbits=31: gzip 헤더/트레일러를 붙이는 zlib 스트림
+        self._compressor = zlib.compressobj(wbits=31) if compress else None
+        self._header_written = False
+
+    def encode(self, docs: List[Dict[str, Any]]) -> bytes:
+        if self.export_format == "csv":
+            data = self._encode_csv(docs)
+        else:
+            data = "".join(json.dumps(to_response(doc), default=_json_default) + "\n" for doc in docs).encode("utf-8")
+        return self._compressor.compress(data) if self._compressor else data
+
+    def finish(self) -> bytes:
+        if self.export_format == "csv" and not self._header_written:
+            # 결과가 없어도 CSV 헤더는 내보냅니다.
+            data = self._encode_csv([])
+            return self._compressor.compress(data) + self._compressor.flush() if self._compressor else data
+        return self._compressor.flush() if self._compressor else b""
+
+    def _encode_csv(self, docs: List[Dict[str, Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.columns, extrasaction="ignore")
+        if not self._header_written:
+            writer.writeheader()
+            self._header_written = True
+        for doc in docs:
+            writer.writerow({
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in to_response(doc).items()
+            })
+        return buffer.getvalue().encode("utf-8")
+
+
+def stream_export(batches: Iterable[List[Dict[str, Any]]], encoder: ExportEncoder) -> Iterator[bytes]:
+    for docs in batches:
+        chunk = encoder.encode(docs)
+        if chunk:
+            yield chunk
+    tail = encoder.finish()
+    if tail:
+        yield tail
+
+
+async def stream_export_async(batches: AsyncIterable[List[Dict[str, Any]]], encoder: ExportEncoder) -> AsyncIterator[bytes]:
+    async for docs in batches:
+        chunk = encoder.encode(docs)
+        if chunk:
+            yield chunk
+    tail = encoder.finish()
+    if tail:
+        yield tail
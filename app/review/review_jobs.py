@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+import threading
+import uuid
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+@dataclass
+class PreprocessJob:
+    site: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    state: str = QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    raw_fetched: int = 0
+    processed_inserted: int = 0
+    processed_updated: int = 0
+    batches: List[Dict[str, int]] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def record_batch(self, batch: Dict[str, int]) -> None:
+        self.batches.append(batch)
+        self.raw_fetched += batch["raw_fetched"]
+        self.processed_inserted += batch["processed_inserted"]
+        self.processed_updated += batch.get("processed_updated", 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        end = self.finished_at or datetime.now(timezone.utc)
+        elapsed = (end - self.started_at).total_seconds() if self.started_at else 0.0
+        return {
+            "job_id": self.id,
+            "site": self.site,
+            "state": self.state,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": elapsed,
+            "raw_fetched": self.raw_fetched,
+            "processed_inserted": self.processed_inserted,
+            "processed_updated": self.processed_updated,
+            "batches_done": len(self.batches),
+            "throughput_docs_per_sec": self.raw_fetched / elapsed if elapsed > 0 else 0.0,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """
+    리뷰 전처리를 HTTP 요청 밖에서 실행하는 작업 관리자입니다.
+
+    작업은 크기가 제한된 스레드 풀에서 실행되며, 실행 중이거나 대기 중인 작업 수가
+    max_workers + max_queued를 넘으면 JobQueueFull을 발생시킵니다.
+    완료된 작업은 최근 history_size개까지 조회할 수 있습니다.
+    """
+
+    def __init__(self, max_workers: int, max_queued: int, history_size: int = 1000) -> None:
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.history_size = history_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preprocess-job")
+        self._jobs: "OrderedDict[str, PreprocessJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def active_count(self) -> int:
+        with self._lock:
+            return self._active_count()
+
+    def submit(self, site: str, work: Callable[[Callable[[Dict[str, int]], None]], Any]) -> PreprocessJob:
+        """
+        작업을 대기열에 넣고 바로 반환합니다.
+
+        arg:
+            site: 사이트 이름
+            work: 배치 완료 콜백을 인자로 받아 전처리를 수행하는 함수
+
+        return:
+            PreprocessJob: 등록된 작업
+
+        raise:
+            JobQueueFull: 동시에 처리할 수 있는 작업 수를 넘은 경우
+        """
+        job = PreprocessJob(site=site)
+        with self._lock:
+            if self._active_count() >= self.max_workers + self.max_queued:
+                raise JobQueueFull("Too many preprocessing jobs in progress. Retry later.")
+            self._jobs[job.id] = job
+            self._evict_finished()
+
+        self._executor.submit(self._run, job, work)
+        return job
+
+    def get(self, job_id: str) -> Optional[PreprocessJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: PreprocessJob, work: Callable[[Callable[[Dict[str, int]], None]], Any]) -> None:
+        job.state = RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        try:
+            work(job.record_batch)
+            job.state = SUCCEEDED
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.state = FAILED
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+
+    def _active_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.state in (QUEUED, RUNNING))
+
+    def _evict_finished(self) -> None:
+        excess = len(self._jobs) - self.history_size
+        if excess <= 0:
+            return
+        for job_id in [j.id for j in self._jobs.values() if j.state in (SUCCEEDED, FAILED)][:excess]:
+            del self._jobs[job_id]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import json
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING, DESCENDING
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# 내보내기 시 한 번에 커서에서 읽어 직렬화하는 문서 수
+EXPORT_BATCH_SIZE = 1000
+
+# 조회 API에서 선택할 수 있는 전처리 결과 필드
+READABLE_FIELDS = (
+    "source_id",
+    "site",
+    "rating",
+    "date",
+    "year_month",
+    "language",
+    "comment",
+    "clean_comment",
+    "raw_word_count",
+    "clean_word_count",
+    "subjectivity_score",
+)
+
+# 최신순 정렬 키. date가 같은 문서는 _id로 순서를 고정해 페이지 경계가 흔들리지 않게 합니다.
+SORT_KEYS = [("date", DESCENDING), ("_id", DESCENDING)]
+
+# 필터 조합별 keyset 조회용 인덱스. 동등 조건 필드를 앞에 두고 정렬 키를 뒤에 둡니다.
+READ_INDEXES = [
+    SORT_KEYS,
+    [("language", ASCENDING)] + SORT_KEYS,
+    [("year_month", ASCENDING)] + SORT_KEYS,
+]
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclass
+class ReviewFilters:
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    rating_min: Optional[float] = None
+    rating_max: Optional[float] = None
+    language: Optional[str] = None
+    year_month: Optional[str] = None
+
+    def to_query(self) -> Dict[str, Any]:
+        """필터를 MongoDB 조회 조건으로 바꿉니다. date_to는 포함하지 않는 상한입니다."""
+        query: Dict[str, Any] = {}
+        date_range: Dict[str, Any] = {}
+        if self.date_from is not None:
+            date_range["$gte"] = self.date_from
+        if self.date_to is not None:
+            date_range["$lt"] = self.date_to
+        if date_range:
+            query["date"] = date_range
+
+        rating_range: Dict[str, Any] = {}
+        if self.rating_min is not None:
+            rating_range["$gte"] = self.rating_min
+        if self.rating_max is not None:
+            rating_range["$lte"] = self.rating_max
+        if rating_range:
+            query["rating"] = rating_range
+
+        if self.language is not None:
+            query["language"] = self.language
+        if self.year_month is not None:
+            query["year_month"] = self.year_month
+        return query
+
+
+def encode_cursor(doc: Dict[str, Any]) -> str:
+    """페이지 마지막 문서의 (date, _id)를 URL에 넣을 수 있는 문자열로 만듭니다."""
+    payload = json.dumps({"date": doc["date"].isoformat(), "id": str(doc["_id"])})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(payload["date"]), ObjectId(payload["id"])
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise InvalidCursor("Invalid cursor.") from e
+
+
+def after_cursor(cursor: str) -> Dict[str, Any]:
+    """커서 문서 다음(더 오래된) 문서만 남기는 조건을 만듭니다."""
+    date, last_id = decode_cursor(cursor)
+    return {"$or": [{"date": {"$lt": date}}, {"date": date, "_id": {"$lt": last_id}}]}
+
+
+def page_query(filters: ReviewFilters, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """필터 조건에 커서 조건을 더한 페이지 조회 조건을 만듭니다."""
+    query = filters.to_query()
+    if cursor:
+        query = {"$and": [query, after_cursor(cursor)]} if query else after_cursor(cursor)
+    return query
+
+
+def page_response(site_name: str, docs: List[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+    """limit + 1건까지 읽은 문서로 응답을 만듭니다. 초과분이 있으면 다음 페이지 커서를 붙입니다."""
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    return {
+        "site": site_name,
+        "count": len(docs),
+        "items": [to_response(doc) for doc in docs],
+        "next_cursor": encode_cursor(docs[-1]) if has_more else None,
+    }
+
+
+def projection_for(fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+    """
+    요청한 필드만 가져오는 projection을 만듭니다. 커서를 만들기 위해 date와 _id는 항상 포함합니다.
+
+    raise:
+        ValueError: 선택할 수 없는 필드가 포함된 경우
+    """
+    if not fields:
+        return None
+    unknown = [f for f in fields if f not in READABLE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    projection = {field: 1 for field in fields}
+    projection["date"] = 1
+    return projection
+
+
+def to_response(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """ObjectId를 문자열로 바꿔 JSON으로 응답할 수 있게 합니다."""
+    return {key: str(value) if isinstance(value, ObjectId) else value for key, value in doc.items()}
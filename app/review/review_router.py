@@ -1,107 +1,287 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException
-import pandas as pd
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+import asyncio
+import inspect
+import time
 
-from app.dependencies import get_mongo_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 
-
-from review_analysis.preprocessing.imdb_processor import IMDbProcessor
-from review_analysis.preprocessing.letterboxd_processor import LetterboxdProcessor
-from review_analysis.preprocessing.rottentomatoes_processor import RottenTomatoesProcessor
+from app.config import PREPROCESS_BATCH_SIZE, PREPROCESS_SITE_PARALLELISM
+from app.dependencies import get_job_manager, get_preprocess_flights, get_response_cache, get_review_service
+from app.review.response_cache import ResponseCache, etag_matches
+from app.review.review_export import EXPORT_MEDIA_TYPES, ExportEncoder, accepts_gzip, stream_export, stream_export_async
+from app.review.review_jobs import JobManager, JobQueueFull
+from app.review.review_query import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ReviewFilters
+from app.review.async_review_service import AsyncReviewService
+from app.review.review_service import PROCESSOR_MAP, ReviewService
+from app.review.single_flight import SingleFlight
 
 router = APIRouter(prefix="/review", tags=["review"])
 
-PROCESSOR_MAP = {
-    "imdb": IMDbProcessor,
-    "letterboxd": LetterboxdProcessor,
-    "rottentomatoes": RottenTomatoesProcessor,
-}
-
-COLLECTION_MAP = {
-        "imdb": "REVIEW_imdb",
-        "letterboxd": "REVIEW_letterboxd",
-        "rottentomatoes": "REVIEW_rottentomatoes", 
-}
 
-@router.post("/preprocess/{site_name}")
-def preprocess_site(site_name: str, db=Depends(get_mongo_db)):
+def normalize_site(site_name: str) -> str:
     site_name = site_name.lower().strip()
     if site_name not in PROCESSOR_MAP:
         raise HTTPException(
             status_code=400,
             detail="site_name must be one of: imdb, letterboxd, rottentomatoes",
         )
+    return site_name
+
+
+def review_filters(
+    date_from: Optional[datetime] = Query(None, description="이 시각 이후(포함) 리뷰"),
+    date_to: Optional[datetime] = Query(None, description="이 시각 이전(미포함) 리뷰"),
+    rating_min: Optional[float] = Query(None),
+    rating_max: Optional[float] = Query(None),
+    language: Optional[str] = Query(None),
+    year_month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+) -> ReviewFilters:
+    return ReviewFilters(date_from, date_to, rating_min, rating_max, language, year_month)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """쉼표로 구분한 fields 파라미터를 목록으로 바꿉니다."""
+    return [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+
+
+async def call_service(method: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    비동기 서비스 메서드는 그대로 기다리고, 동기 서비스 메서드는 스레드 풀에서 실행합니다.
+    설정(REVIEW_ASYNC_MONGO)에 따라 주입되는 서비스가 달라도 라우터 코드는 같습니다.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(method, *args, **kwargs)
+
+
+def invalidating(
+    cache: ResponseCache, site_name: str, on_batch: Optional[Callable[[Dict[str, int]], None]] = None
+) -> Callable[[Dict[str, int]], None]:
+    """배치가 저장될 때마다 사이트 캐시 버전을 올리는 배치 콜백을 만듭니다."""
+    def callback(batch: Dict[str, int]) -> None:
+        cache.bump(site_name)
+        if on_batch is not None:
+            on_batch(batch)
+
+    return callback
+
+
+def background_work(
+    service: ReviewService | AsyncReviewService,
+    flights: SingleFlight,
+    site_name: str,
+    batch_size: int,
+    cache: ResponseCache,
+) -> Callable[[Callable[[Dict[str, int]], None]], Dict[str, Any]]:
+    """
+    작업 관리자 스레드에서 실행할 전처리 함수를 만듭니다.
+
+    동기 요청(run_preprocess)과 같은 사이트별 SingleFlight를 거치도록 요청을 받은 이벤트 루프에서 실행하고,
+    작업 스레드는 결과를 기다립니다. 같은 사이트가 이미 전처리 중이면 그 실행에 합류하므로 배치 진행률은
+    먼저 시작한 실행만 기록합니다.
+    """
+    loop = asyncio.get_running_loop()
+
+    def work(on_batch: Callable[[Dict[str, int]], None]) -> Dict[str, Any]:
+        flight = flights.run(
+            site_name,
+            lambda: call_service(service.preprocess_site, site_name, batch_size, invalidating(cache, site_name, on_batch)),
+        )
+        result, _ = asyncio.run_coroutine_threadsafe(flight, loop).result()
+        return result
+
+    return work
 
-    raw_col = db[COLLECTION_MAP[site_name]]
-    pre_col = db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
-   
-    print("DEBUG DB:", db.name)
-    print("DEBUG RAW COL:", raw_col.name, "COUNT:", raw_col.count_documents({}))
-
-    docs = list(raw_col.find({"preprocessed": {"$ne": True}}))
-
-    if not docs:
-        return {
-            "status": "success",
-            "site": site_name,
-            "raw_fetched": 0,
-            "processed_inserted": 0,
-            "message": "No new documents to preprocess.",
-        }
-
-    
-    df_raw = pd.DataFrame(docs)
-    source_ids = df_raw["_id"].tolist()
-    df_for_proc = df_raw.drop(columns=["_id"], errors="ignore")
-
-    
-    processor_cls = PROCESSOR_MAP[site_name]
-    processor = processor_cls(input_path="", output_path="") 
-    processor.preprocess(df=df_for_proc)
-    processor.feature_engineering()
-
-    df_out = processor.df
-    if df_out is None or df_out.empty:
-        return {
-            "status": "success",
-            "site": site_name,
-            "raw_fetched": len(docs),
-            "processed_inserted": 0,
-            "message": "Preprocess finished but produced empty result.",
-        }
-
-   
-    df_out = df_out.copy()
-
-   
-    if "year_month" in df_out.columns:
-        df_out["year_month"] = df_out["year_month"].astype(str)
-
-  
-    if "date" in df_out.columns:
-        df_out["date"] = pd.to_datetime(df_out["date"], errors="coerce").dt.to_pydatetime()
-
-  
-    df_out["source_id"] = source_ids[: len(df_out)]
-    df_out["site"] = site_name
-    df_out["created_at"] = datetime.now(timezone.utc)
-
-    records = df_out.to_dict("records")
-
-
-    result = pre_col.insert_many(records)
-
-
-    raw_col.update_many(
-        {"_id": {"$in": source_ids}},
-        {"$set": {"preprocessed": True, "preprocessed_at": datetime.now(timezone.utc)}},
+
+async def cached_json(
+    request: Request, cache: ResponseCache, site_name: str, compute: Callable[[], Awaitable[Any]]
+) -> Response:
+    """
+    사이트 캐시 버전으로 만든 ETag의 본문이 캐시에 있으면 저장된 본문을, If-None-Match까지 같으면 304를 반환합니다.
+    캐시에 없으면(TTL 만료 포함) compute()로 응답을 만들어 캐시에 넣습니다.
+
+    버전은 이 프로세스가 저장할 때만 오르므로, 다른 프로세스가 쓴 변경은 TTL이 지나야 반영됩니다.
+    그래서 ETag만 같고 캐시 항목이 만료되었으면 304 대신 새로 계산한 본문을 보냅니다.
+    """
+    etag = cache.etag(site_name, request.url.path, request.query_params.multi_items())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    body = cache.get(etag)
+    if body is not None and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if body is None:
+        body = JSONResponse(jsonable_encoder(await compute())).body
+        cache.set(etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def run_preprocess(
+    service: ReviewService | AsyncReviewService,
+    flights: SingleFlight,
+    cache: ResponseCache,
+    site_name: str,
+    batch_size: int,
+) -> Dict[str, Any]:
+    """
+    사이트 전처리를 실행합니다. 같은 사이트가 이미 실행 중이면 그 실행에 합류(merged)해 결과를 함께 받습니다.
+    """
+    started = time.perf_counter()
+    result, merged = await flights.run(
+        site_name, lambda: call_service(service.preprocess_site, site_name, batch_size, invalidating(cache, site_name))
     )
+    return {**result, "merged": merged, "elapsed_seconds": time.perf_counter() - started}
+
 
+@router.post("/preprocess")
+async def preprocess_all(
+    batch_size: int = Query(PREPROCESS_BATCH_SIZE, ge=1, le=10_000),
+    parallelism: int = Query(PREPROCESS_SITE_PARALLELISM, ge=1, le=len(PROCESSOR_MAP), description="동시에 전처리할 사이트 수"),
+    service: ReviewService | AsyncReviewService = Depends(get_review_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    flights: SingleFlight = Depends(get_preprocess_flights),
+):
+    """
+    모든 사이트를 최대 parallelism개씩 동시에 전처리하고 사이트별 결과와 소요 시간을 반환합니다.
+    한 사이트가 실패해도 나머지 사이트는 계속 처리합니다.
+    """
+    semaphore = asyncio.Semaphore(parallelism)
+
+    async def run_site(site_name: str) -> Dict[str, Any]:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                return await run_preprocess(service, flights, cache, site_name, batch_size)
+            except Exception as e:
+                return {
+                    "status": "failed",
+                    "site": site_name,
+                    "error": f"{type(e).__name__}: {e}",
+                    "elapsed_seconds": time.perf_counter() - started,
+                }
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run_site(site_name) for site_name in PROCESSOR_MAP))
+    failed = [r["site"] for r in results if r["status"] == "failed"]
     return {
-        "status": "success",
-        "site": site_name,
-        "raw_fetched": len(docs),
-        "processed_inserted": len(result.inserted_ids),
+        "status": "failed" if len(failed) == len(results) else "partial" if failed else "success",
+        "parallelism": parallelism,
+        "elapsed_seconds": time.perf_counter() - started,
+        "sites": {r["site"]: r for r in results},
     }
+
+
+@router.post("/preprocess/{site_name}")
+async def preprocess_site(
+    site_name: str,
+    batch_size: int = Query(PREPROCESS_BATCH_SIZE, ge=1, le=10_000),
+    background: bool = Query(False, description="True이면 작업 ID를 바로 반환하고 백그라운드에서 처리합니다."),
+    service: ReviewService | AsyncReviewService = Depends(get_review_service),
+    jobs: JobManager = Depends(get_job_manager),
+    cache: ResponseCache = Depends(get_response_cache),
+    flights: SingleFlight = Depends(get_preprocess_flights),
+):
+    site_name = normalize_site(site_name)
+
+    if not background:
+        return await run_preprocess(service, flights, cache, site_name, batch_size)
+
+    try:
+        job = jobs.submit(site_name, background_work(service, flights, site_name, batch_size, cache))
+    except JobQueueFull as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={"status": "accepted", "site": site_name, "job_id": job.id, "status_url": f"/review/jobs/{job.id}"},
+    )
+
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str, jobs: JobManager = Depends(get_job_manager)):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not Found.")
+    return job.to_dict()
+
+
+@router.get("/{site_name}/monthly")
+async def monthly_summary(
+    request: Request,
+    site_name: str,
+    month_from: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$", description="이 달부터 (YYYY-MM)"),
+    month_to: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$", description="이 달까지 (YYYY-MM)"),
+    service: ReviewService | AsyncReviewService = Depends(get_review_service),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    site_name = normalize_site(site_name)
+    return await cached_json(
+        request, cache, site_name, lambda: call_service(service.monthly_summary, site_name, month_from, month_to)
+    )
+
+
+@router.get("/{site_name}/export")
+async def export_reviews(
+    request: Request,
+    site_name: str,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    filters: ReviewFilters = Depends(review_filters),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 내보낼 필드, 예: rating,date,comment"),
+    service: ReviewService | AsyncReviewService = Depends(get_review_service),
+):
+    """
+    조건에 맞는 전처리 리뷰 전체를 NDJSON 또는 CSV로 스트리밍합니다.
+    클라이언트가 gzip을 받으면 압축해서 보냅니다.
+    """
+    site_name = normalize_site(site_name)
+    field_list = parse_fields(fields)
+    try:
+        batches = service.export_batches(site_name, filters, field_list)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    compress = accepts_gzip(request.headers.get("accept-encoding"))
+    encoder = ExportEncoder(export_format, field_list, compress=compress)
+    body: Iterator[bytes] | AsyncIterator[bytes]
+    if isinstance(batches, AsyncIterator):
+        body = stream_export_async(batches, encoder)
+    else:
+        # 동기 이터레이터는 StreamingResponse가 스레드 풀에서 읽습니다.
+        body = stream_export(batches, encoder)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{site_name}_reviews.{export_format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[export_format], headers=headers)
+
+
+@router.get("/{site_name}")
+async def list_reviews(
+    request: Request,
+    site_name: str,
+    filters: ReviewFilters = Depends(review_filters),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="직전 응답의 next_cursor"),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 응답 필드, 예: rating,date,comment"),
+    service: ReviewService | AsyncReviewService = Depends(get_review_service),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    site_name = normalize_site(site_name)
+    field_list = parse_fields(fields)
+
+    async def compute():
+        try:
+            return await call_service(service.list_reviews, site_name, filters, limit, cursor=cursor, fields=field_list)
+        except ValueError as e:
+            # 잘못된 커서(InvalidCursor)나 선택할 수 없는 필드
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await cached_json(request, cache, site_name, compute)
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import pandas as pd
+from pymongo import UpdateOne
+
+from app.review.processor_pool import ProcessorPool
+from app.review.review_query import (
+    EXPORT_BATCH_SIZE,
+    READ_INDEXES,
+    SORT_KEYS,
+    ReviewFilters,
+    page_query,
+    page_response,
+    projection_for,
+)
+
+from review_analysis.preprocessing.base_processor import BaseDataProcessor
+from review_analysis.preprocessing.imdb_processor import IMDbProcessor
+from review_analysis.preprocessing.letterboxd_processor import LetterboxdProcessor
+from review_analysis.preprocessing.rottentomatoes_processor import RottenTomatoesProcessor
+
+PROCESSOR_MAP = {
+    "imdb": IMDbProcessor,
+    "letterboxd": LetterboxdProcessor,
+    "rottentomatoes": RottenTomatoesProcessor,
+}
+
+COLLECTION_MAP = {
+        "imdb": "REVIEW_imdb",
+        "letterboxd": "REVIEW_letterboxd",
+        "rottentomatoes": "REVIEW_rottentomatoes",
+}
+
+# 전처리에 필요한 원본 필드만 가져옵니다. (Letterboxd는 본문이 content 필드)
+RAW_PROJECTION = {"_id": 1, "rating": 1, "date": 1, "comment": 1, "content": 1}
+
+PENDING_FILTER = {"preprocessed": {"$ne": True}}
+
+
+def pending_query(last_id: Any = None) -> Dict[str, Any]:
+    """아직 전처리되지 않은 원본 문서 중 last_id 다음 문서를 찾는 조건입니다."""
+    query = dict(PENDING_FILTER)
+    if last_id is not None:
+        query["_id"] = {"$gt": last_id}
+    return query
+
+
+def transform_batch(site_name: str, processor: BaseDataProcessor, docs: List[dict]) -> Optional[pd.DataFrame]:
+    """
+    원본 문서 한 배치를 전처리해 저장할 형태의 DataFrame으로 만듭니다. (CPU 작업, DB 접근 없음)
+
+    원본 _id를 source_id 컬럼으로 전처리기에 함께 넘기므로 필터링된 행이 있어도 각 결과 행은 자기 원본을 가리킵니다.
+
+    return:
+        전처리 결과. 모든 행이 걸러졌으면 None
+    """
+    df_for_proc = pd.DataFrame(docs).rename(columns={"_id": "source_id"})
+
+    processor.preprocess(df=df_for_proc)
+    processor.feature_engineering()
+
+    df_out = processor.df
+    if df_out is None or df_out.empty:
+        return None
+    df_out = df_out.copy()
+
+    if "year_month" in df_out.columns:
+        df_out["year_month"] = df_out["year_month"].astype(str)
+
+    if "date" in df_out.columns:
+        df_out["date"] = pd.to_datetime(df_out["date"], errors="coerce").dt.to_pydatetime()
+
+    df_out["site"] = site_name
+    return df_out
+
+
+def upsert_operations(df_out: pd.DataFrame, now: datetime) -> List[UpdateOne]:
+    """
+    source_id 기준 upsert 목록을 만듭니다. 원본 표시 전에 중단되어 같은 배치를 다시 처리해도
+    기존 문서를 덮어쓸 뿐 중복이 생기지 않습니다.
+    """
+    return [
+        UpdateOne(
+            {"source_id": record["source_id"]},
+            {"$set": {**record, "updated_at": now}, "$setOnInsert": {"created_at": now}},
+            upsert=True,
+        )
+        for record in df_out.to_dict("records")
+    ]
+
+
+def split_monthly_rollup(df_out: pd.DataFrame, upserted_ids: Dict[int, Any]) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    월별 집계 반영 방법을 나눕니다.
+
+    새로 추가된 문서(upserted_ids의 위치)는 $inc로 더합니다. upsert를 다시 실행하면 이미 있는 문서는 갱신으로 잡혀
+    upserted_ids에 다시 나오지 않으므로 두 번 더해지지 않습니다. 갱신된 문서가 있는 달은 집계 저장 전에 중단된
+    배치의 재처리일 수 있으므로 전처리 컬렉션에서 다시 계산합니다. 이 달에 새로 추가된 문서도 재계산에 포함되므로
+    $inc에서는 뺍니다.
+
+    return:
+        ($inc로 더할 새 문서, 다시 계산할 year_month 목록)
+    """
+    upserted = df_out.index.isin(df_out.index[sorted(upserted_ids)])
+    months = sorted(df_out.loc[~upserted, "year_month"].unique())
+    df_new = df_out[upserted]
+    return df_new[~df_new["year_month"].isin(months)], months
+
+
+def monthly_operations(df_new: pd.DataFrame, now: datetime) -> List[UpdateOne]:
+    """새로 저장된 전처리 문서를 year_month별로 묶어 월별 집계에 $inc로 더하는 upsert 목록을 만듭니다."""
+    monthly = df_new.groupby("year_month").agg(
+        count=("rating", "size"),
+        rating_sum=("rating", "sum"),
+        subjectivity_sum=("subjectivity_score", "sum"),
+    )
+    return [
+        UpdateOne(
+            {"_id": year_month},
+            {
+                "$inc": {
+                    "count": int(row["count"]),
+                    "rating_sum": float(row["rating_sum"]),
+                    "subjectivity_sum": float(row["subjectivity_sum"]),
+                },
+                "$set": {"updated_at": now},
+            },
+            upsert=True,
+        )
+        for year_month, row in monthly.iterrows()
+    ]
+
+
+def monthly_pipeline(months: List[str]) -> List[Dict[str, Any]]:
+    """months 달의 리뷰 수와 평점/주관성 점수 합계를 전처리 컬렉션에서 다시 계산하는 집계 파이프라인입니다."""
+    return [
+        {"$match": {"year_month": {"$in": months}}},
+        {
+            "$group": {
+                "_id": "$year_month",
+                "count": {"$sum": 1},
+                "rating_sum": {"$sum": "$rating"},
+                "subjectivity_sum": {"$sum": "$subjectivity_score"},
+            }
+        },
+    ]
+
+
+def monthly_recompute_operations(totals: List[Dict[str, Any]], now: datetime) -> List[UpdateOne]:
+    """monthly_pipeline으로 다시 계산한 달별 합계로 월별 집계를 덮어쓰는 upsert 목록을 만듭니다."""
+    return [
+        UpdateOne(
+            {"_id": total["_id"]},
+            {
+                "$set": {
+                    "count": int(total["count"]),
+                    "rating_sum": float(total["rating_sum"]),
+                    "subjectivity_sum": float(total["subjectivity_sum"]),
+                    "updated_at": now,
+                },
+            },
+            upsert=True,
+        )
+        for total in totals
+    ]
+
+
+def mark_preprocessed(source_ids: List[Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """배치의 원본 문서를 전처리 완료로 표시하는 (조건, 변경) 쌍입니다."""
+    return {"_id": {"$in": source_ids}}, {"$set": {"preprocessed": True, "preprocessed_at": datetime.now(timezone.utc)}}
+
+
+def monthly_query(month_from: Optional[str], month_to: Optional[str]) -> Dict[str, Any]:
+    query: Dict[str, Any] = {}
+    if month_from is not None:
+        query.setdefault("_id", {})["$gte"] = month_from
+    if month_to is not None:
+        query.setdefault("_id", {})["$lte"] = month_to
+    return query
+
+
+def monthly_row(doc: Dict[str, Any]) -> Dict[str, Any]:
+    count = doc["count"]
+    return {
+        "year_month": doc["_id"],
+        "count": count,
+        "avg_rating": doc["rating_sum"] / count if count else None,
+        "avg_subjectivity_score": doc["subjectivity_sum"] / count if count else None,
+    }
+
+
+def preprocess_result(site_name: str, batches: List[Dict[str, int]]) -> Dict[str, Any]:
+    """배치별 처리 건수를 합쳐 전처리 응답을 만듭니다."""
+    raw_fetched = sum(b["raw_fetched"] for b in batches)
+    processed_inserted = sum(b["processed_inserted"] for b in batches)
+    processed_updated = sum(b["processed_updated"] for b in batches)
+
+    result: Dict[str, Any] = {
+        "status": "success",
+        "site": site_name,
+        "raw_fetched": raw_fetched,
+        "processed_inserted": processed_inserted,
+        "processed_updated": processed_updated,
+        "batches": batches,
+    }
+    if raw_fetched == 0:
+        result["message"] = "No new documents to preprocess."
+    elif processed_inserted == 0 and processed_updated == 0:
+        result["message"] = "Preprocess finished but produced empty result."
+    return result
+
+
+class ReviewService:
+    def __init__(self, db, processors: ProcessorPool) -> None:
+        self.db = db
+        self.processors = processors
+
+    def ensure_indexes(self, site_name: str) -> None:
+        """
+        전처리 컬렉션의 인덱스를 만듭니다. 이미 있으면 아무 일도 하지 않습니다.
+
+        원본 문서당 전처리 문서는 하나뿐이므로 source_id는 unique로 두어, 재시도해도 upsert로 중복이 생기지 않습니다.
+        나머지는 조회 API의 필터와 (date, _id) 정렬을 인덱스만으로 처리하기 위한 복합 인덱스입니다.
+        """
+        pre_col = self.db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
+        pre_col.create_index("source_id", unique=True)
+        for keys in READ_INDEXES:
+            pre_col.create_index(keys)
+
+    def list_reviews(
+        self,
+        site_name: str,
+        filters: ReviewFilters,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        전처리된 리뷰를 최신순으로 한 페이지 조회합니다.
+
+        skip 대신 직전 페이지 마지막 문서의 (date, _id) 뒤부터 읽으므로(keyset) 몇 번째 페이지든 비용이 같습니다.
+
+        arg:
+            site_name: imdb, letterboxd, rottentomatoes 중 하나
+            filters: 날짜/평점 범위, 언어, year_month 조건
+            limit: 페이지 크기
+            cursor: 직전 응답의 next_cursor (첫 페이지는 None)
+            fields: 응답에 포함할 필드 (None이면 전체)
+
+        return:
+            dict: 리뷰 목록(items)과 다음 페이지 커서(next_cursor, 마지막 페이지면 None)
+
+        raise:
+            InvalidCursor: 커서를 해석할 수 없는 경우
+            ValueError: 선택할 수 없는 필드가 포함된 경우
+        """
+        pre_col = self.db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
+        query = page_query(filters, cursor)
+        # 다음 페이지가 있는지 알기 위해 한 건 더 읽습니다.
+        docs = list(pre_col.find(query, projection=projection_for(fields)).sort(SORT_KEYS).limit(limit + 1))
+        return page_response(site_name, docs, limit)
+
+    def export_batches(
+        self,
+        site_name: str,
+        filters: ReviewFilters,
+        fields: Optional[List[str]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        조건에 맞는 전처리 리뷰 전체를 조회 API와 같은 순서로 batch_size개씩 내보냅니다.
+
+        하나의 커서를 끝까지 읽으면서 배치만 메모리에 두므로 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+
+        raise:
+            ValueError: 선택할 수 없는 필드가 포함된 경우 (첫 배치를 요청하기 전에 확인합니다)
+        """
+        projection = projection_for(fields)
+        pre_col = self.db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
+
+        def batches() -> Iterator[List[Dict[str, Any]]]:
+            cursor = pre_col.find(filters.to_query(), projection=projection).sort(SORT_KEYS).batch_size(batch_size)
+            batch: List[Dict[str, Any]] = []
+            for doc in cursor:
+                batch.append(doc)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        return batches()
+
+    def preprocess_site(
+        self,
+        site_name: str,
+        batch_size: int,
+        on_batch: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        아직 전처리되지 않은 원본 리뷰를 batch_size개씩 읽어 전처리하고 저장합니다.
+
+        배치마다 _id 순으로 다음 batch_size개만 조회하므로(keyset) 대기 문서가 아무리 많아도
+        메모리에는 한 배치만 올라가고, 오래 열린 커서가 만료될 일도 없습니다.
+
+        arg:
+            site_name: imdb, letterboxd, rottentomatoes 중 하나
+            batch_size: 한 번에 조회/전처리/저장할 원본 문서 수
+            on_batch: 배치가 끝날 때마다 배치별 처리 건수를 받는 콜백 (백그라운드 작업 진행률 표시용)
+
+        return:
+            dict: 전체 합계(raw_fetched, processed_inserted, processed_updated)와 배치별 처리 건수(batches)
+        """
+        raw_col = self.db[COLLECTION_MAP[site_name]]
+        self.ensure_indexes(site_name)
+
+        batches: List[Dict[str, int]] = []
+        last_id = None
+
+        with self.processors.acquire(site_name) as processor:
+            while True:
+                query = pending_query(last_id)
+                docs = list(raw_col.find(query, projection=RAW_PROJECTION).sort("_id", 1).limit(batch_size))
+                if not docs:
+                    break
+                last_id = docs[-1]["_id"]
+
+                inserted, updated = self._preprocess_batch(site_name, processor, docs)
+                batch = {
+                    "batch": len(batches) + 1,
+                    "raw_fetched": len(docs),
+                    "processed_inserted": inserted,
+                    "processed_updated": updated,
+                }
+                batches.append(batch)
+                if on_batch is not None:
+                    on_batch(batch)
+
+        return preprocess_result(site_name, batches)
+
+    def monthly_summary(
+        self, site_name: str, month_from: Optional[str] = None, month_to: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        월별 집계 컬렉션에서 월별 리뷰 수, 평균 평점, 평균 주관성 점수를 조회합니다.
+
+        집계는 전처리 시점에 배치마다 누적되므로 리뷰 수가 아닌 월 수만큼만 읽습니다.
+
+        arg:
+            site_name: imdb, letterboxd, rottentomatoes 중 하나
+            month_from: 이 달부터 (YYYY-MM, 포함)
+            month_to: 이 달까지 (YYYY-MM, 포함)
+
+        return:
+            dict: year_month 오름차순 월별 집계(months)
+        """
+        docs = self.db[f"MONTHLY_{COLLECTION_MAP[site_name]}"].find(monthly_query(month_from, month_to)).sort("_id", 1)
+        return {"site": site_name, "months": [monthly_row(doc) for doc in docs]}
+
+    def _preprocess_batch(self, site_name: str, processor: BaseDataProcessor, docs: List[dict]) -> Tuple[int, int]:
+        """
+        원본 문서 한 배치를 전처리해 저장하고, 배치의 원본 문서를 전처리 완료로 표시합니다.
+
+        return:
+            (새로 추가된 문서 수, 이미 있어 갱신된 문서 수)
+        """
+        df_out = transform_batch(site_name, processor, docs)
+        inserted = updated = 0
+        if df_out is not None:
+            now = datetime.now(timezone.utc)
+            pre_col = self.db[f"PREPROCESSED_{COLLECTION_MAP[site_name]}"]
+            result = pre_col.bulk_write(upsert_operations(df_out, now), ordered=False)
+            inserted = result.upserted_count
+            updated = result.matched_count
+
+            # 새 문서는 배치 크기만큼만 $inc로 더하고, 재처리로 갱신된 문서가 있는 달만 다시 계산합니다.
+            df_new, months = split_monthly_rollup(df_out, result.upserted_ids)
+            operations = monthly_operations(df_new, now)
+            if months:
+                operations += monthly_recompute_operations(list(pre_col.aggregate(monthly_pipeline(months))), now)
+            if operations:
+                self.db[f"MONTHLY_{COLLECTION_MAP[site_name]}"].bulk_write(operations, ordered=False)
+
+        # 결과가 비어 있는 배치(모두 필터링됨)도 다시 조회되지 않도록 완료로 표시합니다.
+        self.db[COLLECTION_MAP[site_name]].update_many(*mark_preprocessed([doc["_id"] for doc in docs]))
+        return inserted, updated
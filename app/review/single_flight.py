@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, Tuple
+import asyncio
+
+
+class SingleFlight:
+    """
+    같은 키의 작업이 이미 실행 중이면 새로 시작하지 않고 그 결과를 함께 기다리게 합니다.
+
+    같은 사이트 전처리가 동시에 요청되면 한 번만 실행해 같은 대기 문서를 두 번 처리하지 않습니다.
+    기다리던 요청 하나가 취소되어도 공유 중인 실행은 취소되지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._in_flight
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        return:
+            (결과, 이미 실행 중이던 작업에 합류했는지 여부)
+        """
+        future = self._in_flight.get(key)
+        merged = future is not None
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future), merged
@@ -0,0 +1,134 @@
+from typing import AsyncIterator, List, Optional, Set, cast
+from sqlalchemy import CursorResult, bindparam, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.user.user_repository import UPDATE_PASSWORD_SQL, requested_emails
+from app.user.user_schema import User
+
+
+class AsyncUserRepository:
+    """
+    UserRepository의 비동기 버전입니다. AsyncSession으로 DB 응답을 기다리는 동안 이벤트 루프를 양보하므로
+    스레드 풀 크기와 관계없이 한 워커가 여러 요청을 동시에 처리할 수 있습니다.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        result = await self.db.execute(
+            text("SELECT email, password, username FROM users WHERE email=:e"),
+            {"e": email},
+        )
+        row = result.fetchone()
+
+        if row is None:
+            return None
+        return User(email=row[0], password=row[1], username=row[2])
+
+    async def create_user(self, user: User) -> Optional[User]:
+        """
+        같은 이메일이 없을 때만 사용자를 추가합니다.
+
+        return:
+            추가된 사용자. 이미 같은 이메일이 있으면 None
+        """
+        try:
+            await self.db.execute(
+                text("INSERT INTO users (email, password, username) VALUES (:e,:p,:u)"),
+                {"e": user.email, "p": user.password, "u": user.username},
+            )
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            return None
+        return user
+
+    async def update_password(self, email: str, password: str, username: Optional[str] = None) -> Optional[User]:
+        """
+        UserRepository.update_password와 같이 username을 알거나 RETURNING을 지원하면 UPDATE 한 번으로 비밀번호를 바꿉니다.
+
+        return:
+            변경된 사용자. 사용자가 없으면 None
+        """
+        params = {"e": email, "p": password}
+        if username is None and self.db.get_bind().dialect.update_returning:
+            row = (await self.db.execute(text(UPDATE_PASSWORD_SQL + " RETURNING email, password, username"), params)).fetchone()
+            if row is None:
+                await self.db.rollback()
+                return None
+            await self.db.commit()
+            return User(email=row[0], password=row[1], username=row[2])
+
+        # UPDATE 문의 결과는 CursorResult라서 변경된 행 수(rowcount)를 알 수 있습니다.
+        result = cast(CursorResult, await self.db.execute(text(UPDATE_PASSWORD_SQL), params))
+        if result.rowcount == 0:
+            await self.db.rollback()
+            return None
+
+        if username is not None:
+            user: Optional[User] = User(email=email, password=password, username=username)
+        else:
+            user = await self.get_user_by_email(email)
+        await self.db.commit()
+        return user
+
+    async def delete_user(self, user: User) -> User:
+        await self.db.execute(
+            text("DELETE FROM users WHERE email=:e"),
+            {"e": user.email},
+        )
+        await self.db.commit()
+        return user
+
+    async def bulk_create_users(self, users: List[User], chunk_size: int) -> Set[str]:
+        """
+        UserRepository.bulk_create_users와 같이 청크마다 기존 이메일을 조회한 뒤 executemany INSERT로 추가합니다.
+
+        return:
+            이미 있어서 추가하지 않은 이메일 (요청에 적힌 표기)
+        """
+        existing: Set[str] = set()
+        select_existing = text("SELECT email FROM users WHERE email IN :emails").bindparams(
+            bindparam("emails", expanding=True)
+        )
+        for start in range(0, len(users), chunk_size):
+            chunk = users[start:start + chunk_size]
+            result = await self.db.execute(select_existing, {"emails": [u.email for u in chunk]})
+            found = requested_emails(chunk, (row[0] for row in result))
+            new_users = [u for u in chunk if u.email not in found]
+            if new_users:
+                try:
+                    await self.db.execute(
+                        text("INSERT INTO users (email, password, username) VALUES (:e,:p,:u)"),
+                        [{"e": u.email, "p": u.password, "u": u.username} for u in new_users],
+                    )
+                    await self.db.commit()
+                except IntegrityError:
+                    await self.db.rollback()
+                    for u in new_users:
+                        if await self.create_user(u) is None:
+                            found.add(u.email)
+            existing.update(found)
+        return existing
+
+    async def iter_users(self, batch_size: int) -> AsyncIterator[List[User]]:
+        """
+        모든 사용자를 이메일 순으로 batch_size명씩 읽습니다.
+
+        UserRepository.iter_users와 같이 StreamingResponse가 다 읽거나 중단하면 세션을 직접 닫습니다.
+        """
+        last_email = ""
+        try:
+            while True:
+                result = await self.db.execute(
+                    text("SELECT email, password, username FROM users WHERE email > :last ORDER BY email LIMIT :n"),
+                    {"last": last_email, "n": batch_size},
+                )
+                rows = result.fetchall()
+                if not rows:
+                    return
+                yield [User(email=row[0], password=row[1], username=row[2]) for row in rows]
+                last_email = rows[-1][0]
+        finally:
+            await self.db.close()
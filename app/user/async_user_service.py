@@ -0,0 +1,93 @@
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, List, Optional
+import asyncio
+from app.config import USER_BULK_CHUNK_SIZE
+from app.user.async_user_repository import AsyncUserRepository
+from app.user.password_hasher import PasswordHasher
+from app.user.user_schema import BulkUserResult, User, UserLogin, UserUpdate
+from app.user.user_service import bulk_result, plain_password_indices, users_ndjson, validate_users, with_passwords
+
+
+class AsyncUserService:
+    """
+    UserService의 비동기 버전입니다. DB 요청은 AsyncUserRepository로 이벤트 루프에서 기다리고,
+    CPU를 쓰는 비밀번호 해시/검증만 executor에서 실행합니다. 일괄 등록의 해시는 bulk_executor에서 실행해
+    로그인용 executor를 차지하지 않습니다. 오류는 UserService와 같은 ValueError로 알립니다.
+    """
+
+    def __init__(
+        self,
+        repo: AsyncUserRepository,
+        hasher: Optional[PasswordHasher] = None,
+        executor: Optional[Executor] = None,
+        bulk_executor: Optional[Executor] = None,
+    ) -> None:
+        self.repo = repo
+        self.hasher = hasher or PasswordHasher()
+        self.executor = executor
+        self.bulk_executor = bulk_executor
+
+    async def login(self, user_login: UserLogin) -> User:
+        """UserService.login과 같이 인증하고, 필요하면 현재 설정으로 비밀번호를 다시 해시해 저장합니다."""
+        user = await self.repo.get_user_by_email(user_login.email)
+
+        if user is None:
+            raise ValueError("User not Found.")
+
+        if not await self._run(self.hasher.verify, user_login.password, user.password):
+            raise ValueError("Invalid ID/PW")
+
+        if self.hasher.needs_rehash(user.password):
+            hashed = await self._run(self.hasher.hash, user_login.password)
+            user = await self.repo.update_password(user.email, hashed, username=user.username) or user
+
+        return user
+
+    async def register_user(self, new_user: User) -> User:
+        hashed = await self._run(self.hasher.hash, new_user.password)
+        created_user = await self.repo.create_user(new_user.model_copy(update={"password": hashed}))
+
+        if created_user is None:
+            raise ValueError("User already Exists.")
+
+        return created_user
+
+    async def delete_user(self, email: str) -> User:
+        user = await self.repo.get_user_by_email(email)
+
+        if user is None:
+            raise ValueError("User not Found.")
+
+        return await self.repo.delete_user(user)
+
+    async def update_user_pwd(self, user_update: UserUpdate) -> User:
+        hashed = await self._run(self.hasher.hash, user_update.new_password)
+        updated_user = await self.repo.update_password(user_update.email, hashed)
+
+        if updated_user is None:
+            raise ValueError("User not Found.")
+
+        return updated_user
+
+    async def bulk_register(
+        self, rows: List[Any], chunk_size: int = USER_BULK_CHUNK_SIZE, keep_hashed: bool = False
+    ) -> BulkUserResult:
+        """UserService.bulk_register와 같은 규칙으로 여러 사용자를 등록합니다."""
+        unique, first_index, conflicts = validate_users(rows)
+
+        plain = plain_password_indices(self.hasher, unique, keep_hashed)
+        loop = asyncio.get_running_loop()
+        hashed = await asyncio.gather(
+            *(loop.run_in_executor(self.bulk_executor, self.hasher.hash, unique[i].password) for i in plain)
+        )
+        existing = await self.repo.bulk_create_users(with_passwords(unique, plain, hashed), chunk_size)
+        return bulk_result(rows, first_index, conflicts, existing)
+
+    async def export_users(self, batch_size: int = USER_BULK_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """모든 사용자를 NDJSON으로 batch_size명씩 내보냅니다."""
+        async for users in self.repo.iter_users(batch_size):
+            yield users_ndjson(users)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(func, *args))
@@ -0,0 +1,50 @@
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from typing import Any, List
+
+# Project root 추가하여 실행 시 파일 경로 문제 해결
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from app.config import USER_DATA
+
+
+def read_user_file(path: str) -> List[Any]:
+    """
+    사용자 파일을 읽어 사용자 정보 목록으로 바꿉니다.
+
+    사용자 목록([{email, password, username}, ...])과 이메일을 키로 하는 객체({email: {password, username}}) 형식을 모두 받습니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return [{"email": email, **fields} for email, fields in data.items()]
+    return data
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Bulk-register users from a JSON file.")
+    parser.add_argument("path", nargs="?", default=USER_DATA, help="User JSON file. Default: database/users.json")
+    parser.add_argument(
+        "--keep-hashed",
+        action="store_true",
+        help="Store passwords that are already hashed as-is (restoring a trusted backup). Default: hash every password.",
+    )
+    args = parser.parse_args()
+
+    from database.mysql_connection import SessionLocal
+    from app.user.user_repository import UserRepository
+    from app.user.user_service import UserService
+
+    session = SessionLocal()
+    try:
+        result = UserService(UserRepository(session)).bulk_register(read_user_file(args.path), keep_hashed=args.keep_hashed)
+    finally:
+        session.close()
+
+    print(f"[정보] {result.received}명 중 {result.inserted}명 등록")
+    for conflict in result.conflicts:
+        print(f"[경고] {conflict.index}번째 행 ({conflict.email}): {conflict.reason}")
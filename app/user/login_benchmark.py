@@ -0,0 +1,80 @@
+import json
+import os
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+# Project root 추가하여 실행 시 파일 경로 문제 해결
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from app.user.password_hasher import PBKDF2, SCRYPT, PasswordHasher
+
+DEFAULT_COSTS = {
+    SCRYPT: [2 ** 12, 2 ** 13, 2 ** 14, 2 ** 15],
+    PBKDF2: [100_000, 300_000, 600_000],
+}
+
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser(description="Measure login (password verify) throughput per hashing cost.")
+    parser.add_argument('-a', '--algorithm', default=SCRYPT, choices=[SCRYPT, PBKDF2])
+    parser.add_argument('-c', '--costs', nargs='+', type=int, default=None,
+                        help="scrypt n values or pbkdf2 iterations. Default: a few common settings")
+    parser.add_argument('-w', '--workers', nargs='+', type=int, default=[1, os.cpu_count() or 1],
+                        help="Hash executor sizes to try. Default: 1 and CPU count")
+    parser.add_argument('-n', '--logins', type=int, default=50, help="Logins per measurement.")
+    parser.add_argument('-o', '--output', type=str, default=None, help="Write results as JSON to this file.")
+    return parser
+
+
+def measure(hasher: PasswordHasher, workers: int, logins: int) -> Dict[str, float]:
+    """
+    전용 executor에서 비밀번호 검증(로그인 1회의 CPU 비용)을 logins번 실행해 처리량과 지연 시간을 잽니다.
+    """
+    encoded = hasher.hash("benchmark-password")
+    latencies: List[float] = []
+
+    def login() -> None:
+        started = time.perf_counter()
+        hasher.verify("benchmark-password", encoded)
+        latencies.append(time.perf_counter() - started)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        started = time.perf_counter()
+        list(executor.map(lambda _: login(), range(logins)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "logins_per_sec": logins / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def run_benchmark(algorithm: str, costs: List[int], workers: List[int], logins: int) -> List[Dict[str, Any]]:
+    results = []
+    for cost in costs:
+        if algorithm == SCRYPT:
+            hasher = PasswordHasher(algorithm=SCRYPT, scrypt_n=cost)
+        else:
+            hasher = PasswordHasher(algorithm=PBKDF2, pbkdf2_iterations=cost)
+        for n_workers in workers:
+            result = {"algorithm": algorithm, "cost": cost, "workers": n_workers, **measure(hasher, n_workers, logins)}
+            results.append(result)
+            print(f"[정보] {algorithm} cost={cost} workers={n_workers}: "
+                  f"{result['logins_per_sec']:.1f} logins/s, p50 {result['p50_ms']:.1f}ms, p95 {result['p95_ms']:.1f}ms")
+    return results
+
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    results = run_benchmark(args.algorithm, args.costs or DEFAULT_COSTS[args.algorithm], args.workers, args.logins)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Optional
+import base64
+import hashlib
+import hmac
+import secrets
+
+SCRYPT = "scrypt"
+PBKDF2 = "pbkdf2_sha256"
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+class PasswordHasher:
+    """
+    표준 라이브러리 KDF(scrypt, PBKDF2-SHA256)로 비밀번호를 해시하고 검증합니다.
+
+    해시 문자열에 알고리즘과 비용 값을 함께 저장하므로(예: scrypt$16384$8$1$salt$hash),
+    비용 설정을 바꿔도 기존 해시를 검증할 수 있고 needs_rehash로 다시 해시할 대상을 알 수 있습니다.
+    형식을 알 수 없는 값은 이전에 저장된 평문 비밀번호로 보고 비교합니다.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = SCRYPT,
+        scrypt_n: int = 2 ** 14,
+        scrypt_r: int = 8,
+        scrypt_p: int = 1,
+        pbkdf2_iterations: int = 600_000,
+        salt_size: int = 16,
+        key_size: int = 32,
+    ) -> None:
+        if algorithm not in (SCRYPT, PBKDF2):
+            raise ValueError(f"Unknown password hash algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.scrypt_n = scrypt_n
+        self.scrypt_r = scrypt_r
+        self.scrypt_p = scrypt_p
+        self.pbkdf2_iterations = pbkdf2_iterations
+        self.salt_size = salt_size
+        self.key_size = key_size
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(self.salt_size)
+        if self.algorithm == SCRYPT:
+            params = (self.scrypt_n, self.scrypt_r, self.scrypt_p)
+            key = self._scrypt(password, salt, *params)
+            return "$".join([SCRYPT, *map(str, params), _b64encode(salt), _b64encode(key)])
+        key = self._pbkdf2(password, salt, self.pbkdf2_iterations)
+        return "$".join([PBKDF2, str(self.pbkdf2_iterations), _b64encode(salt), _b64encode(key)])
+
+    def verify(self, password: str, encoded: str) -> bool:
+        parts = self._parse(encoded)
+        if parts is None:
+            # 해시 도입 전 평문으로 저장된 비밀번호
+            return hmac.compare_digest(password.encode("utf-8"), encoded.encode("utf-8"))
+
+        algorithm, params, salt, expected = parts
+        if algorithm == SCRYPT:
+            n, r, p = params
+            key = self._scrypt(password, salt, n, r, p, key_size=len(expected))
+        else:
+            key = self._pbkdf2(password, salt, params[0], key_size=len(expected))
+        return hmac.compare_digest(key, expected)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """평문이거나 현재 알고리즘/비용 설정과 다르게 만든 해시이면 True입니다."""
+        parts = self._parse(encoded)
+        if parts is None:
+            return True
+        algorithm, params, salt, key = parts
+        if algorithm != self.algorithm or len(key) != self.key_size:
+            return True
+        if algorithm == SCRYPT:
+            return params != (self.scrypt_n, self.scrypt_r, self.scrypt_p)
+        return params != (self.pbkdf2_iterations,)
+
+    @staticmethod
+    def is_hashed(encoded: str) -> bool:
+        return PasswordHasher._parse(encoded) is not None
+
+    @staticmethod
+    def _parse(encoded: str) -> Optional[tuple]:
+        fields = encoded.split("$")
+        try:
+            if fields[0] == SCRYPT and len(fields) == 6:
+                params = tuple(int(v) for v in fields[1:4])
+                return SCRYPT, params, _b64decode(fields[4]), _b64decode(fields[5])
+            if fields[0] == PBKDF2 and len(fields) == 4:
+                return PBKDF2, (int(fields[1]),), _b64decode(fields[2]), _b64decode(fields[3])
+        except ValueError:
+            return None
+        return None
+
+    def _scrypt(self, password: str, salt: bytes, n: int, r: int, p: int, key_size: Optional[int] = None) -> bytes:
+        # scrypt 메모리 사용량(128 * n * r * p 바이트)에 여유를 두어 maxmem을 지정합니다.
+        maxmem = 128 * n * r * (p + 1) + 1024 * 1024
+        return hashlib.scrypt(
+            password.encode("utf-8"), salt=salt, n=n, r=r, p=p, maxmem=maxmem, dklen=key_size or self.key_size
+        )
+
+    def _pbkdf2(self, password: str, salt: bytes, iterations: int, key_size: Optional[int] = None) -> bytes:
+        return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations, dklen=key_size or self.key_size)
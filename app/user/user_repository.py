@@ -1,7 +1,28 @@
 from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from typing import Dict, Iterable, Iterator, List, Optional, Set, cast
 from app.user.user_schema import User
-from sqlalchemy import text
+from sqlalchemy import CursorResult, bindparam, text
+
+UPDATE_PASSWORD_SQL = "UPDATE users SET password=:p WHERE email=:e"
+
+
+def requested_emails(chunk: List[User], found: Iterable[str]) -> Set[str]:
+    """
+    DB가 돌려준 기존 이메일을 요청에 적힌 이메일로 바꿉니다.
+
+    MySQL 기본 collation처럼 대소문자를 구분하지 않으면 요청의 a@x.com에 대해 DB의 A@x.com이 조회되므로,
+    정확히 같은 이메일이 요청에 없을 때는 대소문자를 무시하고 요청 쪽 이메일에 맞춥니다.
+    """
+    emails = {u.email for u in chunk}
+    by_casefold: Dict[str, Set[str]] = {}
+    for email in emails:
+        by_casefold.setdefault(email.casefold(), set()).add(email)
+
+    matched: Set[str] = set()
+    for email in found:
+        matched.update({email} if email in emails else by_casefold.get(email.casefold(), set()))
+    return matched
 
 class UserRepository:
     def __init__(self, db:Session) -> None:
@@ -17,23 +38,56 @@ class UserRepository:
             return None
         return User(email=row[0], password=row[1], username=row[2])
 
-    def save_user(self, user: User) -> User: 
-        exists = self.db.execute(
-            text("SELECT 1 FROM users WHERE email=:e"),
-            {"e": user.email},
-        ).fetchone()
+    def create_user(self, user: User) -> Optional[User]:
+        """
+        같은 이메일이 없을 때만 사용자를 추가합니다.
 
-        if exists:
-            self.db.execute(
-                text("UPDATE users SET password=:p, username=:u WHERE email=:e"),
-                {"e": user.email, "p": user.password, "u": user.username},
-            )
-        else:
+        존재 여부를 미리 조회하지 않고 INSERT의 기본 키 중복 오류로 판단합니다.
+
+        return:
+            추가된 사용자. 이미 같은 이메일이 있으면 None
+        """
+        try:
             self.db.execute(
                 text("INSERT INTO users (email, password, username) VALUES (:e,:p,:u)"),
                 {"e": user.email, "p": user.password, "u": user.username},
             )
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return None
+        return user
 
+    def update_password(self, email: str, password: str, username: Optional[str] = None) -> Optional[User]:
+        """
+        비밀번호만 바꿉니다. 변경된 행이 없으면 사용자가 없는 것으로 보고 None을 반환합니다.
+
+        username을 알고 있으면(로그인 시 재해시) 반환할 사용자를 직접 만들어 UPDATE 한 번으로 끝냅니다.
+        모르면 UPDATE ... RETURNING을 지원하는 DB(SQLite, PostgreSQL 등)는 한 문장으로 처리하고,
+        지원하지 않는 MySQL만 같은 트랜잭션에서 다시 조회합니다.
+
+        return:
+            변경된 사용자. 사용자가 없으면 None
+        """
+        params = {"e": email, "p": password}
+        if username is None and self.db.get_bind().dialect.update_returning:
+            row = self.db.execute(text(UPDATE_PASSWORD_SQL + " RETURNING email, password, username"), params).fetchone()
+            if row is None:
+                self.db.rollback()
+                return None
+            self.db.commit()
+            return User(email=row[0], password=row[1], username=row[2])
+
+        # UPDATE 문의 결과는 CursorResult라서 변경된 행 수(rowcount)를 알 수 있습니다.
+        result = cast(CursorResult, self.db.execute(text(UPDATE_PASSWORD_SQL), params))
+        if result.rowcount == 0:
+            self.db.rollback()
+            return None
+
+        if username is not None:
+            user: Optional[User] = User(email=email, password=password, username=username)
+        else:
+            user = self.get_user_by_email(email)
         self.db.commit()
         return user
 
@@ -43,4 +97,57 @@ class UserRepository:
             {"e": user.email},
         )
         self.db.commit()
-        return user
\ No newline at end of file
+        return user
+
+    def bulk_create_users(self, users: List[User], chunk_size: int) -> Set[str]:
+        """
+        사용자를 chunk_size명씩 한 번의 executemany INSERT로 추가합니다. 이미 있는 이메일은 건너뜁니다.
+
+        청크마다 기존 이메일을 한 번에 조회한 뒤 나머지를 추가합니다. 조회 이후 다른 요청이 같은 이메일을
+        먼저 추가해 중복 키 오류가 나면, 그 청크만 한 명씩 다시 추가해 충돌한 이메일을 가려냅니다.
+
+        return:
+            이미 있어서 추가하지 않은 이메일 (DB에 저장된 표기가 아니라 요청에 적힌 표기)
+        """
+        existing: Set[str] = set()
+        select_existing = text("SELECT email FROM users WHERE email IN :emails").bindparams(
+            bindparam("emails", expanding=True)
+        )
+        for start in range(0, len(users), chunk_size):
+            chunk = users[start:start + chunk_size]
+            rows = self.db.execute(select_existing, {"emails": [u.email for u in chunk]})
+            found = requested_emails(chunk, (row[0] for row in rows))
+            new_users = [u for u in chunk if u.email not in found]
+            if new_users:
+                try:
+                    self.db.execute(
+                        text("INSERT INTO users (email, password, username) VALUES (:e,:p,:u)"),
+                        [{"e": u.email, "p": u.password, "u": u.username} for u in new_users],
+                    )
+                    self.db.commit()
+                except IntegrityError:
+                    self.db.rollback()
+                    found.update(u.email for u in new_users if self.create_user(u) is None)
+            existing.update(found)
+        return existing
+
+    def iter_users(self, batch_size: int) -> Iterator[List[User]]:
+        """
+        모든 사용자를 이메일 순으로 batch_size명씩 읽습니다. (OFFSET 없이 마지막 이메일 다음부터 조회)
+
+        StreamingResponse는 요청 의존성 정리(세션 close) 이후에 본문을 읽으므로,
+        다 읽거나 중단되면 이 제너레이터가 세션의 연결을 직접 반환합니다.
+        """
+        last_email = ""
+        try:
+            while True:
+                rows = self.db.execute(
+                    text("SELECT email, password, username FROM users WHERE email > :last ORDER BY email LIMIT :n"),
+                    {"last": last_email, "n": batch_size},
+                ).fetchall()
+                if not rows:
+                    return
+                yield [User(email=row[0], password=row[1], username=row[2]) for row in rows]
+                last_email = rows[-1][0]
+        finally:
+            self.db.close()
\ No newline at end of file
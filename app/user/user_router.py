@@ -1,23 +1,50 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from app.user.user_schema import User, UserLogin, UserUpdate, UserDeleteRequest
+import asyncio
+import inspect
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, List, Optional
+from fastapi import APIRouter, Body, HTTPException, Depends, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from app.config import USER_BULK_MAX_ROWS
+from app.user.user_schema import BulkUserResult, User, UserLogin, UserUpdate, UserDeleteRequest
 from app.user.user_service import UserService
-from app.dependencies import get_user_service
+from app.user.async_user_service import AsyncUserService
+from app.dependencies import get_password_executor, user_service_dependency
 from app.responses.base_response import BaseResponse
 
 user = APIRouter(prefix="/api/user")
 
 
+async def run_on(executor: Optional[Executor], func: Callable[..., Any], *args) -> Any:
+    # 비동기 서비스(USER_ASYNC_DB=1)의 메서드는 이벤트 루프에서 바로 기다립니다. (해시는 서비스가 executor에서 실행)
+    if inspect.iscoroutinefunction(func):
+        return await func(*args)
+    # 비밀번호 해시가 들어가는 요청은 전용 스레드 풀에서 실행해 기본 스레드 풀을 붙잡지 않습니다.
+    if executor is None:
+        return await run_in_threadpool(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args))
+
+
 @user.post("/login", response_model=BaseResponse[User], status_code=status.HTTP_200_OK)
-def login_user(user_login: UserLogin, service: UserService = Depends(get_user_service)) -> BaseResponse[User]:
+async def login_user(
+    user_login: UserLogin,
+    service: UserService | AsyncUserService = Depends(user_service_dependency),
+    executor: Executor = Depends(get_password_executor),
+) -> BaseResponse[User]:
     try:
-        user = service.login(user_login)
+        user = await run_on(executor, service.login, user_login)
         return BaseResponse(status="success", data=user, message="Login Success.") 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @user.post("/register", response_model=BaseResponse[User], status_code=status.HTTP_201_CREATED)
-def register_user(user: User, service: UserService = Depends(get_user_service)) -> BaseResponse[User]:
+async def register_user(
+    user: User,
+    service: UserService | AsyncUserService = Depends(user_service_dependency),
+    executor: Executor = Depends(get_password_executor),
+) -> BaseResponse[User]:
     """
     Register a new user.
 
@@ -33,14 +60,14 @@ def register_user(user: User, service: UserService = Depends(get_user_service))
     """
     ## TODO
     try:
-        new_user = service.register_user(user)
+        new_user = await run_on(executor, service.register_user, user)
         return BaseResponse(status="success", data=new_user, message="User registration success.")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @user.delete("/delete", response_model=BaseResponse[User], status_code=status.HTTP_200_OK)
-def delete_user(user_delete_request: UserDeleteRequest, service: UserService = Depends(get_user_service)) -> BaseResponse[User]:
+async def delete_user(user_delete_request: UserDeleteRequest, service: UserService | AsyncUserService = Depends(user_service_dependency)) -> BaseResponse[User]:
     """
     Delete an existing user.
 
@@ -56,14 +83,18 @@ def delete_user(user_delete_request: UserDeleteRequest, service: UserService = D
     """
     ## TODO
     try:
-        user = service.delete_user(user_delete_request.email)
+        user = await run_on(None, service.delete_user, user_delete_request.email)
         return BaseResponse(status="success", data=user, message="User Deletion Success.")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @user.put("/update-password", response_model=BaseResponse[User], status_code=status.HTTP_200_OK)
-def update_user_password(user_update: UserUpdate, service: UserService = Depends(get_user_service)) -> BaseResponse[User]:
+async def update_user_password(
+    user_update: UserUpdate,
+    service: UserService | AsyncUserService = Depends(user_service_dependency),
+    executor: Executor = Depends(get_password_executor),
+) -> BaseResponse[User]:
     """
     Update a user's password.
 
@@ -79,7 +110,52 @@ def update_user_password(user_update: UserUpdate, service: UserService = Depends
     """
     ## TODO
     try:
-        user = service.update_user_pwd(user_update)
+        user = await run_on(executor, service.update_user_pwd, user_update)
         return BaseResponse(status="success", data=user, message="User password update success.")
     except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@user.post("/bulk", response_model=BaseResponse[BulkUserResult], status_code=status.HTTP_200_OK)
+async def bulk_register_users(rows: List[Any] = Body(...), service: UserService | AsyncUserService = Depends(user_service_dependency)) -> BaseResponse[BulkUserResult]:
+    """
+    Register many users in one request.
+
+    The whole list is validated at once and valid rows are inserted in chunks.
+    Rows that are invalid, repeat an email within the request, or use an email
+    that is already registered are skipped and reported as conflicts by index.
+    
+    :param rows: List of user objects (email, password, username).
+    :type rows: list
+    :param service: User service dependency.
+    :type service: UserService
+    :return: A response containing the number of inserted users and per-row conflicts.
+    :rtype: Any
+    """
+    if len(rows) > USER_BULK_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {USER_BULK_MAX_ROWS} users per request.")
+
+    result = await run_on(None, service.bulk_register, rows)
+    return BaseResponse(status="success", data=result, message=f"{result.inserted} of {result.received} users registered.")
+
+
+@user.get("/export", status_code=status.HTTP_200_OK)
+def export_users(service: UserService | AsyncUserService = Depends(user_service_dependency)) -> StreamingResponse:
+    """
+    Export all users as newline-delimited JSON.
+
+    Users are read in email order in fixed-size batches and streamed,
+    so memory use does not grow with the number of users.
+    Each line holds only the email and username; passwords and their
+    hashes are never exported.
+    
+    :param service: User service dependency.
+    :type service: UserService
+    :return: A streaming NDJSON response with one user (without password) per line.
+    :rtype: StreamingResponse
+    """
+    return StreamingResponse(
+        service.export_users(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="users.ndjson"'},
+    )
\ No newline at end of file
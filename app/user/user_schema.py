@@ -1,10 +1,16 @@
 from pydantic import BaseModel, EmailStr
+from typing import List, Optional
 
 class User(BaseModel):
     email: EmailStr
     password: str
     username: str
 
+class UserExport(BaseModel):
+    # 내보내기 응답에는 비밀번호(해시 또는 해시 전 평문)를 넣지 않습니다.
+    email: EmailStr
+    username: str
+
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
@@ -19,3 +25,12 @@ class UserDeleteRequest(BaseModel):
 class MessageResponse(BaseModel):
     message: str
 
+class UserConflict(BaseModel):
+    index: int
+    email: Optional[str] = None
+    reason: str
+
+class BulkUserResult(BaseModel):
+    received: int
+    inserted: int
+    conflicts: List[UserConflict]
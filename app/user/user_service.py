@@ -1,9 +1,96 @@
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from pydantic import TypeAdapter, ValidationError
+from app.config import USER_BULK_CHUNK_SIZE
+from app.user.password_hasher import PasswordHasher
 from app.user.user_repository import UserRepository
-from app.user.user_schema import User, UserLogin, UserUpdate
+from app.user.user_schema import BulkUserResult, User, UserConflict, UserExport, UserLogin, UserUpdate
+
+USERS_ADAPTER = TypeAdapter(List[User])
+
+
+def validate_users(rows: List[Any]) -> Tuple[List[User], Dict[str, int], Dict[int, UserConflict]]:
+    """
+    일괄 등록할 행을 한 번에 검증하고 요청 안의 중복 이메일을 걸러냅니다.
+
+    return:
+        (등록할 사용자, 이메일별 처음 나온 행 번호, 행 번호별 충돌 사유)
+    """
+    conflicts: Dict[int, UserConflict] = {}
+    try:
+        users = list(enumerate(USERS_ADAPTER.validate_python(rows)))
+    except ValidationError as e:
+        for error in e.errors():
+            # 목록 검증 오류의 loc 첫 항목은 행 번호입니다.
+            index = int(error["loc"][0])
+            if index not in conflicts:
+                email = rows[index].get("email") if isinstance(rows[index], dict) else None
+                conflicts[index] = UserConflict(index=index, email=email, reason=f"invalid: {error['msg']}")
+        valid = [i for i in range(len(rows)) if i not in conflicts]
+        users = list(zip(valid, USERS_ADAPTER.validate_python([rows[i] for i in valid])))
+
+    unique: List[User] = []
+    first_index: Dict[str, int] = {}
+    for index, user in users:
+        if user.email in first_index:
+            conflicts[index] = UserConflict(index=index, email=user.email, reason="duplicate in request")
+        else:
+            first_index[user.email] = index
+            unique.append(user)
+    return unique, first_index, conflicts
+
+
+def bulk_result(
+    rows: List[Any], first_index: Dict[str, int], conflicts: Dict[int, UserConflict], existing: Set[str]
+) -> BulkUserResult:
+    for email in existing:
+        index = first_index[email]
+        conflicts[index] = UserConflict(index=index, email=email, reason="already exists")
+
+    return BulkUserResult(
+        received=len(rows),
+        inserted=len(rows) - len(conflicts),
+        conflicts=sorted(conflicts.values(), key=lambda c: c.index),
+    )
+
+
+def plain_password_indices(hasher: PasswordHasher, users: List[User], keep_hashed: bool = False) -> List[int]:
+    """
+    해시해서 저장할 비밀번호를 가진 사용자의 위치.
+
+    keep_hashed가 False(기본값)이면 해시처럼 보여도 모두 해시합니다. 외부 요청이 임의의 해시를 심지 못하도록
+    이미 해시된 비밀번호를 그대로 저장하는 것은 신뢰할 수 있는 복원 경로(import_users.py --keep-hashed)에서만 허용합니다.
+    """
+    if not keep_hashed:
+        return list(range(len(users)))
+    return [i for i, user in enumerate(users) if not hasher.is_hashed(user.password)]
+
+
+def with_passwords(users: List[User], indices: List[int], passwords: Iterable[str]) -> List[User]:
+    users = list(users)
+    for i, password in zip(indices, passwords):
+        users[i] = users[i].model_copy(update={"password": password})
+    return users
+
+
+def users_ndjson(users: List[User]) -> bytes:
+    """사용자를 비밀번호 없이 한 줄에 하나씩 NDJSON으로 바꿉니다."""
+    return "".join(
+        UserExport(email=user.email, username=user.username).model_dump_json() + "\n" for user in users
+    ).encode("utf-8")
 
 class UserService:
-    def __init__(self, userRepoitory: UserRepository) -> None:
+    def __init__(
+        self,
+        userRepoitory: UserRepository,
+        hasher: Optional[PasswordHasher] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
         self.repo = userRepoitory
+        self.hasher = hasher or PasswordHasher()
+        # 일괄 등록 시 비밀번호를 병렬로 해시할 executor (None이면 순서대로 해시).
+        # 로그인 해시와 같은 풀을 쓰면 대량 등록이 로그인을 막으므로 일괄 등록 전용 풀을 넘겨 줍니다.
+        self.executor = executor
 
     def login(self, user_login: UserLogin) -> User:
         ## TODO
@@ -12,15 +99,19 @@ class UserService:
         if user == None:
             raise ValueError("User not Found.")
         
-        if user.password != user_login.password:
+        if not self.hasher.verify(user_login.password, user.password):
             raise ValueError("Invalid ID/PW")
+
+        # 평문으로 저장되어 있거나 비용 설정이 바뀐 해시는 로그인에 성공한 김에 현재 설정으로 다시 저장합니다.
+        if self.hasher.needs_rehash(user.password):
+            user = self.repo.update_password(user.email, self.hasher.hash(user_login.password), username=user.username) or user
         
         return user
         """
         이메일과 비밀번호 통한 사용자 인증
 
         arg:
-            user: email로 구분한 사용자 객체
+            user: email로 구분한 사용자 객체 (비밀번호는 해시로 저장)
 
         return:
             ValueError: 이메일 찾지 못한 경우에 User not Found 에러
@@ -29,21 +120,22 @@ class UserService:
         
     def register_user(self, new_user: User) -> User:
         ## TODO
-        exist_user = self.repo.get_user_by_email(new_user.email)
-        
-        if exist_user != None:
+        # 존재 여부를 먼저 조회하지 않고, INSERT의 중복 키 오류로 기존 사용자를 판단합니다. (DB 왕복 1회)
+        created_user = self.repo.create_user(new_user.model_copy(update={"password": self.hasher.hash(new_user.password)}))
+
+        if created_user == None:
             raise ValueError("User already Exists.")
 
-        return self.repo.save_user(new_user)
+        return created_user
         """
         이메일을 통한 새로운 유저 등록
 
         arg:
-            exist_user: email로 구분한 기존 사용자 객체
+            new_user: 등록할 사용자 객체
 
         return:
             ValueError: 이메일이 존재하는 경우에 User already Exist 에러
-            self.repo.save_user(new_user): 새로운 사용자 정보 저장 후 사용자 객체 반환
+            created_user: 새로운 사용자 정보 저장 후 사용자 객체 반환
         """
 
     def delete_user(self, email: str) -> User:
@@ -66,26 +158,54 @@ class UserService:
         """
     def update_user_pwd(self, user_update: UserUpdate) -> User:
         ## TODO
-        user = self.repo.get_user_by_email(user_update.email)
+        # 조회 후 저장하지 않고 UPDATE의 변경 행 수로 사용자 존재 여부를 판단합니다.
+        updated_user = self.repo.update_password(user_update.email, self.hasher.hash(user_update.new_password))
 
-        if user == None:
+        if updated_user == None:
             raise ValueError("User not Found.")
-        
-        updated_user = User(
-            email=user.email,
-            password=user_update.new_password,
-            username=user.username
-        )
 
-        self.repo.save_user(updated_user)
         return updated_user
         """
         이메일을 통한 유저 비밀번호 업데이트
 
         arg:
-            user: email로 구분한 사용자 객체
+            user_update: 이메일과 새 비밀번호
             updated_user: 비밀번호 변경한 사용자 객체
         return:
             ValueError: 이메일 찾을 수 없는 경우에 User not Found 에러
             updated_user: 비밀번호 변경 후의 사용자 객체 반환
-        """
\ No newline at end of file
+        """
+
+    def bulk_register(
+        self, rows: List[Any], chunk_size: int = USER_BULK_CHUNK_SIZE, keep_hashed: bool = False
+    ) -> BulkUserResult:
+        """
+        여러 사용자를 한 번에 등록합니다.
+
+        전체 목록을 TypeAdapter로 한 번에 검증하고, 유효한 행만 chunk_size명씩 묶어 저장합니다.
+        비밀번호는 executor에서 병렬로 해시합니다. keep_hashed가 True일 때만 이미 해시된 비밀번호를 그대로 저장합니다.
+        형식이 잘못된 행, 요청 안에서 이메일이 중복된 행, 이미 등록된 이메일은 등록하지 않고 conflicts로 알려 줍니다.
+
+        arg:
+            rows: 사용자 정보(dict) 목록
+            keep_hashed: 이미 해시된 비밀번호를 그대로 저장할지 여부 (신뢰할 수 있는 복원 전용, API에서는 사용하지 않음)
+
+        return:
+            BulkUserResult: 요청 행 수, 추가된 사용자 수, 행 번호별 충돌 사유
+        """
+        unique, first_index, conflicts = validate_users(rows)
+        existing = self.repo.bulk_create_users(self._hash_passwords(unique, keep_hashed), chunk_size)
+        return bulk_result(rows, first_index, conflicts, existing)
+
+    def export_users(self, batch_size: int = USER_BULK_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        모든 사용자를 NDJSON(한 줄에 사용자 하나)으로 batch_size명씩 내보냅니다. 비밀번호는 내보내지 않습니다.
+        """
+        for users in self.repo.iter_users(batch_size):
+            yield users_ndjson(users)
+
+    def _hash_passwords(self, users: List[User], keep_hashed: bool) -> List[User]:
+        plain = plain_password_indices(self.hasher, users, keep_hashed)
+        passwords = [users[i].password for i in plain]
+        hashed = self.executor.map(self.hasher.hash, passwords) if self.executor else map(self.hasher.hash, passwords)
+        return with_passwords(users, plain, hashed)
\ No newline at end of file
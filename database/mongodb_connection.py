@@ -1,4 +1,5 @@
-from pymongo import MongoClient
+from typing import Any, Dict
+from pymongo import AsyncMongoClient, MongoClient
 from dotenv import load_dotenv
 import os
 
@@ -6,7 +7,11 @@ load_dotenv()
 
 mongo_url = os.getenv("MONGO_URL")
 
-mongo_client = MongoClient(mongo_url)
+mongo_client: MongoClient[Dict[str, Any]] = MongoClient(mongo_url)
 
 mongo_db = mongo_client.get_database()
 
+# 비동기 리뷰 API용 클라이언트. 첫 요청 때 이벤트 루프에서 연결합니다.
+async_mongo_client: AsyncMongoClient[Dict[str, Any]] = AsyncMongoClient(mongo_url)
+
+async_mongo_db = async_mongo_client.get_database()
@@ -1,6 +1,9 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from database.pool_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool
+from typing import Optional
 
 import os
 from dotenv import load_dotenv
@@ -15,6 +18,65 @@ db = os.getenv("MYSQL_DB")
 
 
 DB_URL = f'mysql+pymysql://{user}:{passwd}@{host}:{port}/{db}?charset=utf8'
+# 비동기 사용자 API(USER_ASYNC_DB=1)용 URL. 로컬에서는 sqlite+aiosqlite:///users.db 같은 URL로 바꿔 쓸 수 있습니다.
+ASYNC_DB_URL = os.getenv("MYSQL_ASYNC_URL", f'mysql+aiomysql://{user}:{passwd}@{host}:{port}/{db}?charset=utf8')
 
-engine = create_engine(DB_URL, echo=True)
+# 커넥션 풀 설정. 풀은 uvicorn 워커(프로세스)마다 따로 만들어지므로
+# 워커 수 * (MYSQL_POOL_SIZE + MYSQL_MAX_OVERFLOW)가 MySQL max_connections보다 작아야 합니다.
+# 풀 사용량과 체크아웃 대기 시간은 GET /internal/db-pool에서 볼 수 있습니다.
+POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("MYSQL_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("MYSQL_POOL_TIMEOUT", "30"))
+# MySQL wait_timeout보다 먼저 커넥션을 새로 만들도록 재사용 시간(초)을 제한합니다.
+POOL_RECYCLE = int(os.getenv("MYSQL_POOL_RECYCLE", "3600"))
+POOL_PRE_PING = os.getenv("MYSQL_POOL_PRE_PING", "1") == "1"
+ECHO = os.getenv("MYSQL_ECHO", "0") == "1"
+
+engine = create_engine(
+    DB_URL,
+    poolclass=TimedQueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,
+    pool_recycle=POOL_RECYCLE,
+    pool_pre_ping=POOL_PRE_PING,
+    echo=ECHO,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_local: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    비동기 엔진을 처음 사용할 때 만듭니다. 동기 모드에서는 비동기 드라이버(aiomysql)가 없어도 되도록 미리 만들지 않습니다.
+    풀 설정은 동기 엔진과 같으며 풀 크기는 엔진마다 따로 잡힙니다.
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DB_URL,
+            poolclass=TimedAsyncAdaptedQueuePool,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT,
+            pool_recycle=POOL_RECYCLE,
+            pool_pre_ping=POOL_PRE_PING,
+            echo=ECHO,
+        )
+    return _async_engine
+
+
+def get_async_session_local() -> async_sessionmaker:
+    global _async_session_local
+    if _async_session_local is None:
+        # 커밋 후 속성을 다시 읽으려고 DB에 접근하지 않도록 expire_on_commit=False로 둡니다.
+        _async_session_local = async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_session_local
+
+
+async def dispose_async_engine() -> None:
+    if _async_engine is not None:
+        await _async_engine.dispose()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Optional, cast
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 지금 체크아웃 시간을 재고 있는 풀. 스레드와 (비동기 엔진의) greenlet마다 따로 관리됩니다.
+_timing_pool: ContextVar[Optional[QueuePool]] = ContextVar("timing_pool", default=None)
+
+
+class PoolMetrics:
+    """
+    커넥션 체크아웃 대기 시간을 모읍니다.
+
+    대기 시간은 풀에서 커넥션을 꺼낼 때까지 걸린 시간이며, 풀이 비어 있어 overflow 커넥션을 새로 만든 경우
+    연결 시간까지 포함합니다. 분위수는 최근 recent_size번의 체크아웃으로 계산합니다.
+    """
+
+    def __init__(self, recent_size: int = 1024) -> None:
+        self._lock = threading.Lock()
+        self._recent: Deque[float] = deque(maxlen=recent_size)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.total_wait += wait
+                self._recent.append(wait)
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent)
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0,
+                "wait_p95_ms": recent[max(int(len(recent) * 0.95) - 1, 0)] * 1000 if recent else 0.0,
+                "wait_max_ms": self.max_wait * 1000,
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    체크아웃 대기 시간과 타임아웃 횟수를 PoolMetrics에 기록하는 QueuePool입니다.
+    create_engine(..., poolclass=TimedQueuePool)로 사용합니다.
+    """
+
+    def __init__(self, *args: Any, metrics: PoolMetrics | None = None, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        self.metrics = metrics or PoolMetrics()
+
+    def _do_get(self):
+        # QueuePool._do_get은 경합 시 자기 자신을 다시 호출하므로 가장 바깥 호출에서만 잽니다.
+        if _timing_pool.get() is self:
+            return super()._do_get()
+
+        token = _timing_pool.set(self)
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        finally:
+            _timing_pool.reset(token)
+        self.metrics.record(time.perf_counter() - started)
+        return entry
+
+    def recreate(self) -> "TimedQueuePool":
+        # dispose/재연결로 풀을 새로 만들어도 누적 지표는 이어서 기록합니다.
+        # QueuePool.recreate는 self.__class__로 새 풀을 만들므로 결과도 TimedQueuePool입니다.
+        pool = cast(TimedQueuePool, super().recreate())
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedAsyncAdaptedQueuePool(TimedQueuePool, AsyncAdaptedQueuePool):
+    """비동기 엔진(create_async_engine)용 TimedQueuePool입니다."""
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """
+    엔진 풀의 현재 상태(크기, 사용 중/대기 커넥션, overflow)와 체크아웃 대기 지표를 반환합니다.
+
+    exhausted가 True이면 pool_size + max_overflow개를 모두 사용 중이라 다음 체크아웃은 timeout까지 기다립니다.
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        size = pool.size()
+        max_overflow = pool._max_overflow
+        checked_out = pool.checkedout()
+        stats.update({
+            "size": size,
+            "max_overflow": max_overflow,
+            "timeout": pool.timeout(),
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            # overflow()는 풀이 다 차기 전에는 음수이므로 실제로 만든 overflow 커넥션 수만 보여줍니다.
+            "overflow": max(pool.overflow(), 0),
+            "exhausted": max_overflow > -1 and checked_out >= size + max_overflow,
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
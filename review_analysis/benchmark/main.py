@@ -0,0 +1,145 @@
+import os
+import sys
+import json
+import platform
+import tempfile
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+# Project root 추가하여 실행 시 파일 경로 문제 해결
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from review_analysis.benchmark.stages import STAGES, make_processor, run_stages
+from review_analysis.benchmark.synthetic import SCHEMAS, generate_reviews
+
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser(description="Benchmark the review preprocessing pipeline on synthetic data.")
+    parser.add_argument('-s', '--sites', nargs='+', default=list(SCHEMAS), choices=list(SCHEMAS),
+                        help="Sites whose raw CSV schema is used. Default: all")
+    parser.add_argument('-n', '--sizes', nargs='+', type=int, default=[1_000, 10_000],
+                        help="Row counts to benchmark, e.g. 1000 10000 100000 1000000")
+    parser.add_argument('--stages', nargs='+', default=list(STAGES), choices=list(STAGES),
+                        help="Stages to time. load always runs. Default: all")
+    parser.add_argument('--lang-workers', type=int, default=None, help="Language detection worker processes.")
+    parser.add_argument('--lang-chunk-size', type=int, default=500, help="Language detection chunk size.")
+    parser.add_argument('-f', '--format', default="csv", choices=["csv", "parquet"], help="Output format for the save stage.")
+    parser.add_argument('--seed', type=int, default=0, help="Synthetic data seed.")
+    parser.add_argument('-o', '--output', type=str, default=None, help="Write results as JSON to this file.")
+    parser.add_argument('-b', '--baseline', type=str, default=None, help="Baseline results JSON to compare against.")
+    parser.add_argument('-t', '--threshold', type=float, default=0.2,
+                        help="Allowed slowdown ratio per stage before it counts as a regression. Default: 0.2 (20%%)")
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help="Ignore regressions smaller than this many seconds. Default: 0.05")
+    return parser
+
+
+def run_benchmark(sites: List[str], sizes: List[int], stages: List[str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    사이트별, 크기별로 합성 데이터를 만들어 단계별 소요 시간을 측정합니다.
+
+    Returns:
+        dict: meta(실행 환경)와 results(사이트/행 수/단계별 초) 목록
+    """
+    results = []
+    for site in sites:
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as work_dir:
+                input_path = os.path.join(work_dir, f"reviews_{site}.csv")
+                generate_reviews(site, size, seed=options["seed"]).to_csv(input_path, index=False)
+
+                ctx = {
+                    "site": site,
+                    "input_path": input_path,
+                    "work_dir": work_dir,
+                    "lang_workers": options["lang_workers"],
+                    "lang_chunk_size": options["lang_chunk_size"],
+                    "output_format": options["output_format"],
+                }
+                ctx["processor"] = make_processor(ctx)
+                if "cleaning" in stages:
+                    # NLTK 리소스 준비 시간은 정제 단계 측정에서 제외합니다.
+                    ctx["processor"].nltk_install()
+                timings = run_stages(ctx, stages)
+                results.append({
+                    "site": site,
+                    "rows": size,
+                    "rows_out": len(ctx["df"]),
+                    "stages": timings,
+                    "total": sum(timings.values()),
+                })
+                print(f"[정보] {site} {size}행: " + ", ".join(f"{k}={v:.3f}s" for k, v in timings.items()))
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "options": options,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float, min_seconds: float) -> List[Dict[str, Any]]:
+    """
+    기준 결과와 비교해 (사이트, 행 수, 단계)별로 threshold 비율 이상 느려진 항목을 반환합니다.
+    min_seconds보다 작은 차이는 측정 잡음으로 보고 무시합니다.
+    """
+    base = {(r["site"], r["rows"]): r["stages"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        stages = base.get((result["site"], result["rows"]))
+        if stages is None:
+            continue
+        for stage, seconds in result["stages"].items():
+            before = stages.get(stage)
+            if before is None:
+                continue
+            if seconds - before > min_seconds and seconds > before * (1 + threshold):
+                regressions.append({
+                    "site": result["site"],
+                    "rows": result["rows"],
+                    "stage": stage,
+                    "baseline": before,
+                    "current": seconds,
+                    "ratio": seconds / before if before else float("inf"),
+                })
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = create_parser()
+    args = parser.parse_args()
+
+    options = {
+        "lang_workers": args.lang_workers,
+        "lang_chunk_size": args.lang_chunk_size,
+        "output_format": args.format,
+        "seed": args.seed,
+    }
+    report = run_benchmark(args.sites, args.sizes, args.stages, options)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, args.min_seconds)
+        report["regressions"] = regressions
+        for r in regressions:
+            print(f"[경고] 성능 저하: {r['site']} {r['rows']}행 {r['stage']} "
+                  f"{r['baseline']:.3f}s → {r['current']:.3f}s (x{r['ratio']:.2f})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    else:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    if regressions:
+        sys.exit(1)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Type
+import time
+
+from review_analysis.preprocessing.base_processor import BaseDataProcessor
+from review_analysis.preprocessing.imdb_processor import IMDbProcessor
+from review_analysis.preprocessing.letterboxd_processor import LetterboxdProcessor
+from review_analysis.preprocessing.rottentomatoes_processor import RottenTomatoesProcessor
+
+PROCESSORS: Dict[str, Type[BaseDataProcessor]] = {
+    "imdb": IMDbProcessor,
+    "rottentomatoes": RottenTomatoesProcessor,
+    "letterboxd": LetterboxdProcessor,
+}
+
+
+def make_processor(ctx: Dict[str, Any]) -> BaseDataProcessor:
+    """
+    ctx 설정으로 사이트 전처리기를 만듭니다. 결과는 ctx["work_dir"]에 저장하고 IDF 모델은 매번 새로 학습합니다.
+    """
+    processor = PROCESSORS[ctx["site"]](ctx["input_path"], ctx["work_dir"])
+    processor.lang_workers = ctx.get("lang_workers")
+    processor.lang_chunk_size = ctx.get("lang_chunk_size", processor.lang_chunk_size)
+    processor.lang_cache_path = None
+    processor.output_format = ctx.get("output_format", "csv")
+    processor.tfidf_mode = "refit"
+    processor.tfidf_model_path = None
+    return processor
+
+
+# 각 단계는 공유 컨텍스트(ctx)를 받아 ctx["df"]를 갱신합니다.
+# 실제 전처리기(ctx["processor"])의 단계별 메서드를 preprocess → feature_engineering → save_to_database 순서로 호출합니다.
+
+def load(ctx: Dict[str, Any]) -> None:
+    processor = ctx.get("processor") or make_processor(ctx)
+    ctx["processor"] = processor
+    ctx["df"] = processor.load_raw()
+
+
+def dropna_filter(ctx: Dict[str, Any]) -> None:
+    ctx["df"] = ctx["processor"].drop_invalid(ctx["df"])
+
+
+def word_counts(ctx: Dict[str, Any]) -> None:
+    ctx["df"] = ctx["processor"].filter_word_count(ctx["df"])
+
+
+def language_detection(ctx: Dict[str, Any]) -> None:
+    ctx["df"] = ctx["processor"].filter_english(ctx["df"])
+
+
+def cleaning(ctx: Dict[str, Any]) -> None:
+    processor: BaseDataProcessor = ctx["processor"]
+    df = processor.clean_comments(ctx["df"])
+    ctx["df"] = processor.parse_dates(df).reset_index(drop=True)
+
+
+def tfidf_scoring(ctx: Dict[str, Any]) -> None:
+    processor: BaseDataProcessor = ctx["processor"]
+    df = ctx["df"]
+    if "clean_comment" not in df.columns:
+        # 정제 단계를 건너뛴 경우 소문자 원문으로 점수를 계산합니다.
+        df["clean_comment"] = df["comment"].astype(str).str.lower()
+        df = processor.parse_dates(df).reset_index(drop=True)
+
+    # 파생 변수와 주관성 점수 계산. 어휘 사전이 비어 있는 경우의 처리도 전처리기와 같습니다.
+    processor.df = df
+    processor.feature_engineering()
+    ctx["df"] = processor.processed_df()
+
+
+def save(ctx: Dict[str, Any]) -> None:
+    processor: BaseDataProcessor = ctx["processor"]
+    df = ctx["df"]
+    if "year_month" not in df.columns and "date" in df.columns:
+        # 점수 계산 단계를 건너뛴 경우 Parquet 파티션에 필요한 year_month를 만듭니다.
+        df = processor.parse_dates(df)
+        df["year_month"] = df["date"].dt.to_period("M")
+    processor.df = df
+    processor.save_to_database()
+
+
+STAGES: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "load": load,
+    "dropna_filter": dropna_filter,
+    "word_counts": word_counts,
+    "language_detection": language_detection,
+    "cleaning": cleaning,
+    "tfidf_scoring": tfidf_scoring,
+    "save": save,
+}
+
+
+def run_stages(ctx: Dict[str, Any], stages: list[str]) -> Dict[str, float]:
+    """
+    선택한 단계를 순서대로 실행하고 단계별 소요 시간(초)을 반환합니다.
+    load 단계는 항상 실행하며, 건너뛴 단계는 결과에 포함되지 않습니다.
+    """
+    timings: Dict[str, float] = {}
+    for name, stage in STAGES.items():
+        if name != "load" and name not in stages:
+            continue
+        started = time.perf_counter()
+        stage(ctx)
+        timings[name] = time.perf_counter() - started
+    return timings
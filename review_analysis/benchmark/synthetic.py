@@ -0,0 +1,94 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd # type: ignore
+
+# 영화 리뷰에 자주 나오는 단어와 감정 어휘 사전 단어를 섞은 영어 어휘
+ENGLISH_WORDS = (
+    "the a and of to is it this that was in for with movie film story character characters animation "
+    "great good best love loved fun funny boring bad worst amazing beautiful brilliant perfect awful "
+    "really very just like not but so all one time watch watched again kids adults city rabbit fox "
+    "police detective plot twist scene scenes music voice acting world building disney sequel original "
+    "heart humor message clever smart cute sweet predictable slow fast hilarious emotional masterpiece"
+).split()
+
+# 언어 판별 단계에서 걸러질 비영어 리뷰
+FOREIGN_REVIEWS = [
+    "Una película muy divertida con personajes geniales y una historia preciosa.",
+    "Ce film est vraiment magnifique, drôle et plein d'émotion pour toute la famille.",
+    "Ein wunderbarer Film mit tollen Figuren und einer klugen Geschichte.",
+    "Film yang sangat lucu dan menyenangkan untuk ditonton bersama keluarga.",
+]
+
+# 사이트별 원본 CSV 스키마
+SCHEMAS = {
+    "imdb": ["rating", "date", "comment"],
+    "rottentomatoes": ["rating", "date", "comment"],
+    "letterboxd": ["rating", "rating_raw", "date", "content"],
+}
+
+STARS = {0.5: "½", 1.0: "★", 1.5: "★½", 2.0: "★★", 2.5: "★★½", 3.0: "★★★", 3.5: "★★★½", 4.0: "★★★★", 4.5: "★★★★½", 5.0: "★★★★★"}
+
+
+def generate_reviews(
+    site: str,
+    n_rows: int,
+    seed: int = 0,
+    foreign_ratio: float = 0.05,
+    short_ratio: float = 0.03,
+    missing_ratio: float = 0.01,
+) -> pd.DataFrame:
+    """
+    원본 크롤링 CSV와 같은 스키마의 합성 리뷰 데이터를 만듭니다.
+    필터 단계가 실제처럼 동작하도록 비영어 리뷰, 3단어 미만 리뷰, 결측 행을 일정 비율로 섞습니다.
+
+    Args:
+        site: "imdb", "rottentomatoes", "letterboxd" 중 하나
+        n_rows: 생성할 행 수
+        seed: 난수 시드 (같은 시드는 같은 데이터를 만듭니다)
+        foreign_ratio: 비영어 리뷰 비율
+        short_ratio: 3단어 미만 리뷰 비율
+        missing_ratio: rating 또는 date가 비어 있는 행 비율
+
+    Returns:
+        pd.DataFrame: 합성 리뷰 데이터
+    """
+    if site not in SCHEMAS:
+        raise ValueError(f"site must be one of: {', '.join(SCHEMAS)}")
+
+    rng = np.random.default_rng(seed)
+    words = np.array(ENGLISH_WORDS, dtype=object)
+
+    lengths = rng.integers(5, 80, size=n_rows)
+    token_ids = rng.integers(0, len(words), size=int(lengths.sum()))
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    comments = [" ".join(words[token_ids[offsets[i]:offsets[i + 1]]]) + "." for i in range(n_rows)]
+
+    kind = rng.random(n_rows)
+    for i in np.flatnonzero(kind < foreign_ratio):
+        comments[i] = FOREIGN_REVIEWS[i % len(FOREIGN_REVIEWS)]
+    for i in np.flatnonzero((kind >= foreign_ratio) & (kind < foreign_ratio + short_ratio)):
+        comments[i] = "great movie"
+
+    days = rng.integers(0, 365 * 10, size=n_rows)
+    dates = pd.Timestamp("2016-03-04") + pd.to_timedelta(days, unit="D")
+
+    if site == "imdb":
+        ratings = rng.integers(1, 11, size=n_rows).astype(float)
+        date_text = dates.strftime("%Y.%m.%d.")
+    elif site == "rottentomatoes":
+        ratings = rng.integers(1, 11, size=n_rows) / 2
+        date_text = dates.strftime("%Y.%m.%d.")
+    else:
+        ratings = rng.integers(1, 11, size=n_rows) / 2
+        date_text = dates.strftime("%Y-%m-%d")
+
+    df = pd.DataFrame({"rating": ratings, "date": date_text})
+    if site == "letterboxd":
+        df["rating_raw"] = [STARS[r] for r in ratings]
+        df["content"] = comments
+    else:
+        df["comment"] = comments
+
+    missing = rng.random(n_rows) < missing_ratio
+    df.loc[missing, "rating"] = np.nan
+    return df[SCHEMAS[site]]
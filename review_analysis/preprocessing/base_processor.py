@@ -1,12 +1,385 @@
 from abc import ABC, abstractmethod
+import os
+import tempfile
+import pandas as pd # type: ignore
+
+from review_analysis.preprocessing.language_cache import LanguageCache
+from review_analysis.preprocessing.language_detector import detect_language, detect_languages
+from review_analysis.preprocessing.lexicon_loader import get_lexicon
+from review_analysis.preprocessing.tfidf_model import IdfModel
+from review_analysis.preprocessing.text_cleaner import TextCleaner
+from review_analysis.preprocessing.columnar_store import read_parquet, write_parquet
+from review_analysis.preprocessing.row_manifest import RowManifest, row_hashes
 
 class BaseDataProcessor:
+    site_name: str = ""
+
+    # 언어 판별 단계 설정: 워커 프로세스 수(None이면 CPU 코어 수)와 워커당 청크 크기
+    lang_workers: int | None = None
+    lang_chunk_size: int = 500
+    # 언어 판별 결과 캐시 파일 경로(None이면 캐시 미사용)와 ASCII 영어 사전 필터 사용 여부
+    lang_cache_path: str | None = os.getenv("LANGDETECT_CACHE_PATH")
+    lang_prefilter: bool = False
+    # 주관성 점수용 IDF 모델 파일 경로(None이면 저장하지 않음)와 갱신 방식
+    #   "refit": 현재 데이터로 새로 학습 / "partial": 저장된 모델에 누적 / "frozen": 저장된 모델로 변환만 수행
+    tfidf_model_path: str | None = None
+    tfidf_mode: str = "refit"
+    # 결과 저장 형식: "csv" 또는 "parquet" (site/year_month 파티션)
+    output_format: str = "csv"
+
     def __init__(self, input_path: str, output_dir: str):
         self.input_path = input_path
         self.output_dir = output_dir
+        self.df: pd.DataFrame | None = None
+        self._lang_cache: LanguageCache | None = None
+        self._tfidf_model: IdfModel | None = None
+
+    def processed_df(self) -> pd.DataFrame:
+        """preprocess(또는 feature_engineering) 결과를 반환합니다. 아직 실행하지 않았으면 ValueError를 발생시킵니다."""
+        if self.df is None:
+            raise ValueError("전처리 결과가 없습니다. 먼저 preprocess를 실행하세요.")
+        return self.df
+
+    def language_cache(self) -> LanguageCache | None:
+        """
+        lang_cache_path가 설정되어 있으면 언어 판별 캐시를 열어 반환합니다.
+        """
+        if self.lang_cache_path is None:
+            return None
+        if self._lang_cache is None or self._lang_cache.path != self.lang_cache_path:
+            self._lang_cache = LanguageCache(self.lang_cache_path)
+        return self._lang_cache
+
+    def report_language_cache(self) -> None:
+        """언어 판별 캐시의 누적 hit/miss 통계를 출력합니다."""
+        if self._lang_cache is not None:
+            stats = self._lang_cache.stats()
+            print(
+                f"[정보] 언어 판별 캐시 hit={stats['hits']} miss={stats['misses']} "
+                f"prefiltered={stats['prefiltered']}"
+            )
     
+    def warm_up(self) -> None:
+        """
+        첫 전처리 요청이 느려지지 않도록 무거운 리소스를 미리 불러옵니다.
+        NLTK 리소스와 WordNet 말뭉치, langdetect 언어 프로필, 감정 어휘 사전,
+        언어 판별 캐시, 저장된 IDF 모델(tfidf_mode가 refit이 아닌 경우)을 준비합니다.
+        """
+        self.nltk_install()
+        # WordNet 말뭉치와 langdetect 프로필은 첫 호출 때 로드됩니다.
+        self.clean_text("warming up movies")
+        detect_language("warming up the language detector")
+        get_lexicon()
+        self.language_cache()
+
+        path = self.tfidf_model_path
+        if self.tfidf_mode != "refit" and self._tfidf_model is None and path and os.path.exists(path):
+            self._tfidf_model = IdfModel.load(path)
+
+    # preprocess 단계별 메서드. 각 사이트 전처리기의 preprocess와 벤치마크(review_analysis/benchmark)가 함께 사용합니다.
+
+    def load_raw(self, df: pd.DataFrame | None = None) -> pd.DataFrame:
+        """
+        원본 CSV를 읽습니다(df가 None인 경우). 넘겨받은 청크는 복사해 사용합니다.
+        리뷰 컬럼 이름이 content이면 comment로 바꿉니다.
+        """
+        if df is None:
+            df = pd.read_csv(self.input_path)
+        else:
+            df = df.copy()
+
+        if "comment" not in df.columns and "content" in df.columns:
+            df = df.rename(columns={"content": "comment"})
+        return df
+
+    def drop_invalid(self, df: pd.DataFrame) -> pd.DataFrame:
+        """빈 리뷰와 평점/날짜/리뷰가 없는 행을 제거하고, 사이트별 이상치(filter_outliers)를 거릅니다."""
+        df["comment"] = df["comment"].astype(str).str.strip()
+        df = df[df["comment"] != ""]
+
+        df = df.dropna(subset=["rating", "date", "comment"])
+        return self.filter_outliers(df)
+
+    def filter_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """사이트별 이상치 리뷰를 제거합니다. 기본 구현은 아무것도 제거하지 않습니다."""
+        return df
+
+    def filter_word_count(self, df: pd.DataFrame, min_words: int = 3) -> pd.DataFrame:
+        """원문 단어 수(raw_word_count)를 계산하고 min_words 단어 미만 리뷰를 제거합니다."""
+        df["raw_word_count"] = df["comment"].astype(str).str.split().str.len()
+
+        return df[df["raw_word_count"] >= min_words]
+
+    def filter_english(self, df: pd.DataFrame) -> pd.DataFrame:
+        """lang_* 설정으로 리뷰 언어를 판별하고 영어 리뷰만 남깁니다."""
+        df["language"] = detect_languages(
+            df["comment"].astype(str).tolist(),
+            n_workers=self.lang_workers,
+            chunk_size=self.lang_chunk_size,
+            cache=self.language_cache(),
+            prefilter=self.lang_prefilter,
+        )
+        self.report_language_cache()
+
+        return df[df["language"] == "en"]
+
+    def clean_comments(self, df: pd.DataFrame) -> pd.DataFrame:
+        """clean_text와 같은 규칙으로 리뷰 전체를 정제해 clean_comment 컬럼에 저장합니다."""
+        df["clean_comment"] = self.cleaner.clean_series(df["comment"])
+        return df
+
+    def parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """date를 datetime으로 바꾸고 날짜를 해석할 수 없는 행을 제거합니다."""
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        return df.dropna(subset=["date"])
+
+    def fit_tfidf_model(self, docs) -> IdfModel:
+        """
+        tfidf_mode에 따라 IDF 모델을 준비하고, 갱신된 경우 tfidf_model_path에 저장합니다.
+
+        Args:
+            docs: 정제된 리뷰 텍스트 목록
+
+        Returns:
+            IdfModel: 점수 계산에 사용할 IDF 모델
+
+        Raises:
+            ValueError: 지원하지 않는 tfidf_mode이거나, frozen 모드인데 저장된 모델이 없는 경우
+        """
+        if self.tfidf_mode not in ("refit", "partial", "frozen"):
+            raise ValueError(f"지원하지 않는 tfidf_mode입니다: {self.tfidf_mode}")
+
+        if self.tfidf_mode == "refit":
+            model = IdfModel().fit(docs)
+        else:
+            loaded = self._tfidf_model
+            if loaded is None:
+                path = self.tfidf_model_path
+                if path and os.path.exists(path):
+                    loaded = IdfModel.load(path)
+                elif self.tfidf_mode == "frozen":
+                    # 빈 모델로 변환하면 모든 점수가 0이 되므로 조용히 진행하지 않습니다.
+                    raise ValueError(f"tfidf_mode가 frozen이지만 저장된 IDF 모델이 없습니다: {path}")
+                else:
+                    loaded = IdfModel()
+            model = loaded
+            if self.tfidf_mode == "partial":
+                model.partial_fit(docs)
+
+        if self.tfidf_model_path and self.tfidf_mode != "frozen":
+            model.save(self.tfidf_model_path)
+
+        self._tfidf_model = model
+        return model
+
+    def output_file(self) -> str:
+        """입력 파일 이름(reviews_<site>.csv)에 대응하는 결과 CSV 경로를 반환합니다."""
+        base = os.path.splitext(os.path.basename(self.input_path))[0]
+        site = base.replace("reviews_", "")
+        return os.path.join(self.output_dir, f"preprocessed_reviews_{site}.csv")
+
+    def parquet_dir(self) -> str:
+        """Parquet 데이터셋 루트 디렉토리를 반환합니다. 모든 사이트가 같은 데이터셋을 공유합니다."""
+        return os.path.join(self.output_dir, "preprocessed_reviews")
+
+    def write_output(self, df: pd.DataFrame, append: bool = False, part: int = 0) -> None:
+        """
+        output_format에 맞춰 결과를 저장합니다.
+
+        Args:
+            df: 저장할 데이터프레임
+            append: True이면 기존 결과 뒤에 이어 씁니다.
+            part: Parquet으로 나누어 쓸 때 파일 이름에 붙이는 번호
+        """
+        if self.output_format == "csv":
+            df.to_csv(
+                self.output_file(),
+                mode="a" if append else "w",
+                header=not append,
+                index=False,
+                encoding="utf-8-sig",
+            )
+        elif self.output_format == "parquet":
+            write_parquet(df, self.parquet_dir(), self.site_name, replace=not append, part=part)
+        else:
+            raise ValueError(f"지원하지 않는 output_format입니다: {self.output_format}")
+
+    def read_output(self) -> pd.DataFrame | None:
+        """
+        이전에 저장한 결과를 읽습니다. 결과가 없으면 None을 반환합니다.
+        """
+        if self.output_format == "parquet":
+            site_dir = os.path.join(self.parquet_dir(), f"site={self.site_name}")
+            if not os.path.isdir(site_dir):
+                return None
+            df = read_parquet(self.parquet_dir(), sites=[self.site_name])
+            df = df.drop(columns=["site"], errors="ignore")
+            for col in ("language", "year_month"):
+                if col in df.columns:
+                    df[col] = df[col].astype(str)
+            return df
+
+        if not os.path.exists(self.output_file()):
+            return None
+        df = pd.read_csv(self.output_file(), encoding="utf-8-sig")
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        df["clean_comment"] = df["clean_comment"].fillna("").astype(str)
+        return df
+
+    def manifest_file(self) -> str:
+        """증분 처리 매니페스트 경로를 반환합니다."""
+        return os.path.join(self.output_dir, f"manifest_{self.site_name}.json")
+
+    def run_incremental(self) -> dict:
+        """
+        매니페스트에 없는 새 행(또는 내용이 바뀐 행)만 전처리해 기존 결과에 병합합니다.
+        원본에서 사라진 행은 결과에서도 제거합니다.
+
+        비용이 큰 언어 판별과 텍스트 정제는 변경분에만 수행하고, 주관성 점수는 병합된 전체 결과로
+        다시 계산합니다(변환만 수행하는 희소 행렬 연산). 따라서 결과는 전체를 새로 처리한 경우와 같습니다.
+        결과에는 원본 행을 식별하는 row_hash 컬럼이 포함됩니다.
+
+        Returns:
+            dict: added(새로 처리한 원본 행 수), removed(제거된 원본 행 수), rows(저장한 결과 행 수)
+        """
+        raw = pd.read_csv(self.input_path)
+        raw["row_hash"] = row_hashes(raw)
+        position = pd.Series(range(len(raw)), index=raw["row_hash"].to_numpy())
+
+        manifest = RowManifest.load(self.manifest_file())
+        existing = self.read_output()
+        if existing is None or "row_hash" not in existing.columns:
+            # 병합할 기존 결과가 없으면 전체를 새로 처리합니다.
+            manifest = RowManifest(self.manifest_file())
+            existing = None
+
+        added, removed = manifest.diff(raw["row_hash"])
+        summary = {"added": len(added), "removed": len(removed), "rows": 0}
+        if existing is not None and not added and not removed:
+            print(f"[정보] {self.site_name} 변경된 행이 없습니다.")
+            summary["rows"] = len(existing)
+            return summary
+
+        parts = []
+        if existing is not None:
+            parts.append(existing[existing["row_hash"].isin(position.index)])
+        if added:
+            self.preprocess(df=raw[raw["row_hash"].isin(added)])
+            parts.append(self.processed_df())
+
+        frames = [part for part in parts if not part.empty]
+        if not frames:
+            raise ValueError("저장할 데이터가 없습니다. 입력 파일을 확인하세요.")
+
+        # 전체 처리와 같은 순서가 되도록 원본 행 순서로 정렬합니다.
+        merged = pd.concat(frames, ignore_index=True)
+        merged = merged.iloc[merged["row_hash"].map(position).argsort(kind="stable")]
+        self.df = merged.reset_index(drop=True)
+
+        self.feature_engineering()
+        self.save_to_database()
+        manifest.save(raw["row_hash"])
+
+        summary["rows"] = len(self.df)
+        return summary
+
+    def run_streaming(self, chunk_size: int = 50_000) -> int:
+        """
+        입력 CSV를 chunk_size 행씩 읽어 전처리하고 결과를 이어 씁니다.
+        메모리에는 한 번에 한 청크만 올라가므로 파일 크기와 무관하게 최대 메모리가 제한됩니다.
+
+        주관성 점수는 코퍼스 전체 IDF가 필요하므로 두 단계로 처리합니다.
+            1단계: 청크별 preprocess 후 IDF 모델을 누적 학습하고, 전처리 결과를 임시 파일로 내려둡니다.
+            2단계: 완성된 IDF 모델로 청크별 feature_engineering을 수행하고 결과를 이어 씁니다.
+        tfidf_mode가 "frozen"이면 미리 학습된 모델을 사용해 한 단계로 처리합니다.
+        결과는 메모리 모드(preprocess → feature_engineering → save_to_database)와 같습니다.
+
+        Args:
+            chunk_size: 한 번에 읽을 원본 행 수
+
+        Returns:
+            int: 저장한 행 수
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        written = 0
+        parts = 0
+
+        def append(df: pd.DataFrame) -> None:
+            nonlocal written, parts
+            self.write_output(df, append=written > 0, part=parts)
+            written += len(df)
+            parts += 1
+
+        chunks = pd.read_csv(self.input_path, chunksize=chunk_size)
+
+        if self.tfidf_mode == "frozen":
+            for chunk in chunks:
+                self.preprocess(df=chunk)
+                self.feature_engineering()
+                df = self.processed_df()
+                if not df.empty:
+                    append(df)
+        else:
+            saved_mode = self.tfidf_mode
+            model = self._tfidf_model if saved_mode == "partial" else None
+            if model is None:
+                path = self.tfidf_model_path
+                model = IdfModel.load(path) if saved_mode == "partial" and path and os.path.exists(path) else IdfModel()
+
+            with tempfile.TemporaryDirectory() as spill_dir:
+                spilled = []
+                for i, chunk in enumerate(chunks):
+                    self.preprocess(df=chunk)
+                    df = self.processed_df()
+                    model.partial_fit(df["clean_comment"].astype(str))
+                    spill_path = os.path.join(spill_dir, f"chunk_{i}.pkl")
+                    df.to_pickle(spill_path)
+                    spilled.append(spill_path)
+                self.df = None
+
+                if self.tfidf_model_path:
+                    model.save(self.tfidf_model_path)
+
+                self._tfidf_model = model
+                self.tfidf_mode = "frozen"
+                try:
+                    for spill_path in spilled:
+                        self.df = pd.read_pickle(spill_path)
+                        self.feature_engineering()
+                        df = self.processed_df()
+                        if not df.empty:
+                            append(df)
+                finally:
+                    self.tfidf_mode = saved_mode
+
+        if written == 0:
+            raise ValueError("저장할 데이터가 없습니다. 입력 파일을 확인하세요.")
+        return written
+
+    @abstractmethod
+    def nltk_install(self) -> None:
+        """텍스트 정제에 필요한 NLTK 리소스를 준비합니다."""
+        pass
+
+    @property
+    @abstractmethod
+    def cleaner(self) -> TextCleaner:
+        """nltk_install이 준비한 TextCleaner를 반환합니다."""
+        pass
+
     @abstractmethod
-    def preprocess(self):
+    def clean_text(self, text: str) -> str:
+        """리뷰 텍스트 하나를 정제합니다."""
+        pass
+
+    @abstractmethod
+    def preprocess(self, df: pd.DataFrame | None = None) -> None:
+        """
+        원본 데이터를 전처리해 self.df에 저장합니다.
+
+        Args:
+            df: 전처리할 원본 데이터. None이면 input_path의 CSV를 읽습니다. (스트리밍/증분 모드에서 청크를 넘깁니다)
+        """
         pass
     
     @abstractmethod
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import Sequence
+import os
+import shutil
+import pandas as pd # type: ignore
+
+PARTITION_COLS = ["site", "year_month"]
+FLOAT32_COLS = ["rating", "subjectivity_score"]
+INT32_COLS = ["raw_word_count", "clean_word_count"]
+CATEGORY_COLS = ["language", "year_month", "site"]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow.dataset as ds # type: ignore
+        import pyarrow.parquet as pq # type: ignore
+    except ImportError as e:
+        raise ImportError("Parquet 저장/조회에는 pyarrow가 필요합니다. `pip install pyarrow`로 설치하세요.") from e
+    return ds, pq
+
+
+def to_columnar(df: pd.DataFrame, site: str) -> pd.DataFrame:
+    """
+    전처리 결과를 컬럼형 저장에 맞는 dtype으로 변환합니다.
+    date는 datetime, language/year_month/site는 category, 점수는 float32, 단어 수는 int32로 저장합니다.
+
+    Args:
+        df: 전처리 및 파생 변수 생성이 끝난 데이터프레임
+        site: 사이트 이름 (파티션 키)
+
+    Returns:
+        pd.DataFrame: dtype이 정리된 새 데이터프레임
+    """
+    out = df.copy()
+    out["site"] = site
+    if "date" in out.columns:
+        out["date"] = pd.to_datetime(out["date"], errors="coerce")
+    if "year_month" in out.columns:
+        out["year_month"] = out["year_month"].astype(str)
+    for col in FLOAT32_COLS:
+        if col in out.columns:
+            out[col] = pd.to_numeric(out[col], errors="coerce").astype("float32")
+    for col in INT32_COLS:
+        if col in out.columns:
+            out[col] = out[col].astype("int32")
+    for col in CATEGORY_COLS:
+        if col in out.columns:
+            out[col] = out[col].astype("category")
+    return out
+
+
+def write_parquet(df: pd.DataFrame, root_dir: str, site: str, replace: bool = True, part: int = 0) -> None:
+    """
+    전처리 결과를 site/year_month로 파티션된 Parquet 데이터셋에 저장합니다.
+
+    Args:
+        df: 저장할 데이터프레임
+        root_dir: 데이터셋 루트 디렉토리
+        site: 사이트 이름
+        replace: True이면 해당 사이트 파티션을 먼저 지웁니다.
+        part: 같은 파티션에 여러 번 나누어 쓸 때 파일 이름이 겹치지 않도록 붙이는 번호
+    """
+    _, pq = _require_pyarrow()
+    import pyarrow as pa # type: ignore
+
+    site_dir = os.path.join(root_dir, f"site={site}")
+    if replace and os.path.isdir(site_dir):
+        shutil.rmtree(site_dir)
+
+    table = pa.Table.from_pandas(to_columnar(df, site), preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        root_path=root_dir,
+        partition_cols=PARTITION_COLS,
+        basename_template=f"part-{part}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+
+def read_parquet(
+    root_dir: str,
+    columns: Sequence[str] | None = None,
+    sites: Sequence[str] | None = None,
+    year_months: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Parquet 데이터셋에서 필요한 컬럼과 파티션만 읽습니다.
+
+    Args:
+        root_dir: 데이터셋 루트 디렉토리
+        columns: 읽을 컬럼 목록 (None이면 전체)
+        sites: 읽을 사이트 목록 (None이면 전체)
+        year_months: 읽을 "YYYY-MM" 목록 (None이면 전체)
+
+    Returns:
+        pd.DataFrame: 조회 결과
+    """
+    ds, _ = _require_pyarrow()
+
+    dataset = ds.dataset(root_dir, format="parquet", partitioning="hive")
+    condition = None
+    if sites is not None:
+        condition = ds.field("site").isin(list(sites))
+    if year_months is not None:
+        by_month = ds.field("year_month").isin(list(year_months))
+        condition = by_month if condition is None else condition & by_month
+
+    table = dataset.to_table(columns=list(columns) if columns else None, filter=condition)
+    return table.to_pandas()
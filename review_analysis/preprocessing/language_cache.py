@@ -0,0 +1,106 @@
+from __future__ import annotations
+from hashlib import blake2b
+from typing import Iterable
+import os
+import sqlite3
+import threading
+
+# SQLite 한 쿼리에 바인딩할 수 있는 변수 수 제한보다 작게 유지합니다.
+_LOOKUP_BATCH = 900
+
+# ASCII 영어 사전 필터에 사용하는 기능어 목록 (NLTK 리소스 없이 동작하도록 직접 정의)
+_ENGLISH_FUNCTION_WORDS = frozenset(
+    """
+    a about after all also an and any are as at be because been but by can could did do
+    does for from had has have he her him his how i if in into is it its just like me
+    more most my no not of on one only or our out she so some than that the their them
+    then there these they this to too up very was we were what when which who why will
+    with would you your
+    """.split()
+)
+
+
+def text_key(text: str) -> str:
+    """리뷰 본문의 내용 해시(캐시 키)를 반환합니다."""
+    return blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_obvious_english(text: str, min_tokens: int = 8, min_ratio: float = 0.3) -> bool:
+    """
+    langdetect 호출 없이 영어로 판별해도 되는 텍스트인지 확인합니다.
+    ASCII 문자로만 이루어져 있고, 토큰이 충분히 많으며, 영어 기능어 비율이 높은 경우에만 True입니다.
+    """
+    if not text.isascii():
+        return False
+    tokens = text.lower().split()
+    if len(tokens) < min_tokens:
+        return False
+    hits = sum(1 for token in tokens if token.strip(".,!?;:'\"()") in _ENGLISH_FUNCTION_WORDS)
+    return hits / len(tokens) >= min_ratio
+
+
+class LanguageCache:
+    """
+    리뷰 본문 해시를 키로 언어 판별 결과를 저장하는 SQLite 기반 디스크 캐시입니다.
+    hit/miss/prefiltered 카운터로 절감 효과를 확인할 수 있습니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:" 사용 가능)
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        # 여러 사이트를 병렬로 처리할 때 같은 파일을 공유하므로 잠금 대기 시간을 넉넉히 둡니다.
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS language_cache (key TEXT PRIMARY KEY, language TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.prefiltered = 0
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """
+        여러 키를 한 번에 조회해 캐시에 있는 항목만 반환합니다.
+        """
+        unique = list(dict.fromkeys(keys))
+        found: dict[str, str] = {}
+        with self._lock:
+            for i in range(0, len(unique), _LOOKUP_BATCH):
+                batch = unique[i:i + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, language FROM language_cache WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def put_many(self, items: dict[str, str]) -> None:
+        """
+        판별 결과를 한 트랜잭션으로 저장합니다.
+        """
+        if not items:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO language_cache (key, language) VALUES (?, ?)",
+                items.items(),
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        """캐시 사용 통계를 반환합니다."""
+        return {"hits": self.hits, "misses": self.misses, "prefiltered": self.prefiltered}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
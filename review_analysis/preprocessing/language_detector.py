@@ -0,0 +1,113 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+import os
+from langdetect import detect, DetectorFactory # type: ignore
+from langdetect.lang_detect_exception import LangDetectException # type: ignore
+from review_analysis.preprocessing.language_cache import LanguageCache, is_obvious_english, text_key
+
+DEFAULT_SEED = 0
+DEFAULT_CHUNK_SIZE = 500
+
+
+def detect_language(text: str) -> str:
+    """
+    텍스트의 언어를 판별합니다. 판별할 수 없으면 "unknown"을 반환합니다.
+    """
+    try:
+        return detect(text)
+    except LangDetectException:
+        return "unknown"
+
+
+def _init_worker(seed: int) -> None:
+    """워커 프로세스마다 동일한 시드를 설정해 직렬 실행과 같은 결과를 보장합니다."""
+    DetectorFactory.seed = seed
+
+
+def _detect_chunk(texts: list[str]) -> list[str]:
+    return [detect_language(text) for text in texts]
+
+
+def detect_languages(
+    texts: Sequence[str],
+    n_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = DEFAULT_SEED,
+    cache: LanguageCache | None = None,
+    prefilter: bool = False,
+) -> list[str]:
+    """
+    여러 텍스트의 언어를 판별합니다.
+    텍스트를 chunk_size 단위로 나누어 프로세스 풀에서 병렬로 처리하며, 결과 순서는 입력 순서와 같습니다.
+    cache가 주어지면 내용 해시로 한 번에 조회해 캐시에 없는 텍스트만 langdetect로 판별하고 결과를 저장합니다.
+
+    Args:
+        texts: 언어를 판별할 텍스트 목록
+        n_workers: 워커 프로세스 수. None이면 CPU 코어 수, 1 이하이면 현재 프로세스에서 직렬 실행
+        chunk_size: 워커 하나에 한 번에 넘길 텍스트 수
+        seed: langdetect DetectorFactory 시드
+        cache: 언어 판별 결과 디스크 캐시
+        prefilter: True이면 명백한 ASCII 영어 텍스트는 langdetect 없이 "en"으로 판별
+
+    Returns:
+        list[str]: 입력 순서와 같은 언어 코드 목록
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size는 1 이상이어야 합니다.")
+
+    texts = [str(text) for text in texts]
+    results: list[str | None] = [None] * len(texts)
+
+    pending = list(range(len(texts)))
+    if prefilter:
+        pending = []
+        for i, text in enumerate(texts):
+            if is_obvious_english(text):
+                results[i] = "en"
+            else:
+                pending.append(i)
+        if cache is not None:
+            cache.prefiltered += len(texts) - len(pending)
+
+    keys: list[str] = []
+    if cache is not None:
+        keys = [text_key(texts[i]) for i in pending]
+        found = cache.get_many(keys)
+        misses = []
+        for i, key in zip(pending, keys):
+            if key in found:
+                results[i] = found[key]
+            else:
+                misses.append((i, key))
+        cache.hits += len(pending) - len(misses)
+        cache.misses += len(misses)
+        pending = [i for i, _ in misses]
+        keys = [key for _, key in misses]
+
+    detected = _detect_parallel([texts[i] for i in pending], n_workers, chunk_size, seed)
+    for i, language in zip(pending, detected):
+        results[i] = language
+
+    if cache is not None:
+        cache.put_many(dict(zip(keys, detected)))
+
+    return results  # type: ignore[return-value]
+
+
+def _detect_parallel(texts: list[str], n_workers: int | None, chunk_size: int, seed: int) -> list[str]:
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(chunks))
+
+    if n_workers <= 1:
+        _init_worker(seed)
+        return _detect_chunk(texts)
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_init_worker, initargs=(seed,)
+    ) as executor:
+        results = executor.map(_detect_chunk, chunks)
+        return [language for chunk in results for language in chunk]
@@ -1,17 +1,13 @@
 from __future__ import annotations
-from langdetect import detect, DetectorFactory # type: ignore
-from langdetect.lang_detect_exception import LangDetectException # type: ignore
 from nltk.corpus import stopwords # type: ignore
 from nltk.stem import WordNetLemmatizer # type: ignore
-import re
 import os
 import nltk # type: ignore
 import pandas as pd # type: ignore
 from review_analysis.preprocessing.base_processor import BaseDataProcessor
 
-from review_analysis.preprocessing.lexicon_loader import load_lexicon
-from sklearn.feature_extraction.text import TfidfVectorizer # type: ignore
-import numpy as np
+from review_analysis.preprocessing.lexicon_loader import get_lexicon
+from review_analysis.preprocessing.text_cleaner import TextCleaner
 
 class LetterboxdProcessor(BaseDataProcessor):
     """
@@ -43,11 +39,16 @@ class LetterboxdProcessor(BaseDataProcessor):
 
         self._stop_words: set[str] | None = None
         self._lemmatizer: WordNetLemmatizer | None = None
+        self._cleaner: TextCleaner | None = None
     
     def nltk_install(self) -> None:
         """
         필요한 NLTK 리소스를 확인하고 없으면 다운로드합니다.
         """
+        if self._cleaner is not None:
+            # 이미 준비된 인스턴스는 리소스 확인(파일 시스템 조회)을 반복하지 않습니다.
+            return
+
         resources = ["stopwords", "wordnet", "omw-1.4"]
         for i in resources:
             try:
@@ -59,6 +60,21 @@ class LetterboxdProcessor(BaseDataProcessor):
             self._stop_words = set(stopwords.words("english"))
         if self._lemmatizer is None:
             self._lemmatizer = WordNetLemmatizer()
+        if self._cleaner is None:
+            self._cleaner = TextCleaner(self._stop_words, self._lemmatizer.lemmatize)
+
+
+    @property
+    def cleaner(self) -> TextCleaner:
+        """
+        nltk_install이 준비한 TextCleaner를 반환합니다. 아직 준비되지 않았으면 먼저 nltk_install을 실행합니다.
+        """
+        if self._cleaner is None:
+            self.nltk_install()
+        cleaner = self._cleaner
+        if cleaner is None:
+            raise RuntimeError("nltk_install 실행 후에도 TextCleaner가 준비되지 않았습니다.")
+        return cleaner
 
 
     def clean_text(self, text: str) -> str:
@@ -72,18 +88,7 @@ class LetterboxdProcessor(BaseDataProcessor):
         Returns:
             str: 정제된 리뷰 텍스트
         """
-        if not isinstance(text, str):
-            return ""
-        
-        text = text.lower()
-        text = re.sub(r"[^a-z\s]", " ", text)
-        tokens = text.split()
-        stop_words = set(stopwords.words("english"))
-        tokens = [token for token in tokens if token not in stop_words]
-        lemmatizer = WordNetLemmatizer()
-        tokens = [lemmatizer.lemmatize(token) for token in tokens]
-
-        return " ".join(tokens)
+        return self.cleaner.clean(text)
     
 
     def preprocess(self, df: pd.DataFrame | None = None):
@@ -92,48 +97,22 @@ class LetterboxdProcessor(BaseDataProcessor):
         """
         self.nltk_install()
 
-        if df is None:
-            df = pd.read_csv(self.input_path)
-        else:
-            df = df.copy()
+        df = self.load_raw(df)
+        df = self.drop_invalid(df)
+        df = self.filter_word_count(df)
+        df = self.filter_english(df)
+        df = self.clean_comments(df)
+        df = self.parse_dates(df)
 
-        if "comment" not in df.columns and "content" in df.columns:
-            df = df.rename(columns={"content": "comment"})
-
-        df["comment"] = df["comment"].astype(str).str.strip()
-        df = df[df["comment"] != ""]
+        self.df = df.reset_index(drop=True)
 
-        df = df.dropna(subset=["rating", "date", "comment"])
 
-        # "spoiler shield" 리뷰는 이상치로 처리해서 제거
+    def filter_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        "spoiler shield" 리뷰는 이상치로 처리해서 제거합니다.
+        """
         spoiler_text = "This review may contain spoilers. I can handle the truth."
-        df = df[~df["comment"].astype(str).str.contains(spoiler_text, regex=False)]
-
-        df["raw_word_count"] = df["comment"].astype(str).str.split().str.len()
-
-        df = df[df["raw_word_count"] >= 3]
-
-        DetectorFactory.seed = 0
-
-        def detect_language(text: str) -> str:
-            """
-            텍스트의 언어를 판별합니다.
-            """
-            try:
-                return detect(text)
-            except LangDetectException:
-                return "unknown"
-        
-        df["language"] = df["comment"].astype(str).apply(detect_language)
-
-        df = df[df["language"] == "en"]
-
-        df["clean_comment"] = df["comment"].apply(self.clean_text)
-
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        df = df.dropna(subset=["date"])
-
-        self.df = df.reset_index(drop=True)
+        return df[~df["comment"].astype(str).str.contains(spoiler_text, regex=False)]
 
 
     def feature_engineering(self):
@@ -168,32 +147,24 @@ class LetterboxdProcessor(BaseDataProcessor):
         df = self.df
         
         # 어휘 사전 로드
-        lexicon = load_lexicon()
+        lexicon = get_lexicon()
         if not lexicon:
             print("[경고] 어휘 사전이 비어 있습니다. 모든 주관성 점수가 0으로 설정됩니다.")
             df["subjectivity_score"] = 0.0
             self.df = df
             return
 
-        # TF-IDF 초기화
-        vectorizer = TfidfVectorizer(token_pattern=r"(?u)\b\w+\b", norm=None)
-        
+        # 코퍼스 단위 IDF 모델 갱신. frozen 모드에서 저장된 모델이 없으면 점수를 0으로 채우지 않고 예외가 발생합니다.
+        docs = df["clean_comment"].astype(str)
+        model = self.fit_tfidf_model(docs)
+
         try:
-            # TF-IDF 행렬 생성
-            tfidf_matrix = vectorizer.fit_transform(df["clean_comment"].astype(str))
+            # TF-IDF 행렬 생성 (norm=None과 같은 방식)
+            tfidf_matrix = model.transform(docs)
             
-            # 피처 이름 목록 가져오기
-            feature_names = vectorizer.get_feature_names_out()
-            
-            # 피처 순서에 맞춰 가중치 벡터 생성
-            weights = []
-            for word in feature_names:
-                lex_weight = lexicon.get(word)
-                if lex_weight:
-                    weights.append(lex_weight)
-                else:
-                    weights.append(0.5)
-            weights = np.array(weights)
+            # 모델의 피처 순서에 맞춰 가중치 벡터 생성 (partial_fit으로 추가된 단어만 새로 계산)
+            # 사전에 있는 단어는 해당 가중치를 사용하고, 없는 단어는 배경값(0.5)을 부여합니다.
+            weights = lexicon.weights_for_model(model)
             
             # 점수 계산
             raw_scores = tfidf_matrix.dot(weights)
@@ -212,17 +183,11 @@ class LetterboxdProcessor(BaseDataProcessor):
 
     def save_to_database(self):
         """
-        전처리 및 분석이 완료된 데이터를 CSV 파일로 저장합니다.
+        전처리 및 분석이 완료된 데이터를 output_format(CSV 또는 Parquet)에 맞춰 저장합니다.
         """
         if self.df is None or self.df.empty:
             raise ValueError("저장할 데이터가 없습니다. 먼저 preprocess를 실행하세요.")
         
         os.makedirs(self.output_dir, exist_ok=True)
 
-        base = os.path.splitext(os.path.basename(self.input_path))[0]
-        site = base.replace("reviews_", "")
-
-        filename = f"preprocessed_reviews_{site}.csv"
-        out_file = os.path.join(self.output_dir, filename)
-
-        self.df.to_csv(out_file, index=False, encoding="utf-8-sig")
\ No newline at end of file
+        self.write_output(self.df)
\ No newline at end of file
@@ -1,44 +1,171 @@
-import pandas as pd # type: ignore
+from __future__ import annotations
+from typing import TYPE_CHECKING, Sequence
 import os
+import threading
+import weakref
+import numpy as np
+import pandas as pd # type: ignore
+
+if TYPE_CHECKING:
+    from review_analysis.preprocessing.tfidf_model import IdfModel
+
+DEFAULT_LEXICON_PATH = "review_analysis/preprocessing/movie_review_lexicon_400.csv"
+
+# 관련 타입 필터링 및 가중치 매핑
+WEIGHT_MAP = {
+    "strongsubj": 2.0,
+    "verystrongsubj": 4.0
+}
+
+# 사전에 없는 단어에 부여하는 배경 가중치
+BACKGROUND_WEIGHT = 0.5
+
+
+class _ModelWeights:
+    """IdfModel 하나의 어휘에 맞춘 가중치. 어휘가 늘면 buffer를 두 배씩 키워 뒤에 이어 붙입니다."""
+
+    def __init__(self, generation: int, default: float) -> None:
+        self.generation = generation
+        self.default = default
+        self.buffer = np.empty(0, dtype=np.float64)
+        self.size = 0
+
+
+class CompiledLexicon:
+    """
+    단어 배열과 가중치 배열로 컴파일된 감정 어휘 사전입니다.
+    임의의 어휘 목록에 맞춘 가중치 벡터를 벡터 연산으로 만들고,
+    IdfModel의 어휘에 맞춘 가중치는 모델별로 캐시해 새로 추가된 단어만 계산합니다.
+    """
+
+    def __init__(self, words: np.ndarray, weights: np.ndarray, mtime: float | None = None):
+        self._index = pd.Index(words)
+        self._weights = np.asarray(weights, dtype=np.float64)
+        self.mtime = mtime
+        # 모델이 사라지면 캐시 항목도 함께 사라지도록 약한 참조로 보관합니다.
+        self._model_cache: weakref.WeakKeyDictionary[IdfModel, _ModelWeights] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def as_dict(self) -> dict[str, float]:
+        return dict(zip(self._index.tolist(), self._weights.tolist()))
+
+    def weights_for(self, vocabulary: Sequence[str] | np.ndarray, default: float = BACKGROUND_WEIGHT) -> np.ndarray:
+        """
+        vocabulary 순서에 맞춘 가중치 벡터를 반환합니다. 사전에 없는 단어는 default 값을 가집니다.
+
+        Args:
+            vocabulary: TF-IDF 피처 이름 등 단어 목록
+            default: 사전에 없는 단어의 가중치
+
+        Returns:
+            np.ndarray: vocabulary와 길이가 같은 가중치 배열
+        """
+        positions = self._index.get_indexer(pd.Index(vocabulary, dtype=object))
+        weights = np.full(len(positions), default, dtype=np.float64)
+        found = positions >= 0
+        weights[found] = self._weights[positions[found]]
+        return weights
+
+    def weights_for_model(self, model: IdfModel, default: float = BACKGROUND_WEIGHT) -> np.ndarray:
+        """
+        model.feature_names() 순서에 맞춘 가중치 벡터를 반환합니다.
+
+        partial_fit은 새 단어를 어휘 끝에만 추가하므로, 같은 모델(같은 generation)이면 지난 호출 이후
+        추가된 단어의 가중치만 계산해 이어 붙입니다. fit으로 어휘가 바뀌면 처음부터 다시 계산합니다.
+
+        Args:
+            model: 가중치를 맞출 IDF 모델
+            default: 사전에 없는 단어의 가중치
+
+        Returns:
+            np.ndarray: 어휘 크기와 길이가 같은 가중치 배열 (읽기 전용)
+        """
+        names = model.feature_names()
+        with self._lock:
+            entry = self._model_cache.get(model)
+            if entry is None or entry.generation != model.generation or entry.default != default:
+                entry = _ModelWeights(model.generation, default)
+                self._model_cache[model] = entry
+
+            if entry.size < len(names):
+                added = self.weights_for(names[entry.size:], default)
+                if len(names) > len(entry.buffer):
+                    buffer = np.empty(max(len(names), 2 * len(entry.buffer)), dtype=np.float64)
+                    buffer[:entry.size] = entry.buffer[:entry.size]
+                    entry.buffer = buffer
+                entry.buffer[entry.size:len(names)] = added
+                entry.size = len(names)
+
+            # 이미 반환한 앞부분은 바꾸지 않으므로 읽기 전용 view로 돌려줍니다.
+            weights = entry.buffer[:len(names)]
+            weights.setflags(write=False)
+            return weights
+
+
+_compiled: dict[str, CompiledLexicon] = {}
+_compiled_lock = threading.Lock()
+
 
-def load_lexicon(lexicon_path: str = "review_analysis/preprocessing/movie_review_lexicon_400.csv") -> dict[str, float]:
+def _resolve_path(lexicon_path: str) -> str:
+    if not os.path.exists(lexicon_path):
+        # 실행 위치에 따른 상대 경로 폴백 설정
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        lexicon_path = os.path.join(base_dir, "review_analysis", "preprocessing", "movie_review_lexicon_400.csv")
+    return os.path.abspath(lexicon_path)
+
+
+def _compile(lexicon_path: str, mtime: float) -> CompiledLexicon:
+    df = pd.read_csv(lexicon_path, usecols=["word", "type"], dtype=str)
+    words = df["word"].astype(str).str.strip().str.lower()
+    weights = df["type"].astype(str).str.strip().str.lower().map(WEIGHT_MAP)
+
+    # 가중치 대상 타입만 남기고, 중복 단어는 마지막 항목을 사용합니다.
+    compiled = pd.DataFrame({"word": words, "weight": weights}).dropna(subset=["weight"])
+    compiled = compiled.drop_duplicates(subset="word", keep="last")
+    return CompiledLexicon(compiled["word"].to_numpy(dtype=object), compiled["weight"].to_numpy(), mtime)
+
+
+def get_lexicon(lexicon_path: str = DEFAULT_LEXICON_PATH) -> CompiledLexicon:
+    """
+    컴파일된 감정 어휘 사전을 반환합니다.
+    프로세스 안에서 한 번만 컴파일하며, 파일의 수정 시각(mtime)이 바뀌면 다시 컴파일합니다.
+
+    Args:
+        lexicon_path (str): 감정 어휘 사전 CSV 파일 경로.
+
+    Returns:
+        CompiledLexicon: 컴파일된 어휘 사전. 파일이 없으면 빈 사전을 반환합니다.
+    """
+    path = _resolve_path(lexicon_path)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        print(f"경고: {path}에서 어휘 사전 파일을 찾을 수 없습니다. 빈 사전을 반환합니다.")
+        return CompiledLexicon(np.array([], dtype=object), np.array([]))
+
+    with _compiled_lock:
+        lexicon = _compiled.get(path)
+        if lexicon is None or lexicon.mtime != mtime:
+            lexicon = _compile(path, mtime)
+            _compiled[path] = lexicon
+    return lexicon
+
+
+def load_lexicon(lexicon_path: str = DEFAULT_LEXICON_PATH) -> dict[str, float]:
     """
     주관성 분석을 위한 감정 어휘 사전을 로드하고 단어별 가중치 딕셔너리를 반환합니다.
-    
+
     가중치 기준:
         - strongsubj (강한 주관성): 2.0
         - verystrongsubj (매우 강한 주관성): 4.0
-        
+
     Args:
         lexicon_path (str): 감정 어휘 사전 CSV 파일 경로.
-        
+
     Returns:
         dict[str, float]: 단어를 키로, 주관성 가중치를 값으로 하는 딕셔너리.
     """
-    if not os.path.exists(lexicon_path):
-        # 실행 위치에 따른 상대 경로 폴백 설정
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        lexicon_path = os.path.join(base_dir, "review_analysis", "preprocessing", "movie_review_lexicon_400.csv")
-    
-    try:
-        df = pd.read_csv(lexicon_path)
-    except FileNotFoundError:
-        print(f"경고: {lexicon_path}에서 어휘 사전 파일을 찾을 수 없습니다. 빈 사전을 반환합니다.")
-        return {}
-    
-    # 관련 타입 필터링 및 가중치 매핑
-    weight_map = {
-        "strongsubj": 2.0,
-        "verystrongsubj": 4.0
-    }
-    
-    lexicon_dict = {}
-    
-    for _, row in df.iterrows():
-        word = str(row['word']).strip().lower()
-        subj_type = str(row['type']).strip().lower()
-        
-        if subj_type in weight_map:
-            lexicon_dict[word] = weight_map[subj_type]
-            
-    return lexicon_dict
+    return get_lexicon(lexicon_path).as_dict()
@@ -1,7 +1,9 @@
 import os
 import glob
+import time
 from argparse import ArgumentParser
-from typing import Dict, Type
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Type
 import sys
 # Project root 추가하여 실행 시 파일 경로 문제 해결
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -35,8 +37,74 @@ def create_parser() -> ArgumentParser:
                         help=f"Which processor to use. Choices: {', '.join(PREPROCESS_CLASSES.keys())}")
     parser.add_argument('-a', '--all', action='store_true',
                         help="Run all data preprocessors. Default to False.")    
+    parser.add_argument('-j', '--jobs', type=int, required=False, default=None,
+                        help="Max number of sites preprocessed in parallel with --all. Default: one process per site.")
+    parser.add_argument('--lang-workers', type=int, required=False, default=None,
+                        help="Language detection worker processes per site. Default: CPU cores divided by --jobs.")
+    parser.add_argument('--lang-cache', type=str, required=False, default=None,
+                        help="Language detection cache file. Default: <output_dir>/langdetect_cache.sqlite")
+    parser.add_argument('--lang-prefilter', action='store_true',
+                        help="Classify obvious ASCII English reviews without langdetect. Default to False.")
+    parser.add_argument('-f', '--format', type=str, required=False, default="csv", choices=["csv", "parquet"],
+                        help="Output format. parquet writes <output_dir>/preprocessed_reviews partitioned by site and year_month. Default: csv")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only preprocess rows not in the per-site manifest and merge them into the existing output.")
+    parser.add_argument('--chunk-size', type=int, required=False, default=None,
+                        help="Stream the input CSV in chunks of this many rows to bound memory. Default: load the whole file.")
     return parser
 
+
+def run_preprocessor(base_name: str, csv_file: str, output_dir: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    사이트 하나의 전처리 파이프라인을 실행하고 소요 시간과 오류를 반환합니다.
+    병렬 실행 시 워커 프로세스에서 호출되므로 예외를 밖으로 던지지 않습니다.
+    """
+    started = time.perf_counter()
+    try:
+        preprocessor = PREPROCESS_CLASSES[base_name](csv_file, output_dir)
+        preprocessor.lang_workers = options["lang_workers"]
+        preprocessor.lang_cache_path = options["lang_cache_path"]
+        preprocessor.lang_prefilter = options["lang_prefilter"]
+        preprocessor.output_format = options["output_format"]
+        preprocessor.tfidf_model_path = os.path.join(output_dir, f"tfidf_{preprocessor.site_name}.json")
+        if options["incremental"]:
+            rows = preprocessor.run_incremental()["rows"]
+        elif options["chunk_size"]:
+            rows = preprocessor.run_streaming(chunk_size=options["chunk_size"])
+        else:
+            preprocessor.preprocess()
+            preprocessor.feature_engineering()
+            preprocessor.save_to_database()
+            rows = len(preprocessor.processed_df())
+        error = None
+    except Exception as e:
+        rows = 0
+        error = f"{type(e).__name__}: {e}"
+    return {"name": base_name, "rows": rows, "seconds": time.perf_counter() - started, "error": error}
+
+
+def run_all(targets: Dict[str, str], output_dir: str, options: Dict[str, Any], jobs: int) -> list:
+    """
+    여러 사이트를 사이트별 워커 프로세스에서 최대 jobs개씩 동시에 전처리합니다.
+    한 사이트가 실패해도 나머지 사이트는 계속 진행됩니다.
+    """
+    if jobs <= 1 or len(targets) <= 1:
+        return [run_preprocessor(name, csv_file, output_dir, options) for name, csv_file in targets.items()]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(run_preprocessor, name, csv_file, output_dir, options)
+            for name, csv_file in targets.items()
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "실패" if result["error"] else "완료"
+            print(f"[정보] {result['name']} {status} ({result['seconds']:.1f}s)")
+            results.append(result)
+    return results
+
+
 if __name__ == "__main__":
 
     parser = create_parser()
@@ -44,13 +112,35 @@ if __name__ == "__main__":
 
     os.makedirs(args.output_dir, exist_ok=True)
 
-    if args.all: 
-        for csv_file in REVIEW_COLLECTIONS:
-            base_name = os.path.splitext(os.path.basename(csv_file))[0]
-            if base_name in PREPROCESS_CLASSES:
-                preprocessor_class = PREPROCESS_CLASSES[base_name]
-                preprocessor = preprocessor_class(csv_file, args.output_dir)
-                preprocessor.preprocess()
-                preprocessor.feature_engineering()
-                preprocessor.save_to_database()
+    raw_files = {os.path.splitext(os.path.basename(csv_file))[0]: csv_file for csv_file in REVIEW_COLLECTIONS}
+    if args.all:
+        targets = {name: csv_file for name, csv_file in raw_files.items() if name in PREPROCESS_CLASSES}
+    elif args.preprocessor:
+        if args.preprocessor not in raw_files:
+            raise FileNotFoundError(f"{args.preprocessor}.csv 파일을 찾을 수 없습니다.")
+        targets = {args.preprocessor: raw_files[args.preprocessor]}
+    else:
+        raise ValueError("No preprocessors.")
+
+    jobs = max(1, min(args.jobs or len(targets), len(targets)))
+    options = {
+        "lang_workers": args.lang_workers or max(1, (os.cpu_count() or 1) // jobs),
+        "lang_cache_path": args.lang_cache or os.path.join(args.output_dir, "langdetect_cache.sqlite"),
+        "lang_prefilter": args.lang_prefilter,
+        "chunk_size": args.chunk_size,
+        "output_format": args.format,
+        "incremental": args.incremental,
+    }
+
+    started = time.perf_counter()
+    results = run_all(targets, args.output_dir, options, jobs)
+
+    for result in sorted(results, key=lambda r: r["name"]):
+        if result["error"]:
+            print(f"[오류] {result['name']}: {result['error']} ({result['seconds']:.1f}s)")
+        else:
+            print(f"[정보] {result['name']}: {result['rows']}행 저장 ({result['seconds']:.1f}s)")
+    print(f"[정보] 전체 소요 시간 {time.perf_counter() - started:.1f}s")
 
+    if any(result["error"] for result in results):
+        sys.exit(1)
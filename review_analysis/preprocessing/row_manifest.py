@@ -0,0 +1,59 @@
+from __future__ import annotations
+from typing import Iterable
+import json
+import os
+import pandas as pd # type: ignore
+
+
+def row_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    원본 행마다 내용 해시를 계산합니다.
+    내용이 완전히 같은 행이 여러 개 있으면 등장 순서 번호를 붙여 서로 다른 키를 갖게 합니다.
+
+    Args:
+        df: 원본 리뷰 데이터프레임
+
+    Returns:
+        pd.Series: df와 같은 인덱스를 가진 "해시-순번" 문자열 Series
+    """
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=object)
+    # 청크마다 dtype 추론이 달라져도 같은 행은 같은 해시가 되도록 문자열로 맞춘 뒤 해시합니다.
+    hashed = pd.util.hash_pandas_object(df.astype(str), index=False)
+    base = hashed.map("{:016x}".format)
+    occurrence = base.groupby(base).cumcount()
+    return base + "-" + occurrence.astype(str)
+
+
+class RowManifest:
+    """
+    사이트별로 이미 전처리한 원본 행의 해시 목록을 저장하는 매니페스트입니다.
+    """
+
+    def __init__(self, path: str, hashes: Iterable[str] = ()):
+        self.path = path
+        self.hashes: set[str] = set(hashes)
+
+    @classmethod
+    def load(cls, path: str) -> "RowManifest":
+        """매니페스트 파일을 읽습니다. 파일이 없으면 빈 매니페스트를 반환합니다."""
+        if not os.path.exists(path):
+            return cls(path)
+        with open(path, encoding="utf-8") as f:
+            return cls(path, json.load(f)["row_hashes"])
+
+    def diff(self, current: Iterable[str]) -> tuple[set[str], set[str]]:
+        """
+        현재 원본 행 해시와 비교해 (새로 생긴 행, 사라진 행) 해시 집합을 반환합니다.
+        """
+        current = set(current)
+        return current - self.hashes, self.hashes - current
+
+    def save(self, hashes: Iterable[str]) -> None:
+        """현재 원본 행 해시 목록으로 매니페스트를 갱신합니다."""
+        self.hashes = set(hashes)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"row_hashes": sorted(self.hashes)}, f)
+        os.replace(tmp_path, self.path)
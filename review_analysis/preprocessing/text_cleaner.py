@@ -0,0 +1,96 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Callable, Iterable
+import re
+import pandas as pd # type: ignore
+
+_NON_ALPHA = re.compile(r"[^a-z\s]")
+
+
+class TextCleaner:
+    """
+    리뷰 텍스트를 Series 단위로 일괄 정제하는 엔진입니다.
+
+    정규식은 모듈 로드 시 한 번만 컴파일하고, 불용어 집합은 생성 시 한 번만 만듭니다.
+    대부분의 토큰이 리뷰 사이에서 반복되므로 토큰별 정제 결과(불용어 여부 + 표제어)를
+    크기가 제한된 LRU 캐시에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        stop_words: Iterable[str],
+        lemmatize: Callable[[str], str],
+        cache_size: int = 100_000,
+    ):
+        """
+        Args:
+            stop_words: 제거할 불용어 목록
+            lemmatize: 토큰을 표제어로 바꾸는 함수 (예: WordNetLemmatizer().lemmatize)
+            cache_size: 토큰 캐시의 최대 크기
+        """
+        stop_set = frozenset(stop_words)
+
+        def normalize_token(token: str) -> str:
+            # 불용어는 빈 문자열로 표시해 join 단계에서 걸러냅니다.
+            if token in stop_set:
+                return ""
+            return lemmatize(token)
+
+        self.stop_words = stop_set
+        self._normalize_token = lru_cache(maxsize=cache_size)(normalize_token)
+
+    def clean(self, text: str) -> str:
+        """
+        리뷰 한 건을 정제합니다. 소문자 변환, 특수문자 제거, 불용어 제거, 어간 추출을 수행합니다.
+
+        Args:
+            text: 원본 리뷰 텍스트
+
+        Returns:
+            str: 정제된 리뷰 텍스트
+        """
+        if not isinstance(text, str):
+            return ""
+        normalize = self._normalize_token
+        tokens = (normalize(token) for token in _NON_ALPHA.sub(" ", text.lower()).split())
+        return " ".join(token for token in tokens if token)
+
+    def clean_series(self, texts: pd.Series) -> pd.Series:
+        """
+        리뷰 Series 전체를 정제합니다. 중복 리뷰는 한 번만 정제합니다.
+
+        Args:
+            texts: 원본 리뷰 텍스트 Series
+
+        Returns:
+            pd.Series: 입력과 같은 인덱스를 가진 정제된 텍스트 Series
+        """
+        if texts.empty:
+            return pd.Series([], index=texts.index, dtype=object)
+
+        is_text = texts.map(lambda value: isinstance(value, str))
+        lowered = texts.where(is_text, "").astype(str).str.lower()
+        stripped = lowered.str.replace(_NON_ALPHA, " ", regex=True)
+
+        normalize = self._normalize_token
+        cleaned: dict[str, str] = {}
+        for text in stripped.unique():
+            tokens = (normalize(token) for token in text.split())
+            cleaned[text] = " ".join(token for token in tokens if token)
+
+        return stripped.map(cleaned)
+
+    def cache_info(self):
+        """토큰 캐시의 hit/miss 통계를 반환합니다."""
+        return self._normalize_token.cache_info()
+
+
+def english_cleaner(cache_size: int = 100_000) -> TextCleaner:
+    """
+    NLTK 영어 불용어와 WordNet 표제어 추출기로 TextCleaner를 만듭니다.
+    NLTK 리소스(stopwords, wordnet)가 미리 설치되어 있어야 합니다.
+    """
+    from nltk.corpus import stopwords # type: ignore
+    from nltk.stem import WordNetLemmatizer # type: ignore
+
+    return TextCleaner(stopwords.words("english"), WordNetLemmatizer().lemmatize, cache_size)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+from typing import Iterable
+import json
+import os
+import numpy as np
+from scipy import sparse # type: ignore
+from sklearn.feature_extraction.text import CountVectorizer # type: ignore
+
+TOKEN_PATTERN = r"(?u)\b\w+\b"
+
+
+class IdfModel:
+    """
+    코퍼스 단위 IDF 모델입니다.
+
+    단어별 문서 빈도(document frequency)와 전체 문서 수만 저장하므로 새 배치가 들어올 때
+    partial_fit으로 누적 갱신할 수 있고, transform은 학습 없이 배치 크기에 비례하는 비용으로 동작합니다.
+    계산식은 TfidfVectorizer(token_pattern=TOKEN_PATTERN, norm=None)의 기본값
+    (smooth_idf=True, sublinear_tf=False)과 같습니다.
+    """
+
+    def __init__(self) -> None:
+        # fit으로 어휘를 새로 만들 때마다 1씩 늘어납니다. partial_fit은 어휘 끝에 단어를 추가하기만 하므로 그대로입니다.
+        self.generation = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.n_docs = 0
+        self.vocabulary_: dict[str, int] = {}
+        self._doc_freq = np.zeros(0, dtype=np.int64)
+        self._vectorizer: CountVectorizer | None = None
+        self._feature_names: np.ndarray | None = None
+
+    def fit(self, docs: Iterable[str]) -> "IdfModel":
+        """기존 통계를 버리고 docs로 새로 학습합니다."""
+        self.generation += 1
+        self._reset()
+        return self.partial_fit(docs)
+
+    def partial_fit(self, docs: Iterable[str]) -> "IdfModel":
+        """
+        docs의 문서 빈도를 기존 통계에 더합니다. 새 단어는 어휘 사전 끝에 추가됩니다.
+        """
+        docs = list(docs)
+        if not docs:
+            return self
+
+        counter = CountVectorizer(token_pattern=TOKEN_PATTERN, binary=True)
+        try:
+            presence = counter.fit_transform(docs)
+        except ValueError:
+            # 배치 전체에 단어가 하나도 없는 경우: 문서 수만 반영합니다.
+            self.n_docs += len(docs)
+            return self
+
+        batch_terms = counter.get_feature_names_out()
+        batch_freq = np.asarray(presence.sum(axis=0)).ravel()
+
+        new_terms = [term for term in batch_terms if term not in self.vocabulary_]
+        if new_terms:
+            start = len(self.vocabulary_)
+            for offset, term in enumerate(new_terms):
+                self.vocabulary_[term] = start + offset
+            self._doc_freq = np.concatenate([self._doc_freq, np.zeros(len(new_terms), dtype=np.int64)])
+            self._vectorizer = None
+            self._feature_names = None
+
+        indices = np.fromiter((self.vocabulary_[term] for term in batch_terms), dtype=np.int64, count=len(batch_terms))
+        self._doc_freq[indices] += batch_freq
+        self.n_docs += len(docs)
+        return self
+
+    @property
+    def idf_(self) -> np.ndarray:
+        return np.log((1 + self.n_docs) / (1 + self._doc_freq)) + 1.0
+
+    def feature_names(self) -> np.ndarray:
+        """어휘 사전 인덱스 순서의 단어 배열을 반환합니다."""
+        if self._feature_names is None:
+            names = np.empty(len(self.vocabulary_), dtype=object)
+            for term, index in self.vocabulary_.items():
+                names[index] = term
+            self._feature_names = names
+        return self._feature_names
+
+    def transform(self, docs: Iterable[str]) -> sparse.csr_matrix:
+        """
+        학습된 IDF로 docs의 TF-IDF 행렬을 계산합니다. 어휘 사전에 없는 단어는 무시됩니다.
+
+        Raises:
+            ValueError: 어휘 사전이 비어 있는 경우
+        """
+        if not self.vocabulary_:
+            raise ValueError("IDF 모델의 어휘 사전이 비어 있습니다.")
+        if self._vectorizer is None:
+            self._vectorizer = CountVectorizer(token_pattern=TOKEN_PATTERN, vocabulary=self.vocabulary_)
+        counts = self._vectorizer.transform(list(docs))
+        return sparse.csr_matrix(counts.multiply(self.idf_))
+
+    def save(self, path: str) -> None:
+        """모델을 JSON 파일로 저장합니다. 임시 파일에 쓴 뒤 교체하므로 중간 상태가 남지 않습니다."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        payload = {
+            "n_docs": self.n_docs,
+            "terms": self.feature_names().tolist(),
+            "doc_freq": self._doc_freq.tolist(),
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IdfModel":
+        """save로 저장한 모델을 불러옵니다."""
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+        model = cls()
+        model.n_docs = int(payload["n_docs"])
+        model.vocabulary_ = {term: index for index, term in enumerate(payload["terms"])}
+        model._doc_freq = np.asarray(payload["doc_freq"], dtype=np.int64)
+        return model
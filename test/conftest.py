@@ -0,0 +1,61 @@
+import pytest
+from review_analysis.preprocessing.text_cleaner import TextCleaner
+
+
+# NLTK 말뭉치 다운로드 없이 전처리기를 실행하기 위한 최소 불용어/표제어 설정
+TEST_STOP_WORDS = {"the", "a", "an", "is", "and", "of", "to", "it", "this", "i", "in", "was"}
+
+
+def _test_nltk_install(self) -> None:
+    if self._cleaner is None:
+        self._stop_words = set(TEST_STOP_WORDS)
+        self._cleaner = TextCleaner(self._stop_words, lambda token: token[:-1] if token.endswith("s") else token)
+
+
+@pytest.fixture
+def offline_nltk(monkeypatch):
+    from review_analysis.preprocessing.imdb_processor import IMDbProcessor
+    from review_analysis.preprocessing.letterboxd_processor import LetterboxdProcessor
+    from review_analysis.preprocessing.rottentomatoes_processor import RottenTomatoesProcessor
+
+    for cls in (IMDbProcessor, LetterboxdProcessor, RottenTomatoesProcessor):
+        monkeypatch.setattr(cls, "nltk_install", _test_nltk_install)
+
+
+def _ignore_bulk_sort(monkeypatch) -> None:
+    """최신 pymongo가 bulk_write에 넘기는 sort 인자를 mongomock이 받지 못하므로 무시하도록 맞춥니다."""
+    from mongomock.collection import BulkOperationBuilder
+
+    add_update = BulkOperationBuilder.add_update
+
+    def add_update_without_sort(self, *args, sort=None, **kwargs):
+        return add_update(self, *args, **kwargs)
+
+    monkeypatch.setattr(BulkOperationBuilder, "add_update", add_update_without_sort)
+
+
+@pytest.fixture
+def mongo_db(monkeypatch):
+    """mongomock 기반 테스트 DB"""
+    mongomock = pytest.importorskip("mongomock")
+    _ignore_bulk_sort(monkeypatch)
+    return mongomock.MongoClient().get_database("test")
+
+
+def _awaitable_aggregate(monkeypatch, collection_class) -> None:
+    """AsyncMongoClient의 aggregate는 커서를 돌려주는 코루틴이므로 mongomock_motor도 await할 수 있게 맞춥니다."""
+    aggregate = collection_class.aggregate
+
+    async def aggregate_async(self, *args, **kwargs):
+        return aggregate(self, *args, **kwargs)
+
+    monkeypatch.setattr(collection_class, "aggregate", aggregate_async)
+
+
+@pytest.fixture
+def async_mongo_db(monkeypatch):
+    """mongomock 기반 비동기 테스트 DB (AsyncMongoClient 대신 사용)"""
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    _ignore_bulk_sort(monkeypatch)
+    _awaitable_aggregate(monkeypatch, mongomock_motor.AsyncMongoMockCollection)
+    return mongomock_motor.AsyncMongoMockClient().get_database("test")
@@ -0,0 +1,135 @@
+import asyncio
+import os
+import time
+import pandas as pd
+import pytest
+from app.review import async_review_service
+from app.review.async_review_service import AsyncReviewService
+from app.review.processor_pool import ProcessorPool
+from app.review.review_query import ReviewFilters
+from app.review.review_service import PROCESSOR_MAP, ReviewService
+
+DATABASE_DIR = os.path.join(os.path.dirname(__file__), "..", "database")
+
+
+@pytest.fixture
+def make_pool(tmp_path, offline_nltk, monkeypatch):
+    from review_analysis.preprocessing.base_processor import BaseDataProcessor
+
+    monkeypatch.setattr(BaseDataProcessor, "lang_workers", 1)
+    monkeypatch.setattr(BaseDataProcessor, "lang_cache_path", None)
+    return lambda name: ProcessorPool(PROCESSOR_MAP, str(tmp_path / name))
+
+
+def raw_records(n):
+    return pd.read_csv(os.path.join(DATABASE_DIR, "reviews_imdb.csv")).head(n).to_dict("records")
+
+
+def comparable(docs):
+    drop = {"_id", "source_id", "created_at", "updated_at"}
+    return sorted(({k: v for k, v in doc.items() if k not in drop} for doc in docs), key=lambda d: d["comment"])
+
+
+def test_async_preprocess_matches_sync(mongo_db, async_mongo_db, make_pool):
+    mongo_db["REVIEW_imdb"].insert_many(raw_records(25))
+    sync_result = ReviewService(mongo_db, make_pool("sync")).preprocess_site("imdb", batch_size=10)
+
+    async def run():
+        await async_mongo_db["REVIEW_imdb"].insert_many(raw_records(25))
+        service = AsyncReviewService(async_mongo_db, make_pool("async"))
+        result = await service.preprocess_site("imdb", batch_size=10)
+        docs = await async_mongo_db["PREPROCESSED_REVIEW_imdb"].find().to_list(None)
+        monthly = await service.monthly_summary("imdb")
+        return result, docs, monthly
+
+    async_result, async_docs, async_monthly = asyncio.run(run())
+
+    assert async_result["batches"] == sync_result["batches"]
+    assert comparable(async_docs) == comparable(mongo_db["PREPROCESSED_REVIEW_imdb"].find())
+    assert async_monthly == ReviewService(mongo_db, None).monthly_summary("imdb")
+
+
+
+def test_async_monthly_rollup_is_retry_safe(async_mongo_db, make_pool):
+    async def run():
+        await async_mongo_db["REVIEW_imdb"].insert_many(raw_records(20))
+        service = AsyncReviewService(async_mongo_db, make_pool("async"))
+        first = await service.preprocess_site("imdb", batch_size=8)
+        expected = await service.monthly_summary("imdb")
+
+        await async_mongo_db["MONTHLY_REVIEW_imdb"].drop()
+        await async_mongo_db["REVIEW_imdb"].update_many({}, {"$unset": {"preprocessed": ""}})
+        await service.preprocess_site("imdb", batch_size=8)
+        after_skipped_rollup = await service.monthly_summary("imdb")
+
+        await async_mongo_db["REVIEW_imdb"].update_many({}, {"$unset": {"preprocessed": ""}})
+        await service.preprocess_site("imdb", batch_size=8)
+        return first, expected, after_skipped_rollup, await service.monthly_summary("imdb")
+
+    first, expected, after_skipped_rollup, after_retry = asyncio.run(run())
+
+    # 재처리하면 IDF 통계가 바뀌어 주관성 점수는 달라질 수 있으므로 리뷰 수와 평점만 비교합니다.
+    def counts(summary):
+        return [(m["year_month"], m["count"], m["avg_rating"]) for m in summary["months"]]
+
+    assert sum(m["count"] for m in expected["months"]) == first["processed_inserted"]
+    assert counts(after_skipped_rollup) == counts(expected)
+    assert counts(after_retry) == counts(expected)
+
+def test_async_list_reviews_pages(async_mongo_db):
+    async def run():
+        await async_mongo_db["PREPROCESSED_REVIEW_imdb"].insert_many([
+            {"source_id": i, "date": pd.Timestamp("2025-01-01").to_pydatetime(), "language": "en"} for i in range(5)
+        ])
+        service = AsyncReviewService(async_mongo_db, None)
+        first = await service.list_reviews("imdb", ReviewFilters(language="en"), limit=3)
+        second = await service.list_reviews("imdb", ReviewFilters(language="en"), limit=3, cursor=first["next_cursor"])
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first["count"] == 3 and second["count"] == 2
+    assert second["next_cursor"] is None
+    assert {i["source_id"] for i in first["items"] + second["items"]} == set(range(5))
+
+
+def test_reads_are_served_while_preprocessing(async_mongo_db, make_pool, monkeypatch):
+    transform_batch = async_review_service.transform_batch
+
+    def slow_transform(*args):
+        time.sleep(0.3)
+        return transform_batch(*args)
+
+    monkeypatch.setattr(async_review_service, "transform_batch", slow_transform)
+
+    async def run():
+        await async_mongo_db["REVIEW_imdb"].insert_many(raw_records(10))
+        service = AsyncReviewService(async_mongo_db, make_pool("async"))
+        finished = []
+
+        async def preprocess():
+            await service.preprocess_site("imdb", batch_size=10)
+            finished.append("preprocess")
+
+        async def read():
+            await asyncio.sleep(0.05)
+            await service.list_reviews("imdb", ReviewFilters(), limit=10)
+            finished.append("read")
+
+        await asyncio.gather(preprocess(), read())
+        return finished
+
+    assert asyncio.run(run()) == ["read", "preprocess"]
+
+
+def test_async_export_batches(async_mongo_db):
+    async def run():
+        await async_mongo_db["PREPROCESSED_REVIEW_imdb"].insert_many([
+            {"source_id": i, "date": pd.Timestamp("2025-01-01").to_pydatetime(), "rating": float(i)} for i in range(5)
+        ])
+        service = AsyncReviewService(async_mongo_db, None)
+        return [batch async for batch in service.export_batches("imdb", ReviewFilters(), batch_size=2)]
+
+    batches = asyncio.run(run())
+
+    assert [len(b) for b in batches] == [2, 2, 1]
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from app.dependencies import get_user_service
+from app.main import app
+from app.user.async_user_repository import AsyncUserRepository
+from app.user.async_user_service import AsyncUserService
+from app.user.password_hasher import PasswordHasher
+from app.user.user_schema import User, UserLogin, UserUpdate
+from database.pool_metrics import TimedAsyncAdaptedQueuePool, pool_stats
+
+pytest.importorskip("aiosqlite")
+
+CREATE_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS users (
+    email TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    username TEXT NOT NULL
+);
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "users.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(CREATE_TABLE_QUERY)
+    return path
+
+
+@pytest.fixture
+def hasher():
+    # 테스트 속도를 위해 낮은 비용을 사용합니다.
+    return PasswordHasher(scrypt_n=2 ** 4)
+
+
+def run_with_service(db_path, hasher, scenario):
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                return await scenario(AsyncUserService(AsyncUserRepository(db), hasher))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def stored_password(db_path, email):
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute("SELECT password FROM users WHERE email=?", (email,)).fetchone()[0]
+
+
+def test_async_repository_crud(db_path, hasher):
+    user = User(email="a@example.com", password="pw", username="A")
+
+    async def scenario(service):
+        repo = service.repo
+        assert await repo.create_user(user) == user
+        assert await repo.create_user(user) is None
+        assert await repo.get_user_by_email(user.email) == user
+        assert (await repo.update_password(user.email, "new")).password == "new"
+        assert await repo.update_password("missing@example.com", "new") is None
+        assert (await repo.update_password(user.email, "known", username="A")).password == "known"
+        assert (await repo.get_user_by_email(user.email)).password == "known"
+        await repo.delete_user(user)
+        return await repo.get_user_by_email(user.email)
+
+    assert run_with_service(db_path, hasher, scenario) is None
+
+
+def test_async_service_register_login_update(db_path, hasher):
+    user = User(email="a@example.com", password="password123", username="A")
+
+    async def scenario(service):
+        await service.register_user(user)
+        with pytest.raises(ValueError, match="User already Exists."):
+            await service.register_user(user)
+        with pytest.raises(ValueError, match="Invalid ID/PW"):
+            await service.login(UserLogin(email=user.email, password="wrong"))
+        with pytest.raises(ValueError, match="User not Found."):
+            await service.update_user_pwd(UserUpdate(email="missing@example.com", new_password="x"))
+        await service.update_user_pwd(UserUpdate(email=user.email, new_password="changed"))
+        return await service.login(UserLogin(email=user.email, password="changed"))
+
+    logged_in = run_with_service(db_path, hasher, scenario)
+
+    assert hasher.verify("changed", logged_in.password)
+    assert stored_password(db_path, user.email) == logged_in.password
+
+
+def test_async_login_upgrades_plaintext_password(db_path, hasher):
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("INSERT INTO users VALUES ('old@example.com', 'plain', 'Old')")
+
+    async def scenario(service):
+        return await service.login(UserLogin(email="old@example.com", password="plain"))
+
+    run_with_service(db_path, hasher, scenario)
+
+    assert hasher.verify("plain", stored_password(db_path, "old@example.com"))
+
+
+def test_async_bulk_register_and_export(db_path, hasher):
+    rows = [
+        {"email": "b@example.com", "password": "pw-b", "username": "B"},
+        {"email": "not-an-email", "password": "pw", "username": "X"},
+        {"email": "a@example.com", "password": "pw-a", "username": "A"},
+        {"email": "b@example.com", "password": "pw", "username": "B2"},
+        {"email": "c@example.com", "password": "pw-c", "username": "C"},
+    ]
+
+    async def scenario(service):
+        await service.repo.create_user(User(email="c@example.com", password="x", username="C"))
+        result = await service.bulk_register(rows, chunk_size=2)
+        exported = b"".join([chunk async for chunk in service.export_users(batch_size=2)])
+        return result, exported
+
+    result, exported = run_with_service(db_path, hasher, scenario)
+
+    assert result.received == 5
+    assert result.inserted == 2
+    assert [(c.index, c.reason.split(":")[0]) for c in result.conflicts] == [
+        (1, "invalid"), (3, "duplicate in request"), (4, "already exists"),
+    ]
+    users = [json.loads(line) for line in exported.decode("utf-8").splitlines()]
+    assert [u["email"] for u in users] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert all(set(u) == {"email", "username"} for u in users)
+    assert hasher.verify("pw-b", stored_password(db_path, "b@example.com"))
+
+
+def test_bulk_register_hashes_on_bulk_executor(db_path, hasher):
+    threads = set()
+
+    class RecordingHasher(type(hasher)):
+        def hash(self, password):
+            threads.add(threading.current_thread().name)
+            return super().hash(password)
+
+    rows = [{"email": f"u{i}@example.com", "password": "pw", "username": "U"} for i in range(6)]
+    login_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="login")
+    bulk_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bulk")
+
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                service = AsyncUserService(
+                    AsyncUserRepository(db), RecordingHasher(scrypt_n=2 ** 4), login_executor, bulk_executor
+                )
+                return await service.bulk_register(rows)
+        finally:
+            await engine.dispose()
+
+    try:
+        result = asyncio.run(run())
+    finally:
+        login_executor.shutdown()
+        bulk_executor.shutdown()
+
+    assert result.inserted == 6
+    assert threads and all(name.startswith("bulk") for name in threads)
+
+
+def test_concurrent_logins_share_small_async_pool(db_path, hasher):
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("INSERT INTO users VALUES (?, ?, 'A')", ("a@example.com", hasher.hash("pw")))
+
+    async def run():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{db_path}", poolclass=TimedAsyncAdaptedQueuePool, pool_size=2, max_overflow=0
+        )
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def login():
+            async with sessions() as db:
+                service = AsyncUserService(AsyncUserRepository(db), hasher)
+                return await service.login(UserLogin(email="a@example.com", password="pw"))
+
+        try:
+            users = await asyncio.gather(*(login() for _ in range(20)))
+            return users, pool_stats(engine.sync_engine)
+        finally:
+            await engine.dispose()
+
+    users, stats = asyncio.run(run())
+
+    assert {user.email for user in users} == {"a@example.com"}
+    assert stats["pool_class"] == "TimedAsyncAdaptedQueuePool"
+    assert stats["checkouts"] == 20
+    assert stats["checked_out"] == 0
+    assert stats["timeouts"] == 0
+
+
+def test_user_routes_with_async_service(db_path, hasher):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def async_user_service():
+        async with sessions() as db:
+            yield AsyncUserService(AsyncUserRepository(db), hasher)
+
+    app.dependency_overrides[get_user_service] = async_user_service
+    try:
+        client = TestClient(app)
+        user = {"email": "a@example.com", "password": "pw", "username": "A"}
+
+        assert client.post("/api/user/register", json=user).status_code == 201
+        assert client.post("/api/user/register", json=user).status_code == 400
+        assert client.post("/api/user/login", json={"email": "a@example.com", "password": "pw"}).status_code == 200
+        response = client.put("/api/user/update-password", json={"email": "a@example.com", "new_password": "pw2"})
+        assert response.status_code == 200
+        assert hasher.verify("pw2", stored_password(db_path, "a@example.com"))
+        response = client.post("/api/user/bulk", json=[{"email": "b@example.com", "password": "pw", "username": "B"}])
+        assert response.json()["data"]["inserted"] == 1
+        exported = client.get("/api/user/export").text.splitlines()
+        assert [json.loads(line)["email"] for line in exported] == ["a@example.com", "b@example.com"]
+        assert client.request("DELETE", "/api/user/delete", json={"email": "a@example.com"}).status_code == 200
+        assert client.request("DELETE", "/api/user/delete", json={"email": "a@example.com"}).status_code == 404
+    finally:
+        app.dependency_overrides = {}
@@ -0,0 +1,169 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from review_analysis.preprocessing.imdb_processor import IMDbProcessor
+from review_analysis.preprocessing.letterboxd_processor import LetterboxdProcessor
+
+DATABASE_DIR = os.path.join(os.path.dirname(__file__), "..", "database")
+
+
+@pytest.fixture
+def imdb_sample(tmp_path):
+    path = tmp_path / "reviews_imdb.csv"
+    pd.read_csv(os.path.join(DATABASE_DIR, "reviews_imdb.csv")).head(120).to_csv(path, index=False)
+    return str(path)
+
+
+def run_in_memory(processor_cls, input_path, output_dir):
+    processor = processor_cls(input_path, output_dir)
+    processor.lang_workers = 1
+    processor.preprocess()
+    processor.feature_engineering()
+    processor.save_to_database()
+    return pd.read_csv(processor.output_file())
+
+
+def test_output_file_name(tmp_path):
+    processor = IMDbProcessor("database/reviews_imdb.csv", str(tmp_path))
+    assert processor.output_file() == os.path.join(str(tmp_path), "preprocessed_reviews_imdb.csv")
+
+
+def test_streaming_matches_in_memory(offline_nltk, imdb_sample, tmp_path):
+    expected = run_in_memory(IMDbProcessor, imdb_sample, str(tmp_path / "memory"))
+
+    processor = IMDbProcessor(imdb_sample, str(tmp_path / "stream"))
+    processor.lang_workers = 1
+    written = processor.run_streaming(chunk_size=25)
+    actual = pd.read_csv(processor.output_file())
+
+    assert written == len(expected)
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(
+        actual.drop(columns=["subjectivity_score"]), expected.drop(columns=["subjectivity_score"])
+    )
+    np.testing.assert_allclose(actual["subjectivity_score"], expected["subjectivity_score"])
+
+
+def test_streaming_with_frozen_model(offline_nltk, imdb_sample, tmp_path):
+    model_path = str(tmp_path / "tfidf_imdb.json")
+    fitted = IMDbProcessor(imdb_sample, str(tmp_path / "fit"))
+    fitted.lang_workers = 1
+    fitted.tfidf_model_path = model_path
+    fitted.run_streaming(chunk_size=40)
+
+    frozen = IMDbProcessor(imdb_sample, str(tmp_path / "frozen"))
+    frozen.lang_workers = 1
+    frozen.tfidf_model_path = model_path
+    frozen.tfidf_mode = "frozen"
+    frozen.run_streaming(chunk_size=40)
+
+    np.testing.assert_allclose(
+        pd.read_csv(frozen.output_file())["subjectivity_score"],
+        pd.read_csv(fitted.output_file())["subjectivity_score"],
+    )
+
+
+def test_frozen_mode_without_saved_model_raises(offline_nltk, imdb_sample, tmp_path):
+    processor = IMDbProcessor(imdb_sample, str(tmp_path))
+    processor.lang_workers = 1
+    processor.tfidf_model_path = str(tmp_path / "missing.json")
+    processor.tfidf_mode = "frozen"
+
+    with pytest.raises(ValueError, match="저장된 IDF 모델이 없습니다"):
+        processor.run_streaming(chunk_size=40)
+    assert not os.path.exists(processor.output_file())
+
+
+def test_streaming_letterboxd_renames_content(offline_nltk, tmp_path):
+    path = tmp_path / "reviews_letterboxd.csv"
+    pd.read_csv(os.path.join(DATABASE_DIR, "reviews_letterboxd.csv")).head(60).to_csv(path, index=False)
+
+    processor = LetterboxdProcessor(str(path), str(tmp_path))
+    processor.lang_workers = 1
+    processor.run_streaming(chunk_size=20)
+
+    assert "comment" in pd.read_csv(processor.output_file()).columns
+
+
+def test_streaming_parquet_matches_in_memory(offline_nltk, imdb_sample, tmp_path):
+    pytest.importorskip("pyarrow")
+    from review_analysis.preprocessing.columnar_store import read_parquet
+
+    expected = run_in_memory(IMDbProcessor, imdb_sample, str(tmp_path / "memory"))
+
+    processor = IMDbProcessor(imdb_sample, str(tmp_path / "stream"))
+    processor.lang_workers = 1
+    processor.output_format = "parquet"
+    processor.run_streaming(chunk_size=30)
+
+    columns = ["date", "comment", "subjectivity_score"]
+    actual = read_parquet(processor.parquet_dir(), columns=columns, sites=["imdb"])
+    assert actual["subjectivity_score"].dtype == "float32"
+
+    # Parquet은 year_month 파티션 순서로 읽히므로 같은 키로 정렬해 행을 맞춥니다.
+    expected = expected.assign(date=pd.to_datetime(expected["date"]))[columns]
+    actual = actual.sort_values(["date", "comment"], kind="stable").reset_index(drop=True)
+    expected = expected.sort_values(["date", "comment"], kind="stable").reset_index(drop=True)
+    assert len(actual) == len(expected)
+    np.testing.assert_array_equal(
+        actual["date"].to_numpy(dtype="datetime64[ns]"), expected["date"].to_numpy(dtype="datetime64[ns]")
+    )
+    assert actual["comment"].tolist() == expected["comment"].tolist()
+    # float32로 저장되므로 float32 정밀도 안에서 비교합니다.
+    np.testing.assert_allclose(actual["subjectivity_score"], expected["subjectivity_score"], rtol=1e-6, atol=1e-7)
+
+
+def assert_same_output(actual, expected):
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(
+        actual.drop(columns=["subjectivity_score"]),
+        expected.drop(columns=["subjectivity_score"]),
+        check_dtype=False,
+    )
+    np.testing.assert_allclose(actual["subjectivity_score"], expected["subjectivity_score"])
+
+
+def test_incremental_processes_only_delta(offline_nltk, tmp_path, monkeypatch):
+    raw = pd.read_csv(os.path.join(DATABASE_DIR, "reviews_imdb.csv")).head(90)
+    input_path = tmp_path / "reviews_imdb.csv"
+    output_dir = str(tmp_path / "out")
+
+    raw.head(60).to_csv(input_path, index=False)
+    processor = IMDbProcessor(str(input_path), output_dir)
+    processor.lang_workers = 1
+    first = processor.run_incremental()
+    assert first["added"] == 60
+
+    # 10행 삭제, 30행 추가
+    updated = pd.concat([raw.iloc[10:60], raw.iloc[60:90]], ignore_index=True)
+    updated.to_csv(input_path, index=False)
+
+    seen = []
+    original = IMDbProcessor.preprocess
+    monkeypatch.setattr(IMDbProcessor, "preprocess", lambda self, df=None: seen.append(len(df)) or original(self, df))
+
+    processor = IMDbProcessor(str(input_path), output_dir)
+    processor.lang_workers = 1
+    summary = processor.run_incremental()
+
+    assert summary == {"added": 30, "removed": 10, "rows": summary["rows"]}
+    assert seen == [30]
+
+    full = IMDbProcessor(str(input_path), str(tmp_path / "full"))
+    full.lang_workers = 1
+    full.run_incremental()
+
+    assert_same_output(pd.read_csv(processor.output_file()), pd.read_csv(full.output_file()))
+
+
+def test_incremental_without_changes_is_noop(offline_nltk, imdb_sample, tmp_path):
+    processor = IMDbProcessor(imdb_sample, str(tmp_path))
+    processor.lang_workers = 1
+    processor.run_incremental()
+
+    summary = IMDbProcessor(imdb_sample, str(tmp_path)).run_incremental()
+
+    assert summary["added"] == 0
+    assert summary["removed"] == 0
+    assert summary["rows"] == len(pd.read_csv(processor.output_file()))
@@ -0,0 +1,67 @@
+import os
+import pandas as pd
+import pytest
+from review_analysis.benchmark.main import compare
+from review_analysis.benchmark.stages import STAGES, run_stages
+from review_analysis.benchmark.synthetic import SCHEMAS, generate_reviews
+from review_analysis.preprocessing.letterboxd_processor import LetterboxdProcessor
+
+
+@pytest.mark.parametrize("site", list(SCHEMAS))
+def test_generate_reviews_schema(site):
+    df = generate_reviews(site, 200, seed=1)
+
+    assert list(df.columns) == SCHEMAS[site]
+    assert len(df) == 200
+    assert df["rating"].isna().sum() < 20
+
+
+def test_generate_reviews_is_deterministic():
+    pd.testing.assert_frame_equal(generate_reviews("imdb", 50, seed=3), generate_reviews("imdb", 50, seed=3))
+
+
+def test_run_stages_times_selected_stages(tmp_path):
+    input_path = tmp_path / "reviews_letterboxd.csv"
+    generate_reviews("letterboxd", 100).to_csv(input_path, index=False)
+    ctx = {"site": "letterboxd", "input_path": str(input_path), "work_dir": str(tmp_path), "output_format": "csv"}
+
+    timings = run_stages(ctx, ["dropna_filter", "word_counts", "tfidf_scoring", "save"])
+
+    assert list(timings) == ["load", "dropna_filter", "word_counts", "tfidf_scoring", "save"]
+    assert "subjectivity_score" in ctx["df"].columns
+    assert os.path.exists(ctx["processor"].output_file())
+
+
+def test_stages_match_processor_output(offline_nltk, tmp_path):
+    input_path = tmp_path / "reviews_letterboxd.csv"
+    generate_reviews("letterboxd", 150, seed=2).to_csv(input_path, index=False)
+    ctx = {"site": "letterboxd", "input_path": str(input_path), "work_dir": str(tmp_path), "lang_workers": 1}
+
+    run_stages(ctx, list(STAGES))
+
+    processor = LetterboxdProcessor(str(input_path), str(tmp_path / "processor"))
+    processor.lang_workers = 1
+    processor.preprocess()
+    processor.feature_engineering()
+    pd.testing.assert_frame_equal(ctx["df"], processor.df)
+
+
+def test_tfidf_scoring_handles_empty_vocabulary(tmp_path):
+    input_path = tmp_path / "reviews_imdb.csv"
+    pd.DataFrame({"rating": [5, 4], "date": ["2024-01-01", "2024-02-01"], "comment": ["! ? .", ". . ."]}).to_csv(
+        input_path, index=False
+    )
+    ctx = {"site": "imdb", "input_path": str(input_path), "work_dir": str(tmp_path)}
+
+    run_stages(ctx, ["tfidf_scoring"])
+
+    assert ctx["df"]["subjectivity_score"].tolist() == [0.0, 0.0]
+
+
+def test_compare_reports_regressions_over_threshold():
+    baseline = {"results": [{"site": "imdb", "rows": 1000, "stages": {"load": 1.0, "save": 0.01}}]}
+    current = {"results": [{"site": "imdb", "rows": 1000, "stages": {"load": 1.5, "save": 0.03}}]}
+
+    regressions = compare(current, baseline, threshold=0.2, min_seconds=0.05)
+
+    assert [(r["stage"], r["ratio"]) for r in regressions] == [("load", 1.5)]
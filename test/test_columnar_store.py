@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from review_analysis.preprocessing.columnar_store import read_parquet, to_columnar, write_parquet
+
+
+@pytest.fixture
+def processed():
+    df = pd.DataFrame(
+        {
+            "rating": [8.0, 3.0, 10.0],
+            "date": pd.to_datetime(["2016-03-01", "2016-03-15", "2016-04-02"]),
+            "comment": ["great fun movie", "boring long movie", "loved it a lot"],
+            "raw_word_count": [3, 3, 4],
+            "language": ["en", "en", "en"],
+            "clean_comment": ["great fun movie", "boring long movie", "loved lot"],
+        }
+    )
+    df["year_month"] = df["date"].dt.to_period("M")
+    df["clean_word_count"] = [3, 3, 2]
+    df["subjectivity_score"] = [1.25, 0.5, 2.0]
+    return df
+
+
+def test_to_columnar_dtypes(processed):
+    out = to_columnar(processed, "imdb")
+
+    assert str(out["date"].dtype).startswith("datetime64")
+    assert out["language"].dtype == "category"
+    assert out["year_month"].dtype == "category"
+    assert out["subjectivity_score"].dtype == "float32"
+    assert list(out["year_month"]) == ["2016-03", "2016-03", "2016-04"]
+
+
+def test_write_and_read_partitions(processed, tmp_path):
+    root = str(tmp_path / "dataset")
+    write_parquet(processed, root, "imdb")
+    write_parquet(processed.head(1), root, "letterboxd")
+
+    assert (tmp_path / "dataset" / "site=imdb" / "year_month=2016-03").is_dir()
+
+    march = read_parquet(root, columns=["rating", "subjectivity_score"], sites=["imdb"], year_months=["2016-03"])
+    assert list(march.columns) == ["rating", "subjectivity_score"]
+    assert sorted(march["rating"]) == [3.0, 8.0]
+    assert march["subjectivity_score"].dtype == "float32"
+
+    assert len(read_parquet(root)) == 4
+
+
+def test_replace_rewrites_site_partition(processed, tmp_path):
+    root = str(tmp_path / "dataset")
+    write_parquet(processed, root, "imdb")
+    write_parquet(processed.tail(1), root, "imdb")
+    write_parquet(processed.head(1), root, "imdb", replace=False, part=1)
+
+    assert len(read_parquet(root, sites=["imdb"])) == 2
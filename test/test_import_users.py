@@ -0,0 +1,11 @@
+import json
+from app.user.import_users import read_user_file
+
+
+def test_read_user_file_accepts_list_and_mapping(tmp_path):
+    as_list = tmp_path / "list.json"
+    as_list.write_text(json.dumps([{"email": "a@example.com", "password": "p", "username": "a"}]))
+    as_mapping = tmp_path / "mapping.json"
+    as_mapping.write_text(json.dumps({"a@example.com": {"password": "p", "username": "a"}}))
+
+    assert read_user_file(str(as_list)) == read_user_file(str(as_mapping))
@@ -0,0 +1,61 @@
+import pytest
+from review_analysis.preprocessing import language_detector
+from review_analysis.preprocessing.language_cache import LanguageCache, is_obvious_english, text_key
+from review_analysis.preprocessing.language_detector import detect_languages
+
+
+ENGLISH = "This is one of the best movies that I have seen in a long time and I loved it."
+FRENCH = "Cette film est vraiment magnifique et très drôle."
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LanguageCache(str(tmp_path / "lang.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_put_and_get_many(cache):
+    cache.put_many({text_key("a"): "en", text_key("b"): "fr"})
+
+    found = cache.get_many([text_key("a"), text_key("b"), text_key("c")])
+
+    assert found == {text_key("a"): "en", text_key("b"): "fr"}
+
+
+def test_cache_persists_on_disk(tmp_path):
+    path = str(tmp_path / "lang.sqlite")
+    first = LanguageCache(path)
+    first.put_many({text_key("a"): "en"})
+    first.close()
+
+    second = LanguageCache(path)
+    assert second.get_many([text_key("a")]) == {text_key("a"): "en"}
+    second.close()
+
+
+def test_detect_languages_only_detects_misses(cache, monkeypatch):
+    calls = []
+    original = language_detector._detect_chunk
+    monkeypatch.setattr(language_detector, "_detect_chunk", lambda texts: calls.append(list(texts)) or original(texts))
+
+    first = detect_languages([ENGLISH, FRENCH], n_workers=1, cache=cache)
+    second = detect_languages([FRENCH, ENGLISH, "Dieser Film ist wirklich wunderbar."], n_workers=1, cache=cache)
+
+    assert first == ["en", "fr"]
+    assert second[:2] == ["fr", "en"]
+    assert calls[1] == ["Dieser Film ist wirklich wunderbar."]
+    assert cache.stats() == {"hits": 2, "misses": 3, "prefiltered": 0}
+
+
+def test_prefilter_skips_langdetect(cache):
+    result = detect_languages([ENGLISH, FRENCH], n_workers=1, cache=cache, prefilter=True)
+
+    assert result == ["en", "fr"]
+    assert cache.stats() == {"hits": 0, "misses": 1, "prefiltered": 1}
+
+
+def test_is_obvious_english():
+    assert is_obvious_english(ENGLISH)
+    assert not is_obvious_english(FRENCH)
+    assert not is_obvious_english("great movie")
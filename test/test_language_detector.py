@@ -0,0 +1,38 @@
+import pytest
+from review_analysis.preprocessing.language_detector import detect_language, detect_languages
+
+
+TEXTS = [
+    "This movie was really fun and the animation is beautiful.",
+    "Cette film est vraiment magnifique et très drôle.",
+    "Esta película es muy divertida y los personajes son geniales.",
+    "ok",
+    "",
+    "Dieser Film ist wirklich wunderbar und sehr lustig.",
+] * 4
+
+
+def test_detect_language_unknown_for_empty_text():
+    assert detect_language("") == "unknown"
+
+
+def test_serial_detection_is_deterministic():
+    assert detect_languages(TEXTS, n_workers=1) == detect_languages(TEXTS, n_workers=1)
+
+
+def test_parallel_detection_matches_serial_and_keeps_order():
+    serial = detect_languages(TEXTS, n_workers=1)
+    parallel = detect_languages(TEXTS, n_workers=3, chunk_size=5)
+
+    assert parallel == serial
+    assert parallel[0] == "en"
+    assert parallel[4] == "unknown"
+
+
+def test_empty_input():
+    assert detect_languages([], n_workers=4) == []
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        detect_languages(TEXTS, chunk_size=0)
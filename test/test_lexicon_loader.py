@@ -0,0 +1,83 @@
+import os
+import numpy as np
+import pytest
+from review_analysis.preprocessing.lexicon_loader import get_lexicon, load_lexicon
+from review_analysis.preprocessing.tfidf_model import IdfModel
+
+
+@pytest.fixture
+def lexicon_file(tmp_path):
+    path = tmp_path / "lexicon.csv"
+    path.write_text(
+        "word,type,pos,polarity\n"
+        "Great,verystrongsubj,adj,positive\n"
+        "like,strongsubj,verb,positive\n"
+        "movie,weaksubj,noun,neutral\n"
+        "like,verystrongsubj,verb,positive\n"
+    )
+    return path
+
+
+def test_load_lexicon_filters_types_and_keeps_last_duplicate(lexicon_file):
+    assert load_lexicon(str(lexicon_file)) == {"great": 4.0, "like": 4.0}
+
+
+def test_get_lexicon_is_compiled_once(lexicon_file):
+    assert get_lexicon(str(lexicon_file)) is get_lexicon(str(lexicon_file))
+
+
+def test_get_lexicon_recompiles_when_mtime_changes(lexicon_file):
+    first = get_lexicon(str(lexicon_file))
+    lexicon_file.write_text("word,type\nawful,strongsubj\n")
+    os.utime(lexicon_file, (first.mtime + 10, first.mtime + 10))
+
+    second = get_lexicon(str(lexicon_file))
+
+    assert second is not first
+    assert second.as_dict() == {"awful": 2.0}
+
+
+def test_weights_for_aligns_to_vocabulary(lexicon_file):
+    lexicon = get_lexicon(str(lexicon_file))
+
+    weights = lexicon.weights_for(np.array(["movie", "great", "like", "zzz"], dtype=object))
+
+    np.testing.assert_allclose(weights, [0.5, 4.0, 4.0, 0.5])
+
+
+def test_weights_for_model_extends_cached_weights(lexicon_file, monkeypatch):
+    lexicon = get_lexicon(str(lexicon_file))
+    model = IdfModel().fit(["great movie", "zzz"])
+    computed = []
+    weights_for = lexicon.weights_for
+
+    def recording_weights_for(vocabulary, default):
+        computed.append(list(vocabulary))
+        return weights_for(vocabulary, default)
+
+    monkeypatch.setattr(lexicon, "weights_for", recording_weights_for)
+
+    first = lexicon.weights_for_model(model)
+    lexicon.weights_for_model(model)
+    model.partial_fit(["i like it", "great"])
+    second = lexicon.weights_for_model(model)
+
+    np.testing.assert_allclose(second, weights_for(model.feature_names(), 0.5))
+    np.testing.assert_allclose(second[:len(first)], first)
+    # 두 번째 호출은 캐시를 그대로 쓰고, partial_fit 이후에는 추가된 단어만 계산합니다.
+    assert computed == [list(model.feature_names()[:3]), list(model.feature_names()[3:])]
+    assert not second.flags.writeable
+
+
+def test_weights_for_model_recomputes_after_refit(lexicon_file):
+    lexicon = get_lexicon(str(lexicon_file))
+    model = IdfModel().fit(["great movie"])
+    lexicon.weights_for_model(model)
+
+    model.fit(["like zzz"])
+
+    np.testing.assert_allclose(lexicon.weights_for_model(model), lexicon.weights_for(model.feature_names()))
+
+
+def test_default_lexicon_loads():
+    assert len(get_lexicon()) > 0
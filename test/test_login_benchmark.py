@@ -0,0 +1,8 @@
+from app.user.login_benchmark import run_benchmark
+
+
+def test_run_benchmark_reports_each_setting():
+    results = run_benchmark("pbkdf2_sha256", [10, 20], workers=[1, 2], logins=4)
+
+    assert [(r["cost"], r["workers"]) for r in results] == [(10, 1), (10, 2), (20, 1), (20, 2)]
+    assert all(r["logins_per_sec"] > 0 and r["p95_ms"] >= 0 for r in results)
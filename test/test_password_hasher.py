@@ -0,0 +1,36 @@
+import pytest
+from app.user.password_hasher import PBKDF2, PasswordHasher
+
+
+@pytest.mark.parametrize("hasher", [PasswordHasher(scrypt_n=2 ** 4), PasswordHasher(algorithm=PBKDF2, pbkdf2_iterations=10)])
+def test_hash_and_verify(hasher):
+    encoded = hasher.hash("s3cret")
+
+    assert encoded != hasher.hash("s3cret")
+    assert hasher.verify("s3cret", encoded)
+    assert not hasher.verify("wrong", encoded)
+    assert not hasher.needs_rehash(encoded)
+    assert PasswordHasher.is_hashed(encoded)
+
+
+def test_plaintext_is_verified_and_flagged_for_rehash():
+    hasher = PasswordHasher(scrypt_n=2 ** 4)
+
+    assert hasher.verify("legacy", "legacy")
+    assert not hasher.verify("other", "legacy")
+    assert hasher.needs_rehash("legacy")
+    assert not PasswordHasher.is_hashed("legacy")
+
+
+def test_needs_rehash_when_settings_change():
+    old = PasswordHasher(algorithm=PBKDF2, pbkdf2_iterations=10).hash("pw")
+
+    assert PasswordHasher(algorithm=PBKDF2, pbkdf2_iterations=20).needs_rehash(old)
+    assert PasswordHasher(scrypt_n=2 ** 4).needs_rehash(old)
+    # 비용이 달라도 기존 해시는 그대로 검증됩니다.
+    assert PasswordHasher(algorithm=PBKDF2, pbkdf2_iterations=20).verify("pw", old)
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        PasswordHasher(algorithm="md5")
@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+from app.main import app
+from app.dependencies import get_db_engine
+from database.pool_metrics import TimedQueuePool, pool_stats
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_stats_counts_checked_out_and_overflow(engine):
+    first = engine.connect()
+    second = engine.connect()
+
+    stats = pool_stats(engine)
+    assert stats["pool_class"] == "TimedQueuePool"
+    assert stats["size"] == 1
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["exhausted"] is True
+    assert stats["checkouts"] == 2
+
+    second.close()
+    first.close()
+    stats = pool_stats(engine)
+    assert stats["checked_out"] == 0
+    assert stats["exhausted"] is False
+
+
+def test_pool_timeout_is_recorded(engine):
+    connections = [engine.connect(), engine.connect()]
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    stats = pool_stats(engine)
+    assert stats["timeouts"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["wait_max_ms"] >= 50
+    for connection in connections:
+        connection.close()
+
+
+def test_metrics_survive_pool_recreate(engine):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    metrics = engine.pool.metrics
+
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert engine.pool.metrics is metrics
+    assert pool_stats(engine)["checkouts"] == 2
+
+
+def test_db_pool_endpoint(engine):
+    app.dependency_overrides[get_db_engine] = lambda: engine
+    try:
+        with engine.connect():
+            response = TestClient(app).get("/internal/db-pool")
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["checked_out"] == 1
+    assert body["checkouts"] == 1
+    assert {"wait_avg_ms", "wait_p95_ms", "wait_max_ms", "max_overflow", "timeout"} <= body.keys()
@@ -0,0 +1,72 @@
+from app.review.processor_pool import ProcessorPool
+from app.review.review_service import PROCESSOR_MAP
+from review_analysis.preprocessing.tfidf_model import IdfModel
+
+
+def test_pool_configures_persistent_partial_models(tmp_path):
+    pool = ProcessorPool(PROCESSOR_MAP, str(tmp_path))
+
+    with pool.acquire("letterboxd") as processor:
+        assert processor.tfidf_mode == "partial"
+        assert processor.tfidf_model_path == str(tmp_path / "tfidf_letterboxd.json")
+        assert processor.lang_workers == 1
+
+
+def test_api_processors_detect_languages_in_process(tmp_path, monkeypatch):
+    import review_analysis.preprocessing.language_detector as detector
+
+    def no_process_pool(*args, **kwargs):
+        raise AssertionError("API 전처리기는 프로세스 풀을 만들지 않아야 합니다.")
+
+    monkeypatch.setattr(detector, "ProcessPoolExecutor", no_process_pool)
+    pool = ProcessorPool(PROCESSOR_MAP, str(tmp_path))
+
+    with pool.acquire("imdb") as processor:
+        languages = detector.detect_languages(
+            ["this is a fine english sentence"] * 3, n_workers=processor.lang_workers, chunk_size=1
+        )
+    assert languages == ["en"] * 3
+
+
+def test_warm_up_loads_resources(tmp_path, offline_nltk):
+    IdfModel().fit(["great movie", "boring movie"]).save(str(tmp_path / "tfidf_imdb.json"))
+    pool = ProcessorPool(PROCESSOR_MAP, str(tmp_path))
+
+    pool.warm_up()
+
+    with pool.acquire("imdb") as processor:
+        assert processor._cleaner is not None
+        assert processor._tfidf_model.n_docs == 2
+    with pool.acquire("rottentomatoes") as processor:
+        assert processor._tfidf_model is None
+
+
+def test_acquire_is_exclusive_per_site(tmp_path):
+    pool = ProcessorPool(PROCESSOR_MAP, str(tmp_path))
+
+    with pool.acquire("imdb"):
+        assert not pool._locks["imdb"].acquire(blocking=False)
+        assert pool._locks["letterboxd"].acquire(blocking=False)
+        pool._locks["letterboxd"].release()
+
+
+def test_acquire_async_shares_lock_with_sync_acquire(tmp_path):
+    import asyncio
+
+    pool = ProcessorPool(PROCESSOR_MAP, str(tmp_path))
+
+    async def acquire_while_held():
+        pool._locks["imdb"].acquire()
+        waiter = asyncio.create_task(_use(pool))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        pool._locks["imdb"].release()
+        return await waiter
+
+    assert asyncio.run(acquire_while_held()) == "imdb used"
+    assert pool._locks["imdb"].acquire(blocking=False)
+
+
+async def _use(pool):
+    async with pool.acquire_async("imdb"):
+        return "imdb used"
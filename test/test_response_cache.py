@@ -0,0 +1,49 @@
+from app.review.response_cache import ResponseCache, etag_matches
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+
+def test_ttl_expiry(monkeypatch):
+    import app.review.response_cache as module
+
+    now = [100.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl_seconds=10)
+    cache.set("a", b"1")
+
+    now[0] = 109.0
+    assert cache.get("a") == b"1"
+    now[0] = 111.0
+    assert cache.get("a") is None
+    assert cache.stats() == {"entries": 0, "hits": 1, "misses": 1}
+
+
+def test_etag_changes_with_site_version_only():
+    cache = ResponseCache()
+    params = [("limit", "5"), ("language", "en")]
+    etag = cache.etag("imdb", "/review/imdb", params)
+
+    assert cache.etag("imdb", "/review/imdb", list(reversed(params))) == etag
+    assert cache.etag("imdb", "/review/imdb", [("limit", "6")]) != etag
+
+    cache.bump("letterboxd")
+    assert cache.etag("imdb", "/review/imdb", params) == etag
+    cache.bump("imdb")
+    assert cache.etag("imdb", "/review/imdb", params) != etag
+
+
+def test_etag_matches():
+    assert etag_matches('"x", "y"', '"y"')
+    assert etag_matches("*", '"y"')
+    assert not etag_matches(None, '"y"')
+    assert not etag_matches('W/"y"', '"y"')
@@ -0,0 +1,47 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+from app.review.review_export import ExportEncoder, accepts_gzip, stream_export
+
+DOCS = [
+    [{"_id": "a", "date": datetime(2025, 1, 2), "rating": 8.0, "comment": "great, really"}],
+    [{"_id": "b", "date": datetime(2025, 1, 1), "rating": 3.0, "comment": "meh"}],
+]
+
+
+def test_ndjson_lines():
+    body = b"".join(stream_export(DOCS, ExportEncoder("ndjson")))
+
+    rows = [json.loads(line) for line in body.decode("utf-8").splitlines()]
+    assert rows[0] == {"_id": "a", "date": "2025-01-02T00:00:00", "rating": 8.0, "comment": "great, really"}
+    assert [r["_id"] for r in rows] == ["a", "b"]
+
+
+def test_csv_header_once_and_selected_columns():
+    body = b"".join(stream_export(DOCS, ExportEncoder("csv", ["rating", "comment"])))
+
+    rows = list(csv.reader(io.StringIO(body.decode("utf-8"))))
+    assert rows == [["_id", "rating", "comment"], ["a", "8.0", "great, really"], ["b", "3.0", "meh"]]
+
+
+def test_csv_empty_result_has_header():
+    body = b"".join(stream_export([], ExportEncoder("csv", ["rating"], compress=True)))
+
+    assert gzip.decompress(body).decode("utf-8").strip() == "_id,rating"
+
+
+def test_gzip_stream_round_trip():
+    plain = b"".join(stream_export(DOCS, ExportEncoder("ndjson")))
+    compressed = b"".join(stream_export(DOCS, ExportEncoder("ndjson", compress=True)))
+
+    assert gzip.decompress(compressed) == plain
+
+
+def test_accepts_gzip():
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, gzip;q=0.8")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip(None)
@@ -0,0 +1,74 @@
+import threading
+import pytest
+from app.review.review_jobs import FAILED, SUCCEEDED, JobManager, JobQueueFull
+
+
+def wait_for(job, timeout=5):
+    event = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if job.state in (SUCCEEDED, FAILED):
+            return
+        event.wait(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_job_reports_progress_and_success():
+    manager = JobManager(max_workers=1, max_queued=0)
+
+    def work(on_batch):
+        on_batch({"batch": 1, "raw_fetched": 10, "processed_inserted": 8})
+        on_batch({"batch": 2, "raw_fetched": 5, "processed_inserted": 5})
+
+    job = manager.submit("imdb", work)
+    wait_for(job)
+
+    status = job.to_dict()
+    assert status["state"] == SUCCEEDED
+    assert status["raw_fetched"] == 15
+    assert status["processed_inserted"] == 13
+    assert status["batches_done"] == 2
+    assert manager.get(job.id) is job
+    manager.shutdown()
+
+
+def test_job_failure_is_recorded():
+    manager = JobManager(max_workers=1, max_queued=0)
+
+    def work(on_batch):
+        raise RuntimeError("mongo down")
+
+    job = manager.submit("imdb", work)
+    wait_for(job)
+
+    assert job.state == FAILED
+    assert job.error == "RuntimeError: mongo down"
+    manager.shutdown()
+
+
+def test_queue_full_rejects_new_jobs():
+    manager = JobManager(max_workers=1, max_queued=1)
+    release = threading.Event()
+
+    first = manager.submit("imdb", lambda on_batch: release.wait(5))
+    second = manager.submit("letterboxd", lambda on_batch: release.wait(5))
+    with pytest.raises(JobQueueFull):
+        manager.submit("rottentomatoes", lambda on_batch: None)
+
+    release.set()
+    wait_for(first)
+    wait_for(second)
+    assert manager.active_count() == 0
+    manager.shutdown()
+
+
+def test_history_evicts_oldest_finished_jobs():
+    manager = JobManager(max_workers=1, max_queued=5, history_size=2)
+    jobs = []
+    for _ in range(3):
+        job = manager.submit("imdb", lambda on_batch: None)
+        wait_for(job)
+        jobs.append(job)
+
+    assert manager.get(jobs[0].id) is None
+    assert manager.get(jobs[2].id) is jobs[2]
+    manager.shutdown()
@@ -0,0 +1,323 @@
+import asyncio
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import ANY, MagicMock
+from app.main import app
+from app.dependencies import get_job_manager, get_preprocess_flights, get_response_cache, get_review_service
+from app.review.response_cache import ResponseCache
+from app.review.review_router import background_work, run_preprocess
+from app.review.single_flight import SingleFlight
+from app.review.review_jobs import JobQueueFull, PreprocessJob
+from app.review.review_query import MAX_PAGE_SIZE, InvalidCursor, ReviewFilters
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def mock_job_manager():
+    return MagicMock()
+
+
+@pytest.fixture
+def response_cache():
+    return ResponseCache()
+
+
+@pytest.fixture
+def mock_review_service(mock_job_manager, response_cache):
+    service = MagicMock()
+    app.dependency_overrides[get_review_service] = lambda: service
+    app.dependency_overrides[get_job_manager] = lambda: mock_job_manager
+    app.dependency_overrides[get_response_cache] = lambda: response_cache
+    app.dependency_overrides[get_preprocess_flights] = SingleFlight
+    yield service
+    app.dependency_overrides = {}
+
+
+def test_preprocess_site_success(mock_review_service):
+    mock_review_service.preprocess_site.return_value = {"status": "success", "site": "imdb", "raw_fetched": 0}
+
+    response = client.post("/review/preprocess/IMDb", params={"batch_size": 50})
+
+    assert response.status_code == 200
+    assert response.json()["site"] == "imdb"
+    mock_review_service.preprocess_site.assert_called_once_with("imdb", 50, ANY)
+
+
+def test_preprocess_site_invalid_site(mock_review_service):
+    response = client.post("/review/preprocess/naver")
+
+    assert response.status_code == 400
+    mock_review_service.preprocess_site.assert_not_called()
+
+
+def test_preprocess_site_invalid_batch_size(mock_review_service):
+    response = client.post("/review/preprocess/imdb", params={"batch_size": 0})
+
+    assert response.status_code == 422
+
+
+def test_preprocess_site_background_returns_job_id(mock_review_service, mock_job_manager):
+    mock_job_manager.submit.return_value = PreprocessJob(site="imdb", id="abc")
+
+    response = client.post("/review/preprocess/imdb", params={"background": True})
+
+    assert response.status_code == 202
+    assert response.json()["job_id"] == "abc"
+    mock_review_service.preprocess_site.assert_not_called()
+    assert mock_job_manager.submit.call_args.args[0] == "imdb"
+
+
+def test_background_work_joins_running_preprocess(response_cache):
+    release = threading.Event()
+    service = MagicMock()
+
+    def preprocess(site_name, batch_size, on_batch):
+        release.wait(5)
+        on_batch({"batch": 1, "raw_fetched": 1, "processed_inserted": 1, "processed_updated": 0})
+        return {"status": "success", "site": site_name}
+
+    service.preprocess_site.side_effect = preprocess
+
+    async def scenario():
+        flights = SingleFlight()
+        foreground = asyncio.ensure_future(run_preprocess(service, flights, response_cache, "imdb", 10))
+        await asyncio.sleep(0.05)
+
+        # 백그라운드 작업은 작업 관리자 스레드에서 실행되고, 이미 실행 중인 같은 사이트 전처리에 합류합니다.
+        work = background_work(service, flights, "imdb", 10, response_cache)
+        background = asyncio.get_running_loop().run_in_executor(None, work, MagicMock())
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(foreground, background)
+
+    foreground, background = asyncio.run(scenario())
+
+    assert foreground["merged"] is False
+    assert background["status"] == "success"
+    service.preprocess_site.assert_called_once_with("imdb", 10, ANY)
+
+
+def test_preprocess_site_background_queue_full(mock_review_service, mock_job_manager):
+    mock_job_manager.submit.side_effect = JobQueueFull("full")
+
+    response = client.post("/review/preprocess/imdb", params={"background": True})
+
+    assert response.status_code == 429
+
+
+def test_get_job(mock_review_service, mock_job_manager):
+    mock_job_manager.get.return_value = PreprocessJob(site="imdb", id="abc")
+
+    response = client.get("/review/jobs/abc")
+
+    assert response.status_code == 200
+    assert response.json()["state"] == "queued"
+
+
+def test_get_job_not_found(mock_review_service, mock_job_manager):
+    mock_job_manager.get.return_value = None
+
+    response = client.get("/review/jobs/missing")
+
+    assert response.status_code == 404
+
+
+def test_list_reviews_passes_filters(mock_review_service):
+    mock_review_service.list_reviews.return_value = {"site": "imdb", "count": 0, "items": [], "next_cursor": None}
+
+    response = client.get(
+        "/review/IMDb",
+        params={"rating_min": 7, "language": "en", "year_month": "2025-12", "limit": 20, "fields": "rating, comment"},
+    )
+
+    assert response.status_code == 200
+    site, filters, limit = mock_review_service.list_reviews.call_args.args
+    assert (site, limit) == ("imdb", 20)
+    assert filters == ReviewFilters(rating_min=7, language="en", year_month="2025-12")
+    assert mock_review_service.list_reviews.call_args.kwargs == {"cursor": None, "fields": ["rating", "comment"]}
+
+
+def test_list_reviews_page_size_cap(mock_review_service):
+    response = client.get("/review/imdb", params={"limit": MAX_PAGE_SIZE + 1})
+
+    assert response.status_code == 422
+    mock_review_service.list_reviews.assert_not_called()
+
+
+def test_list_reviews_invalid_cursor(mock_review_service):
+    mock_review_service.list_reviews.side_effect = InvalidCursor("Invalid cursor.")
+
+    response = client.get("/review/imdb", params={"cursor": "garbage"})
+
+    assert response.status_code == 400
+
+
+def test_monthly_summary(mock_review_service):
+    mock_review_service.monthly_summary.return_value = {"site": "imdb", "months": []}
+
+    response = client.get("/review/imdb/monthly", params={"month_from": "2025-01"})
+
+    assert response.status_code == 200
+    mock_review_service.monthly_summary.assert_called_once_with("imdb", "2025-01", None)
+
+
+def test_monthly_summary_invalid_month(mock_review_service):
+    response = client.get("/review/imdb/monthly", params={"month_from": "2025-1"})
+
+    assert response.status_code == 422
+
+
+def test_async_service_is_awaited(mock_review_service):
+    from unittest.mock import AsyncMock
+
+    mock_review_service.list_reviews = AsyncMock(return_value={"site": "imdb", "count": 0, "items": [], "next_cursor": None})
+
+    response = client.get("/review/imdb")
+
+    assert response.status_code == 200
+    mock_review_service.list_reviews.assert_awaited_once()
+
+
+def test_read_returns_etag_and_304(mock_review_service):
+    mock_review_service.monthly_summary.return_value = {"site": "imdb", "months": []}
+
+    first = client.get("/review/imdb/monthly")
+    second = client.get("/review/imdb/monthly", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('"')
+    assert second.status_code == 304
+    assert second.headers["ETag"] == first.headers["ETag"]
+    mock_review_service.monthly_summary.assert_called_once()
+
+
+def test_read_recomputes_after_ttl_instead_of_304(mock_review_service, response_cache, monkeypatch):
+    mock_review_service.monthly_summary.side_effect = [
+        {"site": "imdb", "months": []},
+        {"site": "imdb", "months": [{"year_month": "2024-01", "count": 1}]},
+    ]
+    now = [1000.0]
+    monkeypatch.setattr("app.review.response_cache.time.monotonic", lambda: now[0])
+
+    first = client.get("/review/imdb/monthly")
+    now[0] += response_cache.ttl_seconds + 1
+    second = client.get("/review/imdb/monthly", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert second.status_code == 200
+    assert second.json()["months"] == [{"year_month": "2024-01", "count": 1}]
+    assert mock_review_service.monthly_summary.call_count == 2
+
+
+def test_read_is_served_from_cache(mock_review_service):
+    mock_review_service.list_reviews.return_value = {"site": "imdb", "count": 0, "items": [], "next_cursor": None}
+
+    first = client.get("/review/imdb", params={"limit": 5, "language": "en"})
+    second = client.get("/review/imdb", params={"language": "en", "limit": 5})
+
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    mock_review_service.list_reviews.assert_called_once()
+
+
+def test_preprocess_batches_invalidate_cache(mock_review_service, response_cache):
+    mock_review_service.monthly_summary.return_value = {"site": "imdb", "months": []}
+
+    def preprocess(site_name, batch_size, on_batch):
+        on_batch({"batch": 1, "raw_fetched": 1, "processed_inserted": 1, "processed_updated": 0})
+        return {"status": "success"}
+
+    mock_review_service.preprocess_site.side_effect = preprocess
+    before = client.get("/review/imdb/monthly").headers["ETag"]
+
+    client.post("/review/preprocess/imdb")
+    after = client.get("/review/imdb/monthly", headers={"If-None-Match": before})
+
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before
+    assert mock_review_service.monthly_summary.call_count == 2
+    assert response_cache.version("imdb") == 1
+    assert response_cache.version("letterboxd") == 0
+
+
+def test_export_streams_csv(mock_review_service):
+    mock_review_service.export_batches.return_value = [[{"_id": "a", "rating": 9.0}], [{"_id": "b", "rating": 4.0}]]
+
+    response = client.get(
+        "/review/imdb/export",
+        params={"format": "csv", "fields": "rating", "rating_min": 1},
+        headers={"Accept-Encoding": "identity"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "content-encoding" not in response.headers
+    assert response.text.splitlines() == ["_id,rating", "a,9.0", "b,4.0"]
+    site, filters, fields = mock_review_service.export_batches.call_args.args
+    assert (site, filters.rating_min, fields) == ("imdb", 1, ["rating"])
+
+
+def test_export_gzip_when_accepted(mock_review_service):
+    mock_review_service.export_batches.return_value = [[{"_id": "a", "rating": 9.0}]]
+
+    response = client.get("/review/imdb/export", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.json() == {"_id": "a", "rating": 9.0}
+
+
+def test_export_invalid_format(mock_review_service):
+    response = client.get("/review/imdb/export", params={"format": "xml"})
+
+    assert response.status_code == 422
+
+
+def concurrency_tracker(delay=0.1):
+    import threading
+    import time
+
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def preprocess(site_name, batch_size, on_batch):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(delay)
+        with lock:
+            state["running"] -= 1
+        if site_name == "letterboxd":
+            raise RuntimeError("mongo down")
+        return {"status": "success", "site": site_name, "raw_fetched": 1}
+
+    return preprocess, state
+
+
+def test_preprocess_all_sites_concurrently(mock_review_service):
+    preprocess, state = concurrency_tracker()
+    mock_review_service.preprocess_site.side_effect = preprocess
+
+    response = client.post("/review/preprocess", params={"batch_size": 20})
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["status"] == "partial"
+    assert set(body["sites"]) == {"imdb", "letterboxd", "rottentomatoes"}
+    assert body["sites"]["imdb"]["raw_fetched"] == 1
+    assert body["sites"]["letterboxd"]["status"] == "failed"
+    assert "mongo down" in body["sites"]["letterboxd"]["error"]
+    assert all(site["elapsed_seconds"] >= 0.1 for site in body["sites"].values())
+    assert state["peak"] == 3
+
+
+def test_preprocess_all_respects_parallelism(mock_review_service):
+    preprocess, state = concurrency_tracker(delay=0.05)
+    mock_review_service.preprocess_site.side_effect = preprocess
+
+    response = client.post("/review/preprocess", params={"parallelism": 1})
+
+    assert response.json()["parallelism"] == 1
+    assert state["peak"] == 1
+    assert mock_review_service.preprocess_site.call_count == 3
@@ -0,0 +1,271 @@
+import os
+from datetime import datetime, timedelta
+import pandas as pd
+import pytest
+from app.review.processor_pool import ProcessorPool
+from app.review.review_query import InvalidCursor, ReviewFilters
+from app.review.review_service import PROCESSOR_MAP, ReviewService, split_monthly_rollup
+
+DATABASE_DIR = os.path.join(os.path.dirname(__file__), "..", "database")
+
+
+@pytest.fixture
+def db(mongo_db):
+    return mongo_db
+
+
+@pytest.fixture
+def processors(tmp_path, offline_nltk, monkeypatch):
+    from review_analysis.preprocessing.base_processor import BaseDataProcessor
+
+    monkeypatch.setattr(BaseDataProcessor, "lang_workers", 1)
+    monkeypatch.setattr(BaseDataProcessor, "lang_cache_path", None)
+    return ProcessorPool(PROCESSOR_MAP, str(tmp_path / "models"))
+
+
+@pytest.fixture
+def service(db, processors):
+    return ReviewService(db, processors)
+
+
+def seed_raw(db, n=30):
+    raw = pd.read_csv(os.path.join(DATABASE_DIR, "reviews_imdb.csv")).head(n)
+    raw["extra_field"] = "not needed"
+    db["REVIEW_imdb"].insert_many(raw.to_dict("records"))
+    return raw
+
+
+def test_preprocess_site_in_batches(db, service):
+    seed_raw(db, 25)
+
+    result = service.preprocess_site("imdb", batch_size=10)
+
+    assert result["raw_fetched"] == 25
+    assert [b["raw_fetched"] for b in result["batches"]] == [10, 10, 5]
+    assert result["processed_inserted"] == sum(b["processed_inserted"] for b in result["batches"])
+    assert db["PREPROCESSED_REVIEW_imdb"].count_documents({}) == result["processed_inserted"]
+    assert db["REVIEW_imdb"].count_documents({"preprocessed": True}) == 25
+    assert db["PREPROCESSED_REVIEW_imdb"].count_documents({"extra_field": {"$exists": True}}) == 0
+
+
+def test_preprocess_site_skips_already_processed(db, service):
+    seed_raw(db, 12)
+    service.preprocess_site("imdb", batch_size=5)
+
+    result = service.preprocess_site("imdb", batch_size=5)
+
+    assert result["raw_fetched"] == 0
+    assert result["batches"] == []
+    assert result["message"] == "No new documents to preprocess."
+
+
+def test_processor_is_reused_across_calls(db, service, processors, tmp_path):
+    seed_raw(db, 12)
+    service.preprocess_site("imdb", batch_size=6)
+
+    with processors.acquire("imdb") as processor:
+        model = processor._tfidf_model
+        assert model is not None
+        assert os.path.exists(str(tmp_path / "models" / "tfidf_imdb.json"))
+
+    seed_raw(db, 5)
+    service.preprocess_site("imdb", batch_size=6)
+
+    with processors.acquire("imdb") as processor:
+        assert processor._tfidf_model is model
+
+
+def test_source_id_matches_each_row_after_filtering(db, service):
+    raw = pd.read_csv(os.path.join(DATABASE_DIR, "reviews_imdb.csv")).head(20)
+    # 앞쪽 행이 걸러지면 결과 행과 원본 _id의 순서가 어긋나는지 확인합니다.
+    raw.loc[[0, 3, 7], "comment"] = "too short"
+    db["REVIEW_imdb"].insert_many(raw.to_dict("records"))
+
+    service.preprocess_site("imdb", batch_size=30)
+
+    raw_by_id = {doc["_id"]: doc for doc in db["REVIEW_imdb"].find()}
+    processed = list(db["PREPROCESSED_REVIEW_imdb"].find())
+    assert 0 < len(processed) <= 17
+    for doc in processed:
+        assert doc["comment"] == str(raw_by_id[doc["source_id"]]["comment"]).strip()
+
+
+def test_retry_after_crash_does_not_duplicate(db, service):
+    seed_raw(db, 20)
+    first = service.preprocess_site("imdb", batch_size=8)
+
+    # 원본 표시 전에 중단된 상황: 전처리 결과는 저장됐지만 원본은 미처리로 남아 있음
+    db["REVIEW_imdb"].update_many({}, {"$unset": {"preprocessed": ""}})
+    retry = service.preprocess_site("imdb", batch_size=8)
+
+    assert retry["raw_fetched"] == 20
+    assert retry["processed_inserted"] == 0
+    assert retry["processed_updated"] == first["processed_inserted"]
+    assert db["PREPROCESSED_REVIEW_imdb"].count_documents({}) == first["processed_inserted"]
+    assert any(index["key"] == [("source_id", 1)] and index.get("unique")
+               for index in db["PREPROCESSED_REVIEW_imdb"].index_information().values())
+
+
+def seed_preprocessed(db, n=25):
+    start = datetime(2025, 1, 1)
+    # 같은 날짜가 여러 건 있어야 (date, _id) 정렬의 동점 처리를 확인할 수 있습니다.
+    docs = [
+        {
+            "source_id": i,
+            "date": start + timedelta(days=i // 3),
+            "year_month": (start + timedelta(days=i // 3)).strftime("%Y-%m"),
+            "rating": float(i % 10),
+            "language": "en",
+            "comment": f"review {i}",
+        }
+        for i in range(n)
+    ]
+    db["PREPROCESSED_REVIEW_imdb"].insert_many(docs)
+
+
+def test_list_reviews_keyset_pages_cover_all_once(db, service):
+    seed_preprocessed(db, 25)
+
+    items, cursor, pages = [], None, 0
+    while True:
+        page = service.list_reviews("imdb", ReviewFilters(), limit=7, cursor=cursor)
+        items.extend(page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 4
+    assert sorted(item["source_id"] for item in items) == list(range(25))
+    keys = [(item["date"], item["_id"]) for item in items]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_list_reviews_filters_and_projection(db, service):
+    seed_preprocessed(db, 25)
+
+    page = service.list_reviews(
+        "imdb", ReviewFilters(rating_min=5, date_to=datetime(2025, 1, 5)), limit=100, fields=["rating"]
+    )
+
+    assert page["next_cursor"] is None
+    assert {item["rating"] for item in page["items"]} <= {5.0, 6.0, 7.0, 8.0, 9.0}
+    assert all(item["date"] < datetime(2025, 1, 5) for item in page["items"])
+    assert set(page["items"][0]) == {"_id", "date", "rating"}
+    assert isinstance(page["items"][0]["_id"], str)
+
+
+def test_list_reviews_rejects_bad_input(db, service):
+    with pytest.raises(InvalidCursor):
+        service.list_reviews("imdb", ReviewFilters(), limit=10, cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        service.list_reviews("imdb", ReviewFilters(), limit=10, fields=["password"])
+
+
+def test_ensure_indexes_supports_keyset_reads(db, service):
+    service.ensure_indexes("imdb")
+
+    keys = [index["key"] for index in db["PREPROCESSED_REVIEW_imdb"].index_information().values()]
+    assert [("date", -1), ("_id", -1)] in keys
+    assert [("language", 1), ("date", -1), ("_id", -1)] in keys
+
+
+def assert_monthly_matches_full_scan(db, summary):
+    df = pd.DataFrame(list(db["PREPROCESSED_REVIEW_imdb"].find()))
+    expected = df.groupby("year_month").agg(count=("rating", "size"), avg_rating=("rating", "mean"),
+                                             avg_subjectivity_score=("subjectivity_score", "mean"))
+    assert [m["year_month"] for m in summary["months"]] == list(expected.index)
+    for month in summary["months"]:
+        row = expected.loc[month["year_month"]]
+        assert month["count"] == row["count"]
+        assert month["avg_rating"] == pytest.approx(row["avg_rating"])
+        assert month["avg_subjectivity_score"] == pytest.approx(row["avg_subjectivity_score"])
+
+
+def test_monthly_rollup_matches_full_scan(db, service):
+    seed_raw(db, 30)
+    service.preprocess_site("imdb", batch_size=7)
+
+    assert_monthly_matches_full_scan(db, service.monthly_summary("imdb"))
+
+
+def test_monthly_rollup_not_double_counted_on_retry(db, service):
+    seed_raw(db, 20)
+    first = service.preprocess_site("imdb", batch_size=8)
+
+    db["REVIEW_imdb"].update_many({}, {"$unset": {"preprocessed": ""}})
+    service.preprocess_site("imdb", batch_size=8)
+
+    summary = service.monthly_summary("imdb")
+    assert sum(m["count"] for m in summary["months"]) == first["processed_inserted"]
+
+
+def test_monthly_rollup_recovers_when_crash_skipped_it(db, service):
+    seed_raw(db, 20)
+    first = service.preprocess_site("imdb", batch_size=8)
+
+    # 전처리 결과는 저장됐지만 월별 집계와 원본 표시 전에 중단된 상황
+    db["MONTHLY_REVIEW_imdb"].drop()
+    db["REVIEW_imdb"].update_many({}, {"$unset": {"preprocessed": ""}})
+    retry = service.preprocess_site("imdb", batch_size=8)
+
+    summary = service.monthly_summary("imdb")
+    assert retry["processed_inserted"] == 0
+    assert sum(m["count"] for m in summary["months"]) == first["processed_inserted"]
+    assert_monthly_matches_full_scan(db, summary)
+
+
+
+def test_split_monthly_rollup_recomputes_only_months_with_updates():
+    df_out = pd.DataFrame({"year_month": ["2025-01", "2025-01", "2025-02", "2025-03"], "rating": [1.0, 2.0, 3.0, 4.0]})
+
+    # 0, 2, 3번 문서만 새로 추가되고 1번(2025-01)은 이미 있어 갱신된 경우
+    df_new, months = split_monthly_rollup(df_out, {0: "a", 2: "b", 3: "c"})
+
+    assert months == ["2025-01"]
+    assert df_new["year_month"].tolist() == ["2025-02", "2025-03"]
+
+
+def test_first_run_does_not_rescan_months(db, service, monkeypatch):
+    from mongomock.collection import Collection
+
+    aggregate_calls = []
+    aggregate = Collection.aggregate
+
+    def recording_aggregate(self, pipeline, *args, **kwargs):
+        aggregate_calls.append(pipeline)
+        return aggregate(self, pipeline, *args, **kwargs)
+
+    monkeypatch.setattr(Collection, "aggregate", recording_aggregate)
+    seed_raw(db, 20)
+
+    service.preprocess_site("imdb", batch_size=8)
+
+    assert aggregate_calls == []
+    assert_monthly_matches_full_scan(db, service.monthly_summary("imdb"))
+
+def test_monthly_summary_range(db, service):
+    db["MONTHLY_REVIEW_imdb"].insert_many([
+        {"_id": month, "count": 2, "rating_sum": 10.0, "subjectivity_sum": 1.0}
+        for month in ("2025-10", "2025-11", "2025-12")
+    ])
+
+    summary = service.monthly_summary("imdb", month_from="2025-11", month_to="2025-12")
+
+    assert summary["months"] == [
+        {"year_month": "2025-11", "count": 2, "avg_rating": 5.0, "avg_subjectivity_score": 0.5},
+        {"year_month": "2025-12", "count": 2, "avg_rating": 5.0, "avg_subjectivity_score": 0.5},
+    ]
+
+
+def test_export_batches_streams_all_matching(db, service):
+    seed_preprocessed(db, 25)
+
+    batches = list(service.export_batches("imdb", ReviewFilters(rating_min=5), fields=["rating"], batch_size=4))
+
+    docs = [doc for batch in batches for doc in batch]
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert all(doc["rating"] >= 5 for doc in docs)
+    assert set(docs[0]) == {"_id", "date", "rating"}
+    with pytest.raises(ValueError):
+        service.export_batches("imdb", ReviewFilters(), fields=["password"])
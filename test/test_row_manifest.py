@@ -0,0 +1,31 @@
+import pandas as pd
+from review_analysis.preprocessing.row_manifest import RowManifest, row_hashes
+
+
+def test_row_hashes_distinguish_duplicates():
+    df = pd.DataFrame({"rating": [5, 5, 3], "comment": ["same", "same", "other"]})
+
+    hashes = row_hashes(df)
+
+    assert hashes.is_unique
+    assert hashes[0].split("-")[0] == hashes[1].split("-")[0]
+
+
+def test_row_hashes_stable_across_dtypes():
+    ints = pd.DataFrame({"rating": [5], "comment": ["text"]})
+    strs = pd.DataFrame({"rating": ["5"], "comment": ["text"]})
+
+    assert row_hashes(ints).tolist() == row_hashes(strs).tolist()
+
+
+def test_manifest_diff_and_roundtrip(tmp_path):
+    path = str(tmp_path / "manifest_imdb.json")
+    manifest = RowManifest.load(path)
+    assert manifest.hashes == set()
+
+    manifest.save(["a", "b", "c"])
+    loaded = RowManifest.load(path)
+
+    added, removed = loaded.diff(["b", "c", "d"])
+    assert added == {"d"}
+    assert removed == {"a"}
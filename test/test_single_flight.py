@@ -0,0 +1,42 @@
+import asyncio
+from app.review.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    flights = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"raw_fetched": 3}
+
+    async def run():
+        return await asyncio.gather(flights.run("imdb", work), flights.run("imdb", work), flights.run("letterboxd", work))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 2
+    assert [merged for _, merged in results] == [False, True, False]
+    assert all(result == {"raw_fetched": 3} for result, _ in results)
+    assert not flights.in_flight("imdb")
+
+
+def test_cancelled_waiter_does_not_cancel_shared_run():
+    flights = SingleFlight()
+    finished = []
+
+    async def work():
+        await asyncio.sleep(0.05)
+        finished.append("done")
+        return "ok"
+
+    async def run():
+        first = asyncio.ensure_future(flights.run("imdb", work))
+        second = asyncio.ensure_future(flights.run("imdb", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == ("ok", True)
+    assert finished == ["done"]
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+from review_analysis.preprocessing.text_cleaner import TextCleaner
+
+
+STOP_WORDS = {"the", "a", "is", "this", "and"}
+
+
+def fake_lemmatize(token: str) -> str:
+    return token[:-1] if token.endswith("s") else token
+
+
+@pytest.fixture
+def cleaner():
+    return TextCleaner(STOP_WORDS, fake_lemmatize, cache_size=16)
+
+
+def test_clean_removes_symbols_stopwords_and_lemmatizes(cleaner):
+    assert cleaner.clean("This movie is GREAT!! Cats and dogs...") == "movie great cat dog"
+
+
+def test_clean_non_string_returns_empty(cleaner):
+    assert cleaner.clean(None) == ""
+    assert cleaner.clean(3.5) == ""
+
+
+def test_clean_series_matches_row_by_row(cleaner):
+    texts = pd.Series(
+        ["The cats are here", None, "a a a", "Dogs & cats 123", "The cats are here"],
+        index=[10, 11, 12, 13, 14],
+    )
+
+    result = cleaner.clean_series(texts)
+
+    assert list(result.index) == [10, 11, 12, 13, 14]
+    assert list(result) == [cleaner.clean(text) for text in texts]
+
+
+def test_clean_series_empty(cleaner):
+    result = cleaner.clean_series(pd.Series([], dtype=object))
+    assert result.empty
+
+
+def test_token_cache_is_reused(cleaner):
+    cleaner.clean_series(pd.Series(["cats cats cats", "cats dogs"]))
+
+    info = cleaner.cache_info()
+    assert info.misses == 2
+    assert info.maxsize == 16
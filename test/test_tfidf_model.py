@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from review_analysis.preprocessing.tfidf_model import IdfModel
+
+
+DOCS = ["great movie great fun", "boring movie", "fun fun fun", "animation great"]
+NEW_DOCS = ["boring animation", "new word here"]
+
+
+def dense_by_term(matrix, names):
+    dense = matrix.toarray()
+    return {name: dense[:, i] for i, name in enumerate(names)}
+
+
+def test_fit_transform_matches_tfidf_vectorizer():
+    vectorizer = TfidfVectorizer(token_pattern=r"(?u)\b\w+\b", norm=None)
+    expected = dense_by_term(vectorizer.fit_transform(DOCS), vectorizer.get_feature_names_out())
+
+    model = IdfModel().fit(DOCS)
+    actual = dense_by_term(model.transform(DOCS), model.feature_names())
+
+    assert actual.keys() == expected.keys()
+    for term in expected:
+        np.testing.assert_allclose(actual[term], expected[term])
+
+
+def test_partial_fit_equals_full_fit():
+    incremental = IdfModel().partial_fit(DOCS[:2]).partial_fit(DOCS[2:] + NEW_DOCS)
+    full = IdfModel().fit(DOCS + NEW_DOCS)
+
+    assert incremental.n_docs == full.n_docs
+    actual = dense_by_term(incremental.transform(NEW_DOCS), incremental.feature_names())
+    expected = dense_by_term(full.transform(NEW_DOCS), full.feature_names())
+    for term in expected:
+        np.testing.assert_allclose(actual[term], expected[term])
+
+
+def test_transform_ignores_unknown_terms():
+    model = IdfModel().fit(DOCS)
+    matrix = model.transform(["unknown words only"])
+    assert matrix.shape == (1, len(model.vocabulary_))
+    assert matrix.nnz == 0
+
+
+def test_empty_model_transform_raises():
+    model = IdfModel().fit(["", ""])
+    assert model.n_docs == 2
+    with pytest.raises(ValueError):
+        model.transform(["anything"])
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    path = str(tmp_path / "models" / "tfidf_imdb.json")
+    model = IdfModel().fit(DOCS)
+    model.save(path)
+
+    loaded = IdfModel.load(path)
+
+    assert loaded.n_docs == model.n_docs
+    assert loaded.vocabulary_ == model.vocabulary_
+    np.testing.assert_allclose(loaded.idf_, model.idf_)
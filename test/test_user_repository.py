@@ -38,19 +38,8 @@ def user_repo(db_session):
     return UserRepository(db_session)
 
 
-def test_save_new_user(user_repo):
-    new_user = User(email="test@example.com", password="secure123", username="testuser")
-
-    saved_user = user_repo.save_user(new_user)
-    
-    assert saved_user is not None
-    assert saved_user.email == "test@example.com"
-    assert saved_user.password == "secure123"
-    assert saved_user.username == "testuser"
-
-
 def test_get_user_by_email(user_repo):
-    user_repo.save_user(User(email="getuser@example.com", password="getpassword", username="getusername"))
+    user_repo.create_user(User(email="getuser@example.com", password="getpassword", username="getusername"))
 
     user = user_repo.get_user_by_email("getuser@example.com")
     
@@ -60,21 +49,8 @@ def test_get_user_by_email(user_repo):
     assert user.username == "getusername"
 
 
-def test_update_existing_user(user_repo):
-    user_repo.save_user(User(email="update@example.com", password="oldpass", username="olduser"))
-
-    updated_user = User(email="update@example.com", password="newpass", username="newuser")
-    user_repo.save_user(updated_user)
-
-    user = user_repo.get_user_by_email("update@example.com")
-    
-    assert user is not None
-    assert user.password == "newpass"
-    assert user.username == "newuser"
-
-
 def test_delete_user(user_repo):
-    user_repo.save_user(User(email="delete@example.com", password="delpass", username="deluser"))
+    user_repo.create_user(User(email="delete@example.com", password="delpass", username="deluser"))
 
     user = user_repo.get_user_by_email("delete@example.com")
     assert user is not None 
@@ -83,3 +59,123 @@ def test_delete_user(user_repo):
     user_after_delete = user_repo.get_user_by_email("delete@example.com")
 
     assert user_after_delete is None 
+
+
+def test_create_user_detects_duplicate(user_repo):
+    created = user_repo.create_user(User(email="dup@example.com", password="first", username="first"))
+    duplicate = user_repo.create_user(User(email="dup@example.com", password="second", username="second"))
+
+    assert created is not None
+    assert duplicate is None
+    assert user_repo.get_user_by_email("dup@example.com").password == "first"
+
+
+def test_update_password(user_repo):
+    user_repo.create_user(User(email="pwd@example.com", password="oldpass", username="pwduser"))
+
+    updated = user_repo.update_password("pwd@example.com", "newpass")
+
+    assert updated == User(email="pwd@example.com", password="newpass", username="pwduser")
+    assert user_repo.update_password("missing@example.com", "newpass") is None
+
+
+def test_update_password_is_single_statement(user_repo):
+    from sqlalchemy import event
+
+    user_repo.create_user(User(email="one@example.com", password="p1", username="u1"))
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        # username을 모르면 UPDATE ... RETURNING, 알면 UPDATE만 실행합니다.
+        returned = user_repo.update_password("one@example.com", "p2")
+        known = user_repo.update_password("one@example.com", "p3", username="u1")
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 2
+    assert all(s.startswith("UPDATE users") for s in statements)
+    assert returned == User(email="one@example.com", password="p2", username="u1")
+    assert known == User(email="one@example.com", password="p3", username="u1")
+    assert user_repo.update_password("missing@example.com", "p", username="u") is None
+
+
+def test_update_password_without_returning_support(user_repo, monkeypatch):
+    # MySQL처럼 UPDATE ... RETURNING을 지원하지 않으면 UPDATE 뒤에 다시 조회합니다.
+    monkeypatch.setattr(engine.dialect, "update_returning", False)
+    user_repo.create_user(User(email="mysql@example.com", password="old", username="m"))
+
+    assert user_repo.update_password("mysql@example.com", "new") == User(email="mysql@example.com", password="new", username="m")
+    assert user_repo.update_password("missing@example.com", "new") is None
+
+
+def test_bulk_create_users_in_chunks(user_repo):
+    user_repo.create_user(User(email="taken@example.com", password="p", username="u"))
+    users = [User(email=f"bulk{i}@example.com", password="p", username=f"u{i}") for i in range(5)]
+    users.insert(2, User(email="taken@example.com", password="other", username="other"))
+
+    existing = user_repo.bulk_create_users(users, chunk_size=2)
+
+    assert existing == {"taken@example.com"}
+    assert all(user_repo.get_user_by_email(f"bulk{i}@example.com") is not None for i in range(5))
+    assert user_repo.get_user_by_email("taken@example.com").password == "p"
+
+
+def test_bulk_create_users_recovers_from_race(user_repo, monkeypatch):
+    user_repo.create_user(User(email="race@example.com", password="p", username="u"))
+    users = [User(email="race@example.com", password="x", username="x"), User(email="ok@example.com", password="p", username="u")]
+
+    # 기존 이메일 조회 이후 다른 요청이 먼저 추가한 상황을 흉내 내기 위해 조회 결과를 비웁니다.
+    execute = user_repo.db.execute
+
+    def execute_hiding_existing(statement, *args, **kwargs):
+        result = execute(statement, *args, **kwargs)
+        return [] if str(statement).startswith("SELECT email FROM users WHERE email IN") else result
+
+    monkeypatch.setattr(user_repo.db, "execute", execute_hiding_existing)
+
+    assert user_repo.bulk_create_users(users, chunk_size=10) == {"race@example.com"}
+    monkeypatch.undo()
+    assert user_repo.get_user_by_email("ok@example.com") is not None
+
+
+
+def test_bulk_create_users_reports_request_emails_with_nocase_collation():
+    from app.user.password_hasher import PasswordHasher
+    from app.user.user_service import UserService
+
+    nocase_engine = create_engine("sqlite:///:memory:")
+    with nocase_engine.begin() as connection:
+        connection.execute(text(CREATE_TABLE_QUERY.replace("email TEXT PRIMARY KEY", "email TEXT PRIMARY KEY COLLATE NOCASE")))
+    with sessionmaker(bind=nocase_engine)() as session:
+        repo = UserRepository(session)
+        repo.create_user(User(email="Taken@example.com", password="p", username="u"))
+        rows = [
+            {"email": "new@example.com", "password": "p", "username": "n"},
+            {"email": "taken@example.com", "password": "p", "username": "t"},
+        ]
+
+        assert repo.bulk_create_users([User(**row) for row in rows], chunk_size=10) == {"taken@example.com"}
+
+        result = UserService(repo, PasswordHasher(scrypt_n=2 ** 4)).bulk_register(
+            rows + [{"email": "NEW@example.com", "password": "p", "username": "N"}]
+        )
+
+    assert result.inserted == 0
+    assert [(c.index, c.email, c.reason) for c in result.conflicts] == [
+        (0, "new@example.com", "already exists"),
+        (1, "taken@example.com", "already exists"),
+        (2, "NEW@example.com", "already exists"),
+    ]
+    nocase_engine.dispose()
+
+def test_iter_users_in_email_order(user_repo):
+    for i in (3, 1, 2):
+        user_repo.create_user(User(email=f"iter{i}@example.com", password="p", username="u"))
+
+    batches = list(user_repo.iter_users(batch_size=2))
+
+    emails = [u.email for batch in batches for u in batch]
+    assert all(len(batch) <= 2 for batch in batches)
+    assert emails == sorted(emails)
+    assert [e for e in emails if e.startswith("iter")] == ["iter1@example.com", "iter2@example.com", "iter3@example.com"]
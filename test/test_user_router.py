@@ -1,3 +1,4 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
@@ -149,4 +150,39 @@ def test_delete_user_not_found(mock_user_service):
     # 응답 검증
     assert response.status_code == 404
     data = response.json()
-    assert data["detail"] == USER_NOT_FOUND
\ No newline at end of file
+    assert data["detail"] == USER_NOT_FOUND
+
+
+# 테스트: 일괄 등록
+def test_bulk_register_users(mock_user_service):
+    from app.user.user_schema import BulkUserResult, UserConflict
+
+    mock_user_service.return_value.bulk_register.return_value = BulkUserResult(
+        received=2, inserted=1, conflicts=[UserConflict(index=1, email="test@example.com", reason="already exists")]
+    )
+
+    response = client.post("/api/user/bulk", json=[mock_user.model_dump(), mock_user.model_dump()])
+
+    assert response.status_code == 200
+    assert response.json()["data"]["conflicts"][0]["index"] == 1
+    assert response.json()["message"] == "1 of 2 users registered."
+
+
+# 테스트: 일괄 등록 요청이 목록이 아닌 경우
+def test_bulk_register_requires_list(mock_user_service):
+    response = client.post("/api/user/bulk", json=mock_user.model_dump())
+
+    assert response.status_code == 422
+
+
+# 테스트: 사용자 내보내기
+def test_export_users(mock_user_service):
+    from app.user.user_service import users_ndjson
+
+    mock_user_service.return_value.export_users.return_value = iter([users_ndjson([mock_user])])
+
+    response = client.get("/api/user/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert json.loads(response.text) == {"email": mock_user.email, "username": mock_user.username}
\ No newline at end of file
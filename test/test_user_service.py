@@ -1,4 +1,6 @@
+import json
 import pytest
+from app.user.password_hasher import PasswordHasher
 from app.user.user_service import UserService
 from app.user.user_schema import User, UserLogin, UserUpdate
 from unittest.mock import MagicMock, patch
@@ -10,17 +12,24 @@ def mock_user_repository():
 
 
 @pytest.fixture
-def user_service(mock_user_repository):
-    return UserService(mock_user_repository)
+def hasher():
+    # 테스트 속도를 위해 낮은 비용을 사용합니다.
+    return PasswordHasher(scrypt_n=2 ** 4)
+
+
+@pytest.fixture
+def user_service(mock_user_repository, hasher):
+    return UserService(mock_user_repository, hasher)
 
 
 @pytest.fixture
 def test_user():
     return User(email="test@example.com", password="password123", username="TestUser")
 
-def test_login_success(user_service, mock_user_repository, test_user):
+def test_login_success(user_service, mock_user_repository, test_user, hasher):
     """Test successful login."""
-    mock_user_repository.get_user_by_email.return_value = test_user
+    stored_user = test_user.model_copy(update={"password": hasher.hash("password123")})
+    mock_user_repository.get_user_by_email.return_value = stored_user
     user_login = UserLogin(email="test@example.com", password="password123")
     
     result = user_service.login(user_login)
@@ -28,6 +37,33 @@ def test_login_success(user_service, mock_user_repository, test_user):
     assert result.email == test_user.email
     assert result.username == test_user.username
     mock_user_repository.get_user_by_email.assert_called_once_with("test@example.com")
+    mock_user_repository.update_password.assert_not_called()
+
+
+def test_login_upgrades_plaintext_password(user_service, mock_user_repository, test_user, hasher):
+    """Test login with a legacy plaintext password stores a hash."""
+    mock_user_repository.get_user_by_email.return_value = test_user
+    mock_user_repository.update_password.side_effect = lambda email, password, username: test_user.model_copy(update={"password": password})
+
+    result = user_service.login(UserLogin(email="test@example.com", password="password123"))
+
+    email, stored = mock_user_repository.update_password.call_args.args
+    assert email == "test@example.com"
+    # 로그인한 사용자의 이름을 넘겨 저장소가 다시 조회하지 않게 합니다.
+    assert mock_user_repository.update_password.call_args.kwargs == {"username": test_user.username}
+    assert hasher.verify("password123", stored) and not hasher.needs_rehash(stored)
+    assert result.password == stored
+
+
+def test_login_rehashes_when_cost_changes(mock_user_repository, test_user, hasher):
+    """Test login rehashes a hash made with an old cost setting."""
+    old_hash = PasswordHasher(scrypt_n=2 ** 3).hash("password123")
+    mock_user_repository.get_user_by_email.return_value = test_user.model_copy(update={"password": old_hash})
+
+    UserService(mock_user_repository, hasher).login(UserLogin(email="test@example.com", password="password123"))
+
+    stored = mock_user_repository.update_password.call_args.args[1]
+    assert stored.startswith("scrypt$16$")
 
 
 def test_login_user_not_found(user_service, mock_user_repository):
@@ -48,22 +84,23 @@ def test_login_invalid_password(user_service, mock_user_repository, test_user):
         user_service.login(user_login)
 
 
-def test_register_user_success(user_service, mock_user_repository, test_user):
+def test_register_user_success(user_service, mock_user_repository, test_user, hasher):
     """Test successful user registration."""
-    mock_user_repository.get_user_by_email.return_value = None
-    mock_user_repository.save_user.return_value = test_user
+    mock_user_repository.create_user.return_value = test_user
     
     result = user_service.register_user(test_user)
     
     assert result.email == test_user.email
     assert result.username == test_user.username
-    mock_user_repository.get_user_by_email.assert_called_once_with(test_user.email)
-    mock_user_repository.save_user.assert_called_once_with(test_user)
+    saved_user = mock_user_repository.create_user.call_args.args[0]
+    assert saved_user.email == test_user.email
+    assert hasher.verify("password123", saved_user.password) and saved_user.password != "password123"
+    mock_user_repository.get_user_by_email.assert_not_called()
 
 
 def test_register_user_already_exists(user_service, mock_user_repository, test_user):
     """Test registration with existing user."""
-    mock_user_repository.get_user_by_email.return_value = test_user
+    mock_user_repository.create_user.return_value = None
     
     with pytest.raises(ValueError, match="User already Exists."):
         user_service.register_user(test_user)
@@ -89,23 +126,81 @@ def test_delete_user_not_found(user_service, mock_user_repository):
         user_service.delete_user("nonexistent@example.com")
 
 
-def test_update_password_success(user_service, mock_user_repository, test_user):
+def test_update_password_success(user_service, mock_user_repository, test_user, hasher):
     """Test successful password update."""
-    mock_user_repository.get_user_by_email.return_value = test_user
-    mock_user_repository.save_user.return_value = test_user
+    mock_user_repository.update_password.return_value = User(
+        email=test_user.email, password="newpassword123", username=test_user.username
+    )
     
     user_update = UserUpdate(email="test@example.com", new_password="newpassword123")
     result = user_service.update_user_pwd(user_update)
     
-    assert result.password == "newpassword123"
-    mock_user_repository.get_user_by_email.assert_called_once_with("test@example.com")
-    mock_user_repository.save_user.assert_called_once()
+    assert result.username == test_user.username
+    email, stored = mock_user_repository.update_password.call_args.args
+    assert email == "test@example.com"
+    assert hasher.verify("newpassword123", stored)
+    mock_user_repository.get_user_by_email.assert_not_called()
 
 
 def test_update_password_user_not_found(user_service, mock_user_repository):
     """Test password update for non-existent user."""
-    mock_user_repository.get_user_by_email.return_value = None
+    mock_user_repository.update_password.return_value = None
     user_update = UserUpdate(email="nonexistent@example.com", new_password="newpassword123")
     
     with pytest.raises(ValueError, match="User not Found."):
         user_service.update_user_pwd(user_update)
+
+
+def test_bulk_register_reports_conflicts(user_service, mock_user_repository, hasher):
+    """Test bulk registration with invalid, repeated and existing rows."""
+    mock_user_repository.bulk_create_users.return_value = {"taken@example.com"}
+    rows = [
+        {"email": "a@example.com", "password": "p", "username": "a"},
+        {"email": "not-an-email", "password": "p", "username": "b"},
+        {"email": "taken@example.com", "password": hasher.hash("exported"), "username": "c"},
+        {"email": "a@example.com", "password": "p", "username": "d"},
+        {"email": "e@example.com", "password": "p"},
+    ]
+
+    result = user_service.bulk_register(rows, chunk_size=100)
+
+    assert result.received == 5
+    assert result.inserted == 1
+    assert [(c.index, c.reason.split(":")[0]) for c in result.conflicts] == [
+        (1, "invalid"),
+        (2, "already exists"),
+        (3, "duplicate in request"),
+        (4, "invalid"),
+    ]
+    users, chunk_size = mock_user_repository.bulk_create_users.call_args.args
+    assert [u.email for u in users] == ["a@example.com", "taken@example.com"]
+    assert hasher.verify("p", users[0].password)
+    # 해시처럼 보이는 비밀번호도 그대로 저장하지 않고 다시 해시합니다.
+    assert hasher.verify(rows[2]["password"], users[1].password)
+    assert chunk_size == 100
+
+
+def test_bulk_register_keeps_hashes_only_when_asked(user_service, mock_user_repository, hasher):
+    """Test that already hashed passwords are stored as-is only with keep_hashed."""
+    mock_user_repository.bulk_create_users.return_value = set()
+    rows = [
+        {"email": "a@example.com", "password": "p", "username": "a"},
+        {"email": "b@example.com", "password": hasher.hash("exported"), "username": "b"},
+    ]
+
+    user_service.bulk_register(rows, keep_hashed=True)
+
+    users, _ = mock_user_repository.bulk_create_users.call_args.args
+    assert hasher.verify("p", users[0].password)
+    assert users[1].password == rows[1]["password"]
+
+
+def test_export_users_ndjson(user_service, mock_user_repository, test_user):
+    """Test NDJSON export in batches."""
+    mock_user_repository.iter_users.return_value = iter([[test_user, test_user], [test_user]])
+
+    chunks = list(user_service.export_users(batch_size=2))
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"email": test_user.email, "username": test_user.username}] * 3
\ No newline at end of file